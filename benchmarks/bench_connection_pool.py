@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request latency of SimplificationAPI with and without connection reuse.
+Runs against a local stub server, so no network access is needed.
+
+Usage: python benchmarks/bench_connection_pool.py [--requests 500]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.page_objects.api.simplification_api import SimplificationAPI
+from support.mocks.newton_stub_server import NewtonStubServer
+
+EXPRESSION = "x^2 + 2x + 1"
+
+
+def run(base_url, num_requests, keep_alive):
+    """
+    Send num_requests simplifications and return the mean latency in milliseconds.
+    """
+    with SimplificationAPI(base_url=base_url, keep_alive=keep_alive) as api:
+        # Warm up so both modes start from the same state
+        api.simplify_custom_expression(EXPRESSION)
+
+        start = time.perf_counter()
+        for _ in range(num_requests):
+            api.simplify_custom_expression(EXPRESSION)
+        elapsed = time.perf_counter() - start
+
+    return elapsed / num_requests * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=500, help="requests per mode (default: 500)")
+    args = parser.parse_args()
+
+    # Per-request INFO logs would dominate the measurement
+    logging.getLogger('support').setLevel(logging.WARNING)
+
+    with NewtonStubServer() as server:
+        fresh_ms = run(server.base_url, args.requests, keep_alive=False)
+        pooled_ms = run(server.base_url, args.requests, keep_alive=True)
+
+    print(f"{'mode':<28}{'ms/request':>12}{'requests/s':>14}")
+    print(f"{'new connection per request':<28}{fresh_ms:>12.3f}{1000 / fresh_ms:>14.1f}")
+    print(f"{'pooled keep-alive':<28}{pooled_ms:>12.3f}{1000 / pooled_ms:>14.1f}")
+    print(f"speedup: {fresh_ms / pooled_ms:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmark expression generation throughput: generate_expression in a loop vs generate_batch.
+
+Usage: python benchmarks/bench_expression_generation.py [--count 200000] [--num-terms 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.helpers.data_generator import ArithmeticExpressionGenerator
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000, help="expressions per path (default: 200000)")
+    parser.add_argument('--num-terms', type=int, default=3, help="terms per expression (default: 3)")
+    args = parser.parse_args()
+
+    generator = ArithmeticExpressionGenerator()
+    loop_s = measure(lambda: [generator.generate_expression(args.num_terms) for _ in range(args.count)])
+    batch_s = measure(lambda: generator.generate_batch(args.count, args.num_terms))
+
+    print(f"{'path':<24}{'seconds':>10}{'expressions/s':>16}")
+    print(f"{'generate_expression':<24}{loop_s:>10.3f}{args.count / loop_s:>16,.0f}")
+    print(f"{'generate_batch':<24}{batch_s:>10.3f}{args.count / batch_s:>16,.0f}")
+    print(f"speedup: {loop_s / batch_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Measure cold import time of the client modules and fail on regressions.
+
+Each target is imported in a fresh interpreter under `python -X importtime`; the
+cumulative time of the target module is taken as the best of several runs. Bytecode
+is written on a warm-up run so the numbers do not include compilation. A target
+regresses if it exceeds its budget or imports a module that must stay lazy
+(requests, numpy).
+
+Usage: python benchmarks/bench_import_time.py [--runs 7] [--scale 1.0]
+Exit status is 1 if any target regressed.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module -> budget in milliseconds (cumulative import time on a developer laptop)
+BUDGETS = {
+    'support.helpers.api_helper': 5,
+    'support.helpers.data_generator': 10,
+    'support.page_objects.api.simplification_api': 25,
+    'main': 35,
+}
+
+# Modules that must only be imported on first use
+LAZY_MODULES = ('requests', 'numpy')
+
+
+def import_profile(module):
+    """
+    Import module in a fresh interpreter and return ({module: cumulative_us}, loaded).
+
+    `loaded` is the set of LAZY_MODULES that ended up in sys.modules.
+    """
+    check = (f"import sys, {module}; "
+             f"print(','.join(name for name in {LAZY_MODULES!r} "
+             f"if name in sys.modules))")
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check], cwd=PROJECT_ROOT,
+                            env=env, capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        cumulative[name.strip()] = int(cumulative_us)
+    loaded = set(filter(None, result.stdout.strip().split(',')))
+    return cumulative, loaded
+
+
+def measure(module, runs):
+    """
+    Return (best cumulative milliseconds, eagerly loaded lazy modules) over runs.
+    """
+    import_profile(module)  # warm-up: write bytecode
+    best, loaded = None, set()
+    for _ in range(runs):
+        cumulative, eager = import_profile(module)
+        milliseconds = cumulative[module] / 1000
+        best = milliseconds if best is None else min(best, milliseconds)
+        loaded |= eager
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7, help="fresh interpreters per target (default: 7)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="multiply every budget, e.g. 2 on slow CI machines (default: 1.0)")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'module':<48}{'ms':>8}{'budget':>8}  status")
+    for module, budget in BUDGETS.items():
+        milliseconds, loaded = measure(module, args.runs)
+        limit = budget * args.scale
+        problems = []
+        if milliseconds > limit:
+            problems.append("over budget")
+        if loaded:
+            problems.append(f"imports {', '.join(sorted(loaded))}")
+        failures += bool(problems)
+        status = '; '.join(problems) or 'ok'
+        print(f"{module:<48}{milliseconds:>8.1f}{limit:>8.1f}  {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
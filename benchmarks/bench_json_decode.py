@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of decoding simplify responses, per 100k responses.
+
+Bodies are built like the Newton API's from generated expressions. Compared paths:
+  response.json()   what the client did before decoders were pluggable (charset
+                    detection, bytes -> str, stdlib json)
+  <library>.loads   every installed decoder on the body bytes (json, orjson, ujson)
+  raw               RawJSON passthrough: no decode at all
+For bulk jobs that forward whole responses to a JSONL file, the decode + re-encode
+round trip is compared with splicing the raw body into the output line, per library.
+
+Usage: python benchmarks/bench_json_decode.py [--responses 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import requests
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.commands.bulk_simplify import encode_record
+from support.helpers.data_generator import ExpressionStream
+from support.helpers.json_codec import available_decoders, get_decoder, get_encoder
+from support.mocks.newton_stub_server import NewtonStubServer
+
+
+def make_bodies(count):
+    """
+    Build count distinct response bodies, serialized the way the stub server does.
+    """
+    stub = NewtonStubServer()
+    bodies = []
+    for expression in ExpressionStream(seed=1):
+        bodies.append(json.dumps(stub.respond(expression)).encode('utf-8'))
+        if len(bodies) == count:
+            return bodies
+
+
+def make_responses(bodies):
+    responses = []
+    for body in bodies:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        response._content = body
+        responses.append(response)
+    return responses
+
+
+def timed(function, items):
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    return time.perf_counter() - start
+
+
+def forward(decoder, encoder, body):
+    """
+    Forward a whole response into an output line the way bulk_simplify --raw writes it.
+    """
+    return encode_record({'line': 1, 'expression': "x", 'response': decoder(body)}, encoder)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--responses', type=int, default=100000, help="responses to decode (default: 100000)")
+    args = parser.parse_args()
+
+    bodies = make_bodies(args.responses)
+    responses = make_responses(bodies)
+    scale = 100000 / args.responses
+    print(f"{len(bodies)} responses, mean body {sum(map(len, bodies)) / len(bodies):.0f} bytes")
+
+    print(f"\n{'decode':<20}{'s / 100k':>10}{'us / response':>15}")
+    results = {'response.json()': timed(requests.Response.json, responses)}
+    for name in available_decoders():
+        results[f"{name}.loads" if name != 'raw' else name] = timed(get_decoder(name), bodies)
+    for name, seconds in results.items():
+        print(f"{name:<20}{seconds * scale:>10.3f}{seconds / len(bodies) * 1e6:>15.2f}")
+
+    print(f"\n{'forward to JSONL':<22}{'s / 100k':>10}{'us / response':>15}")
+    libraries = [name for name in available_decoders() if name != 'raw']
+    for library in libraries:
+        encoder = get_encoder(library)
+        for name in (library, 'raw'):
+            decoder = get_decoder(name)
+            seconds = timed(lambda body: forward(decoder, encoder, body), bodies)
+            label = f"{library}{' (raw)' if name == 'raw' else ''}"
+            print(f"{label:<22}{seconds * scale:>10.3f}{seconds / len(bodies) * 1e6:>15.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
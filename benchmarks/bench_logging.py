@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request cost of logging in SimplificationAPI.
+
+Requests go through an in-process adapter (no sockets), so the time measured is the
+client itself. Compared modes, all writing to a log file in a temp directory:
+  off       WARNING and above only (no per-request records)
+  sync      every INFO record formatted and written on the calling thread
+            (what the import-time basicConfig used to give every caller)
+  hot-path  HotPathLogging: sampled, unformatted records written by a background thread
+
+Usage: python benchmarks/bench_logging.py [--requests 20000] [--sample-every 100]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.helpers.logging_config import HotPathLogging, LOG_FORMAT
+from support.mocks.echo_adapter import EchoAdapter
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+def run(count):
+    with SimplificationAPI(transport=EchoAdapter()) as api:
+        start = time.perf_counter()
+        for i in range(count):
+            api.simplify_custom_expression(f"{i}x + {i}")
+        return time.perf_counter() - start
+
+
+def file_handler(path):
+    handler = logging.FileHandler(path, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=20000, help="requests per mode (default: 20000)")
+    parser.add_argument('--sample-every', type=int, default=100, help="hot-path sampling (default: 100)")
+    args = parser.parse_args()
+
+    logger = logging.getLogger('support')
+    logger.propagate = False
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        logger.setLevel(logging.WARNING)
+        results['off'] = run(args.requests)
+
+        handler = file_handler(os.path.join(directory, 'sync.log'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        results['sync'] = run(args.requests)
+        logger.removeHandler(handler)
+        handler.close()
+
+        handler = file_handler(os.path.join(directory, 'hot_path.log'))
+        with HotPathLogging(sample_every=args.sample_every, handlers=[handler]):
+            results['hot-path'] = run(args.requests)
+        handler.close()
+
+    baseline = results['off'] / args.requests * 1e6
+    print(f"{'mode':<12}{'us/request':>12}{'logging overhead us':>22}")
+    for mode, seconds in results.items():
+        per_request = seconds / args.requests * 1e6
+        print(f"{mode:<12}{per_request:>12.1f}{per_request - baseline:>22.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare the memory held by simplification results as nested dicts and as compact
+SimplifyResult objects.
+
+Responses are decoded from JSON bodies the way the client receives them, so each dict
+result owns its own key, operation and echoed expression strings. Memory is measured
+with tracemalloc while all results are alive.
+
+Usage: python benchmarks/bench_result_memory.py [--results 200000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.helpers.compact_result import SimplifyResult
+from support.helpers.data_generator import ExpressionStream
+from support.helpers.local_simplifier import LocalSimplifier
+
+
+def make_bodies(count):
+    """
+    Build (expression, JSON body) pairs like the Newton API's simplify responses.
+    """
+    engine = LocalSimplifier()
+    pairs = []
+    for expression in ExpressionStream(seed=1):
+        result = engine.simplify_to_string(expression) or expression
+        body = json.dumps({'operation': 'simplify', 'expression': expression, 'result': result}).encode()
+        pairs.append((expression, body))
+        if len(pairs) == count:
+            return pairs
+
+
+def measure(build, pairs):
+    """
+    Return bytes allocated per result by build(expression, response) for every pair.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [build(expression, json.loads(body)) for expression, body in pairs]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The list itself is the same for both representations
+    used -= sys.getsizeof(results)
+    return used / len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--results', type=int, default=200000, help="results to hold (default: 200000)")
+    args = parser.parse_args()
+
+    pairs = make_bodies(args.results)
+    representations = {
+        'dict': lambda expression, response: {'original_expression': expression, 'response': response},
+        'SimplifyResult': SimplifyResult.from_response,
+    }
+
+    baseline = None
+    print(f"{'representation':<18}{'bytes/result':>14}{'MB per 1M':>12}{'vs dict':>10}")
+    for name, build in representations.items():
+        per_result = measure(build, pairs)
+        baseline = baseline or per_result
+        print(f"{name:<18}{per_result:>14.0f}{per_result * 1e6 / 2**20:>12.0f}{per_result / baseline:>10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
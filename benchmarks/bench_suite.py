@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Run the client benchmark suite and write the results as JSON.
+
+Micro benchmarks, timed in-process as the best of --repeat runs of a loop calibrated
+to take at least --min-time seconds:
+  generate_expression      ArithmeticExpressionGenerator.generate_expression()
+  build_url                ApiHelper.build_url for the simplify route
+  build_url_params         ApiHelper.build_url with query parameters
+  build_headers            ApiHelper.build_headers with a bearer token
+  simplify_call            SimplificationAPI.simplify_custom_expression through an
+                           in-process transport (EchoAdapter): the client's own cost
+Macro benchmarks, against a local NewtonStubServer over loopback:
+  stub_sequential          one request at a time on a pooled keep-alive connection
+  stub_batch               simplify_batch of distinct expressions with --workers threads
+
+Results are written as JSON (to --output, default stdout) together with environment
+metadata: Python, platform, CPU count, git commit and dependency versions. With
+--compare PREVIOUS.json the change against an earlier run is printed to stderr.
+
+Usage: python benchmarks/bench_suite.py [-o results.json] [--only build_url,simplify_call]
+                                        [--compare baseline.json]
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from importlib import metadata
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add the project root to Python path
+sys.path.insert(0, PROJECT_ROOT)
+
+from support.helpers.api_helper import ApiHelper
+from support.helpers.data_generator import ArithmeticExpressionGenerator, ExpressionStream
+from support.mocks.echo_adapter import EchoAdapter
+from support.mocks.newton_stub_server import NewtonStubServer
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+SCHEMA_VERSION = 1
+
+# Distributions whose versions can change the results
+PACKAGES = ('requests', 'urllib3', 'numpy', 'orjson', 'ujson')
+
+# name -> generator function yielding the callable to time (set-up before, tear-down after)
+MICRO_BENCHMARKS = {}
+
+# name -> function(args) returning the benchmark's result fields
+MACRO_BENCHMARKS = {}
+
+
+def micro(name):
+    def register(function):
+        MICRO_BENCHMARKS[name] = contextmanager(function)
+        return function
+    return register
+
+
+def macro(name):
+    def register(function):
+        MACRO_BENCHMARKS[name] = function
+        return function
+    return register
+
+
+@micro('generate_expression')
+def generate_expression():
+    yield ArithmeticExpressionGenerator(seed=1).generate_expression
+
+
+@micro('build_url')
+def build_url():
+    helper = ApiHelper()
+    yield lambda: helper.build_url("simplify/x%5E2%20%2B%202x%20%2B%201")
+
+
+@micro('build_url_params')
+def build_url_params():
+    helper = ApiHelper()
+    yield lambda: helper.build_url("simplify", {'expression': "x^2 + 2x + 1", 'page': 2})
+
+
+@micro('build_headers')
+def build_headers():
+    helper = ApiHelper()
+    yield lambda: helper.build_headers(token="benchmark-token")
+
+
+@micro('simplify_call')
+def simplify_call():
+    with SimplificationAPI(transport=EchoAdapter()) as api:
+        yield lambda: api.simplify_custom_expression("x^2 + 2x + 1")
+
+
+@macro('stub_sequential')
+def stub_sequential(args):
+    expressions = ExpressionStream(seed=1).take(args.requests)
+    latencies = []
+    with NewtonStubServer() as server, SimplificationAPI(base_url=server.base_url) as api:
+        # Open the pooled connection before timing
+        api.simplify_custom_expression("x")
+        started = time.perf_counter()
+        for expression in expressions:
+            request_started = time.perf_counter()
+            api.simplify_custom_expression(expression)
+            latencies.append(time.perf_counter() - request_started)
+        seconds = time.perf_counter() - started
+    return {'unit': 'requests/s', 'requests': len(expressions), 'seconds': seconds,
+            'requests_per_second': len(expressions) / seconds, 'latency_ms': latency_summary(latencies)}
+
+
+@macro('stub_batch')
+def stub_batch(args):
+    expressions = ExpressionStream(seed=2).take(args.requests)
+    with NewtonStubServer() as server, SimplificationAPI(base_url=server.base_url,
+                                                         pool_size=args.workers) as api:
+        api.simplify_batch(["x"] * args.workers, max_workers=args.workers)
+        started = time.perf_counter()
+        results = api.simplify_batch(expressions, max_workers=args.workers)
+        seconds = time.perf_counter() - started
+    errors = sum(1 for result in results if 'error' in result)
+    return {'unit': 'requests/s', 'requests': len(expressions), 'workers': args.workers, 'errors': errors,
+            'seconds': seconds, 'requests_per_second': len(expressions) / seconds}
+
+
+def latency_summary(latencies):
+    """
+    Return p50/p90/p99/max of latencies (seconds) in milliseconds.
+    """
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {'p50': percentiles[49] * 1000, 'p90': percentiles[89] * 1000,
+            'p99': percentiles[98] * 1000, 'max': max(latencies) * 1000}
+
+
+def time_loop(function, loops):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            function()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def run_micro(name, min_time, repeat):
+    """
+    Time a micro benchmark and return its result fields, per-call times in nanoseconds.
+    """
+    with MICRO_BENCHMARKS[name]() as function:
+        # Double the loop count until one run takes min_time; that run also warms up
+        loops = 1
+        while time_loop(function, loops) < min_time:
+            loops *= 2
+        runs = [time_loop(function, loops) / loops * 1e9 for _ in range(repeat)]
+    return {'unit': 'ns/call', 'loops': loops, 'runs': runs, 'min': min(runs),
+            'median': statistics.median(runs), 'mean': statistics.fmean(runs),
+            'stdev': statistics.stdev(runs) if len(runs) > 1 else 0.0, 'calls_per_second': 1e9 / min(runs)}
+
+
+def git_revision():
+    """
+    Return (commit, dirty) of the project checkout, or (None, None) outside a git work tree.
+    """
+    def git(*command):
+        return subprocess.run(['git', *command], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    try:
+        return git('rev-parse', 'HEAD'), bool(git('status', '--porcelain', '--untracked-files=no'))
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def environment():
+    """
+    Describe the interpreter, machine and code the benchmarks ran on.
+    """
+    commit, dirty = git_revision()
+    packages = {}
+    for name in PACKAGES:
+        try:
+            packages[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            packages[name] = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'compiler': platform.python_compiler(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor() or None,
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+        'git_dirty': dirty,
+        'packages': packages,
+    }
+
+
+def headline(result):
+    """
+    The number compared across runs: median ns/call (lower is better) or requests/s (higher is better).
+    """
+    if result['kind'] == 'micro':
+        return result['median'], False
+    return result['requests_per_second'], True
+
+
+def compare(results, baseline, stream):
+    previous = {result['name']: result for result in baseline['benchmarks']}
+    for key in ('python', 'machine', 'cpu_count'):
+        if baseline['environment'].get(key) != results['environment'][key]:
+            stream.write(f"note: {key} differs from the baseline "
+                         f"({baseline['environment'].get(key)} -> {results['environment'][key]})\n")
+    stream.write(f"{'benchmark':<22}{'baseline':>14}{'current':>14}{'change':>10}\n")
+    for result in results['benchmarks']:
+        if result['name'] not in previous:
+            continue
+        old, higher_is_better = headline(previous[result['name']])
+        new, _ = headline(result)
+        change = (new - old) / old * 100
+        verdict = 'faster' if (change > 0) == higher_is_better else 'slower'
+        stream.write(f"{result['name']:<22}{old:>14,.1f}{new:>14,.1f}{change:>+9.1f}% {verdict} "
+                     f"({result['unit']})\n")
+
+
+def parse_args(argv=None):
+    names = list(MICRO_BENCHMARKS) + list(MACRO_BENCHMARKS)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-o', '--output', default='-', help="JSON result file (default: stdout)")
+    parser.add_argument('--only', help=f"comma-separated benchmarks to run (default: all of {', '.join(names)})")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="minimum seconds per micro benchmark run (default: 0.2)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per micro benchmark (default: 5)")
+    parser.add_argument('--requests', type=int, default=2000,
+                        help="requests per macro benchmark (default: 2000)")
+    parser.add_argument('--workers', type=int, default=10, help="threads for stub_batch (default: 10)")
+    parser.add_argument('--compare', help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+    args.names = args.only.split(',') if args.only else names
+    unknown = [name for name in args.names if name not in names]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    if args.repeat <= 0 or args.requests < 2 or args.workers <= 0 or args.min_time <= 0:
+        parser.error("--repeat, --workers and --min-time must be positive and --requests at least 2")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Per-request INFO logs would dominate the measurement
+    logging.getLogger('support').setLevel(logging.WARNING)
+
+    results = {
+        'schema_version': SCHEMA_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'settings': {'min_time': args.min_time, 'repeat': args.repeat, 'requests': args.requests,
+                     'workers': args.workers},
+        'benchmarks': [],
+    }
+    for name in args.names:
+        print(f"running {name}...", file=sys.stderr)
+        if name in MICRO_BENCHMARKS:
+            fields = {'kind': 'micro', **run_micro(name, args.min_time, args.repeat)}
+        else:
+            fields = {'kind': 'macro', **MACRO_BENCHMARKS[name](args)}
+        results['benchmarks'].append({'name': name, **fields})
+
+    text = json.dumps(results, indent=2) + "\n"
+    if args.output == '-':
+        sys.stdout.write(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as out:
+            out.write(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            compare(results, json.load(handle), sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
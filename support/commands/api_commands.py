@@ -0,0 +1,83 @@
+"""
+Module-level shortcuts for one-off calls to JSON APIs.
+
+Every call goes through one shared RestClient, so repeated calls reuse its pooled
+connections, retry policy, circuit breaker and metrics. By default that is a plain
+RestClient created on first use; set_client() installs another one, typically the
+client of a configured SimplificationAPI so the shortcuts share its setup.
+
+As before, base_url is a prefix the endpoint is appended to (f"{base_url}{endpoint}",
+no API version added). Without base_url the endpoint is relative to the client's
+versioned base URL.
+
+Example:
+    from support.commands.api_commands import api_get, set_client
+    set_client(api.rest_client)
+    api_get('simplify/x + x')
+    api_get('health', base_url="http://localhost:8080/")
+"""
+
+import atexit
+import threading
+from support.constants.http_methods import HttpMethod
+from support.page_objects.api.rest_client import RestClient
+
+_client = None
+_owns_client = False
+_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the shared RestClient, creating a default one on first use.
+    """
+    global _client, _owns_client
+    with _lock:
+        if _client is None:
+            _client, _owns_client = RestClient(), True
+        return _client
+
+
+def set_client(client):
+    """
+    Send all shortcut calls through client (e.g. SimplificationAPI.rest_client).
+    A default client created earlier is closed; an installed one is left to its owner.
+    """
+    global _client, _owns_client
+    with _lock:
+        previous, owned = _client, _owns_client
+        _client, _owns_client = client, False
+    if owned and previous is not client:
+        previous.close()
+
+
+@atexit.register
+def close_client():
+    """
+    Close the default client, if one was created, and forget the shared client.
+    """
+    global _client, _owns_client
+    with _lock:
+        client, owned = _client, _owns_client
+        _client, _owns_client = None, False
+    if owned:
+        client.close()
+
+
+def api_request(method, endpoint, base_url=None, body=None, headers=None, params=None):
+    if base_url is not None:
+        # An absolute URL is used as-is by the client's URL building
+        endpoint = f"{base_url}{endpoint}"
+    return get_client().request(HttpMethod(method), endpoint, params=params, body=body, headers=headers)
+
+
+def api_get(endpoint, base_url=None, headers=None, params=None):
+    return api_request(HttpMethod.GET, endpoint, base_url, headers=headers, params=params)
+
+
+def api_post(endpoint, body, base_url=None, headers=None):
+    return api_request(HttpMethod.POST, endpoint, base_url, body=body, headers=headers)
+
+
+def api_delete(endpoint, base_url=None, headers=None):
+    return api_request(HttpMethod.DELETE, endpoint, base_url, headers=headers)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Simplify expressions in bulk from a file or stdin and write one JSON result per line.
+
+Input is one expression per line, or JSONL objects (detected per line) whose --field
+holds the expression. Input is read lazily and at most 2 * --workers expressions are
+in flight, so memory stays flat however large the input is. Results are written in
+input order as they complete:
+
+    {"line":3,"expression":"2x + 4","result":"2 (x + 2)"}
+    {"line":4,"expression":"x +","error":"HTTP error 400: ..."}
+
+With --raw each whole API response is written under "response" instead of its result:
+
+    {"line":3,"expression":"2x + 4","response":{"operation":"simplify",...}}
+
+On the stdlib json fallback the bodies are copied as received (after a structural
+check), skipping the slow decode and re-encode. With orjson or ujson installed,
+decoding and re-encoding is as fast as copying (see benchmarks/bench_json_decode.py),
+so responses are decoded as usual.
+
+With --store every request's expression, result, HTTP status and latency is also
+appended to a columnar result store (support/helpers/result_store.py) for analysis.
+
+Progress (throughput and, for regular files, ETA) is printed to stderr. The exit status
+is the number of failed lines, capped at 125.
+
+Usage:
+    python -m support.commands.bulk_simplify expressions.txt > results.jsonl
+    cat expressions.jsonl | python -m support.commands.bulk_simplify --field expr --id-field id --workers 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import stat
+import sys
+import time
+from collections import deque
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from support.page_objects.api.simplification_api import SimplificationAPI
+from support.helpers.json_codec import AUTO_DECODERS, RawJSON, available_decoders, get_decoder, get_encoder
+from support.helpers.metrics import ClientMetrics
+from support.helpers.result_store import ResultStoreWriter
+from support.constants.api_constants import ApiConstants
+
+logger = logging.getLogger(__name__)
+
+# Exit statuses above 125 have special meaning to shells
+MAX_EXIT_STATUS = 125
+
+_encode_json = get_encoder('json')
+
+
+class InputLine:
+    """
+    One input line: where it ends in the input, and its expression or why it has none.
+    """
+
+    __slots__ = ('number', 'offset', 'expression', 'id', 'error')
+
+    def __init__(self, number, offset, expression=None, id=None, error=None):
+        self.number = number
+        self.offset = offset
+        self.expression = expression
+        self.id = id
+        self.error = error
+
+
+def parse_line(raw, number, offset, field='expression', id_field=None, loads=json.loads):
+    """
+    Parse one input line; JSON objects are detected by a leading '{'.
+
+    Returns:
+        InputLine or None for blank lines
+    """
+    text = raw.decode('utf-8', errors='replace').strip()
+    if not text:
+        return None
+    if not text.startswith('{'):
+        return InputLine(number, offset, expression=text)
+
+    try:
+        record = loads(text)
+    except ValueError as e:
+        return InputLine(number, offset, error=f"Invalid JSON: {e}")
+    item_id = record.get(id_field) if id_field else None
+    expression = record.get(field)
+    if not isinstance(expression, str) or not expression.strip():
+        return InputLine(number, offset, id=item_id, error=f"Missing or empty field '{field}'")
+    return InputLine(number, offset, expression=expression.strip(), id=item_id)
+
+
+def read_lines(handle, field='expression', id_field=None, loads=json.loads):
+    """
+    Yield an InputLine per non-blank line of a binary file handle.
+    """
+    offset = 0
+    for number, raw in enumerate(handle, start=1):
+        offset += len(raw)
+        line = parse_line(raw, number, offset, field, id_field, loads)
+        if line is not None:
+            yield line
+
+
+def output_record(line, result=None, forward=False):
+    """
+    Build the JSON-serializable output for an input line and its result; with forward,
+    the whole response is included instead of its result.
+    """
+    record = {'line': line.number}
+    if line.id is not None:
+        record['id'] = line.id
+    if line.expression is not None:
+        record['expression'] = line.expression
+    if line.error is not None:
+        record['error'] = line.error
+    elif 'error' in result:
+        record['error'] = str(result['error'])
+    elif forward or isinstance(result['response'], RawJSON):
+        # A RawJSON response is spliced into the output line by encode_record
+        record['response'] = result['response']
+    else:
+        record['result'] = result['response'].get('result')
+    return record
+
+
+def encode_record(record, encode=_encode_json):
+    """
+    Encode an output record as a JSON line with encode (see json_codec.get_encoder).
+    A RawJSON 'response' is spliced in as received instead of being decoded and re-encoded.
+    """
+    raw = record.get('response')
+    if not isinstance(raw, RawJSON):
+        return encode(record) + b'\n'
+    del record['response']
+    return b''.join((encode(record)[:-1], b',"response":', raw.compact(), b'}\n'))
+
+
+class Progress:
+    """
+    Throttled throughput/ETA reporting on a text stream.
+
+    ETA is estimated from the input bytes processed so far, so it needs the total input
+    size and is omitted for pipes.
+    """
+
+    def __init__(self, stream, total_bytes=None, interval=1.0, clock=time.monotonic):
+        self.stream = stream
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self._clock = clock
+        self._interactive = stream.isatty() if hasattr(stream, 'isatty') else False
+        self.started = clock()
+        self._last = self.started
+        self._reported = None
+        self.done = 0
+        self.errors = 0
+        self.bytes_done = 0
+
+    def update(self, failed, offset):
+        """
+        Count a written line; returns True if a progress line was printed.
+        """
+        self.done += 1
+        self.errors += failed
+        self.bytes_done = offset
+        if self._clock() - self._last < self.interval:
+            return False
+        self.report()
+        return True
+
+    def line(self):
+        elapsed = self._clock() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        text = f"{self.done} done ({self.errors} errors), {rate:.1f}/s"
+        if self.total_bytes and self.bytes_done:
+            fraction = min(self.bytes_done / self.total_bytes, 1.0)
+            remaining = elapsed * (1 - fraction) / fraction
+            text += f", {fraction:.0%}, ETA {format_duration(remaining)}"
+        return text
+
+    def report(self, final=False):
+        if final and self._reported == self.done and not self._interactive:
+            return
+        self._last = self._clock()
+        self._reported = self.done
+        end = '\n' if final or not self._interactive else ''
+        prefix = '\r' if self._interactive else ''
+        self.stream.write(f"{prefix}{self.line()}{end}")
+        self.stream.flush()
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+def simplify_lines(api, lines, out, workers=ApiConstants.BATCH_MAX_WORKERS, progress=None, encode=_encode_json,
+                   forward=False):
+    """
+    Simplify the expressions of lines through api and write a JSON line per input line
+    to the binary stream out; with forward, whole responses are written (see output_record).
+
+    Lines that could not be parsed are written in order without being sent.
+
+    Returns:
+        tuple: (lines written, lines failed)
+    """
+    # Input lines consumed by the batch but not written yet, in input order
+    pending = deque()
+    written = failed = 0
+
+    def expressions():
+        for line in lines:
+            pending.append(line)
+            if line.error is None:
+                yield line.expression
+
+    def write(line, result=None):
+        nonlocal written, failed
+        record = output_record(line, result, forward)
+        error = 'error' in record
+        out.write(encode_record(record, encode))
+        written += 1
+        failed += error
+        # Flush with every progress line so the output keeps up with what is reported
+        if progress is not None and progress.update(error, line.offset):
+            out.flush()
+
+    def write_unparsed():
+        while pending and pending[0].error is not None:
+            write(pending.popleft())
+
+    for result in api.simplify_stream(expressions(), workers):
+        write_unparsed()
+        write(pending.popleft(), result)
+    write_unparsed()
+    out.flush()
+    return written, failed
+
+
+def input_size(handle):
+    """
+    Size of a regular file in bytes, or None for pipes and terminals.
+    """
+    try:
+        status = os.fstat(handle.fileno())
+    except (OSError, ValueError, AttributeError):
+        return None
+    return status.st_size if stat.S_ISREG(status.st_mode) else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simplify expressions from a file or stdin into JSONL results.")
+    parser.add_argument('input', nargs='?', default='-', help="input file, one expression or JSON object "
+                                                              "per line (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="output JSONL file (default: stdout)")
+    parser.add_argument('--workers', type=int, default=ApiConstants.BATCH_MAX_WORKERS,
+                        help=f"concurrent requests (default: {ApiConstants.BATCH_MAX_WORKERS})")
+    parser.add_argument('--field', default='expression', help="JSONL field holding the expression "
+                                                              "(default: expression)")
+    parser.add_argument('--id-field', help="JSONL field copied to the output as 'id'")
+    parser.add_argument('--base-url', help="override the API base URL, e.g. a local stub server")
+    parser.add_argument('--json-library', default='auto', choices=['auto'] + list(AUTO_DECODERS),
+                        help="JSON library for decoding responses and encoding output "
+                             "(default: auto, the fastest installed)")
+    parser.add_argument('--raw', action='store_true',
+                        help="write each whole API response under 'response' instead of its 'result'; "
+                             "copied without decoding when only the stdlib json library is available")
+    parser.add_argument('--store', help="also append expression, result, status and latency of every "
+                                        "request to this columnar result store")
+    parser.add_argument('--progress-interval', type=float, default=1.0,
+                        help="seconds between progress lines on stderr (default: 1)")
+    parser.add_argument('--quiet', action='store_true', help="do not print progress")
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        parser.error("--workers must be greater than 0")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Per-request INFO logs would interleave with progress on stderr
+    logging.getLogger('support').setLevel(logging.WARNING)
+
+    source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    out = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    progress = None if args.quiet else Progress(sys.stderr, input_size(source), args.progress_interval)
+    store = metrics = None
+    if args.store:
+        store = ResultStoreWriter(args.store)
+        metrics = ClientMetrics()
+        metrics.add_hook(store.observe)
+    try:
+        # Copying raw bodies only beats decoding and re-encoding with the stdlib json library
+        library = available_decoders()[0] if args.json_library == 'auto' else args.json_library
+        decoder = 'raw' if args.raw and library == 'json' else library
+        with SimplificationAPI(base_url=args.base_url, pool_size=max(args.workers, ApiConstants.POOL_SIZE),
+                               decoder=decoder, metrics=metrics) as api:
+            lines = read_lines(source, args.field, args.id_field, get_decoder(library))
+            _, failed = simplify_lines(api, lines, out, args.workers, progress, get_encoder(library),
+                                       forward=args.raw)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+        if store is not None:
+            store.close()
+
+    if progress is not None:
+        progress.report(final=True)
+    return min(failed, MAX_EXIT_STATUS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Load-generation harness for the Newton simplify endpoint built on SimplificationAPI.
+
+Closed loop: N virtual users each send the next request as soon as the previous one finishes.
+Open loop: requests start at a fixed arrival rate regardless of how fast responses come back;
+latency is measured from the scheduled start so queueing delay is not hidden.
+
+Usage:
+    python -m support.commands.load_test --mode closed --users 20 --duration 30
+    python -m support.commands.load_test --mode open --rate 50 --duration 60 --input expressions.txt --json report.json
+    python -m support.commands.load_test --requests 1000 --metrics newton.prom
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from support.page_objects.api.rest_client import error_category
+from support.page_objects.api.simplification_api import SimplificationAPI
+from support.helpers.data_generator import ExpressionStream
+from support.helpers.latency_histogram import LatencyHistogram
+from support.helpers.metrics import ClientMetrics
+from support.helpers.logging_config import HotPathLogging
+
+logger = logging.getLogger(__name__)
+
+
+def read_expressions(path):
+    """
+    Yield non-empty lines from a file, one expression per line, restarting at the end.
+    The file is re-read on each pass so memory stays flat for large inputs.
+    """
+    while True:
+        found = False
+        with open(path, encoding='utf-8') as handle:
+            for line in handle:
+                expression = line.strip()
+                if expression:
+                    found = True
+                    yield expression
+        if not found:
+            raise ValueError(f"No expressions found in {path}")
+
+
+class LoadTest:
+    """
+    Drive a SimplificationAPI with a closed-loop or open-loop workload and collect latency stats.
+
+    Example:
+        test = LoadTest(api, ExpressionStream(seed=1), duration=30)
+        report = test.run_closed_loop(users=20)
+        print(format_report(report))
+    """
+
+    def __init__(self, api, expressions, duration=None, max_requests=None, clock=time.perf_counter):
+        """
+        Args:
+            api: SimplificationAPI (or any object with simplify_custom_expression)
+            expressions: Iterable of expressions; cycled through lazily
+            duration: Stop after this many seconds (default: None)
+            max_requests: Stop after this many requests (default: None)
+            clock: Monotonic time source, overridable for tests
+        """
+        if duration is None and max_requests is None:
+            raise ValueError("duration or max_requests must be set")
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be greater than 0")
+        if max_requests is not None and max_requests <= 0:
+            raise ValueError("max_requests must be greater than 0")
+
+        self.api = api
+        self.duration = duration
+        self.max_requests = max_requests
+        self._clock = clock
+        self._expressions = iter(expressions)
+        self._lock = threading.Lock()
+
+        self.histogram = LatencyHistogram()
+        self.issued = 0
+        self.successes = 0
+        self.dropped = 0
+        self.errors = {}
+
+    def _next_expression(self):
+        """
+        Claim the next request slot; returns None once the budget is used up.
+        """
+        with self._lock:
+            if self.max_requests is not None and self.issued >= self.max_requests:
+                return None
+            expression = next(self._expressions, None)
+            if expression is not None:
+                self.issued += 1
+            return expression
+
+    def _execute(self, expression, started_at):
+        try:
+            self.api.simplify_custom_expression(expression)
+            error = None
+        except Exception as e:
+            error = e
+        self.histogram.record(self._clock() - started_at)
+        with self._lock:
+            if error is None:
+                self.successes += 1
+            else:
+                category = error_category(error)
+                self.errors[category] = self.errors.get(category, 0) + 1
+
+    def run_closed_loop(self, users):
+        """
+        Run with a fixed number of concurrent users.
+
+        Returns:
+            dict: Report, see report()
+        """
+        if users <= 0:
+            raise ValueError("users must be greater than 0")
+
+        start = self._clock()
+        deadline = start + self.duration if self.duration is not None else None
+
+        def user():
+            while deadline is None or self._clock() < deadline:
+                expression = self._next_expression()
+                if expression is None:
+                    return
+                self._execute(expression, self._clock())
+
+        threads = [threading.Thread(target=user, name=f"load-user-{i}", daemon=True) for i in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self.report('closed', self._clock() - start, users=users)
+
+    def run_open_loop(self, rate, max_in_flight=256):
+        """
+        Start requests at a fixed arrival rate.
+
+        Arrivals that would exceed max_in_flight are counted as dropped instead of
+        queueing without bound.
+
+        Returns:
+            dict: Report, see report()
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be greater than 0")
+
+        interval = 1.0 / rate
+        in_flight = threading.Semaphore(max_in_flight)
+
+        def run_one(expression, scheduled_at):
+            try:
+                self._execute(expression, scheduled_at)
+            finally:
+                in_flight.release()
+
+        start = self._clock()
+        deadline = start + self.duration if self.duration is not None else None
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='load') as executor:
+            arrival = 0
+            while True:
+                scheduled_at = start + arrival * interval
+                if deadline is not None and scheduled_at >= deadline:
+                    break
+                delay = scheduled_at - self._clock()
+                if delay > 0:
+                    time.sleep(delay)
+                arrival += 1
+
+                if not in_flight.acquire(blocking=False):
+                    with self._lock:
+                        self.dropped += 1
+                    continue
+                expression = self._next_expression()
+                if expression is None:
+                    in_flight.release()
+                    break
+                executor.submit(run_one, expression, scheduled_at)
+
+        return self.report('open', self._clock() - start, rate=rate)
+
+    def report(self, mode, elapsed, **settings):
+        """
+        Build the report: throughput, error rate and latency percentiles.
+        """
+        completed = self.successes + sum(self.errors.values())
+        return {
+            'mode': mode,
+            'settings': settings,
+            'elapsed_seconds': elapsed,
+            'requests': completed,
+            'successes': self.successes,
+            'errors': sum(self.errors.values()),
+            'dropped': self.dropped,
+            'error_rate': (completed - self.successes) / completed if completed else 0.0,
+            'throughput_rps': completed / elapsed if elapsed > 0 else 0.0,
+            'latency': self.histogram.summary(),
+            'error_breakdown': dict(sorted(self.errors.items())),
+        }
+
+
+def format_report(report):
+    """
+    Render a report as human-readable text.
+    """
+    latency = report['latency']
+    settings = ', '.join(f"{key}={value}" for key, value in report['settings'].items())
+    lines = [
+        f"Mode:        {report['mode']} loop ({settings})",
+        f"Elapsed:     {report['elapsed_seconds']:.2f} s",
+        f"Requests:    {report['requests']} ({report['successes']} ok, {report['errors']} errors, "
+        f"{report['dropped']} dropped)",
+        f"Throughput:  {report['throughput_rps']:.1f} req/s",
+        f"Error rate:  {report['error_rate']:.2%}",
+        "Latency (ms): "
+        f"min {latency['min_ms']:.1f}  mean {latency['mean_ms']:.1f}  p50 {latency['p50_ms']:.1f}  "
+        f"p90 {latency['p90_ms']:.1f}  p99 {latency['p99_ms']:.1f}  p999 {latency['p999_ms']:.1f}  "
+        f"max {latency['max_ms']:.1f}",
+    ]
+    for category, count in report['error_breakdown'].items():
+        lines.append(f"  {category}: {count}")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Newton simplify endpoint.")
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed')
+    parser.add_argument('--users', type=int, default=10, help="concurrent users in closed-loop mode (default: 10)")
+    parser.add_argument('--rate', type=float, default=10.0, help="arrivals per second in open-loop mode (default: 10)")
+    parser.add_argument('--max-in-flight', type=int, default=256, help="open-loop concurrency cap (default: 256)")
+    parser.add_argument('--duration', type=float, default=None, help="seconds to run")
+    parser.add_argument('--requests', type=int, default=None, help="total requests to send")
+    parser.add_argument('--input', help="file with one expression per line (default: generated)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for generated expressions (default: 0)")
+    parser.add_argument('--num-terms', type=int, default=3)
+    parser.add_argument('--min-value', type=int, default=1)
+    parser.add_argument('--max-value', type=int, default=20)
+    parser.add_argument('--base-url', help="override the API base URL, e.g. a local stub server")
+    parser.add_argument('--json', dest='json_path', help="also write the report as JSON to this path ('-' for stdout)")
+    parser.add_argument('--log-sample-every', type=int, default=None,
+                        help="log one in N per-request INFO messages through a background queue "
+                             "(default: WARNING and above only)")
+    parser.add_argument('--metrics', dest='metrics_path',
+                        help="write per-phase client metrics in Prometheus text format to this path")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Per-request INFO logs would dominate the measurement unless sampled off the hot path
+    hot_path_logging = None
+    if args.log_sample_every:
+        hot_path_logging = HotPathLogging(sample_every=args.log_sample_every).start()
+    else:
+        logging.getLogger('support').setLevel(logging.WARNING)
+
+    if args.input:
+        expressions = read_expressions(args.input)
+    else:
+        expressions = ExpressionStream(args.seed, args.num_terms, args.min_value, args.max_value)
+
+    pool_size = args.users if args.mode == 'closed' else args.max_in_flight
+    metrics = ClientMetrics() if args.metrics_path else None
+    try:
+        with SimplificationAPI(base_url=args.base_url, pool_size=pool_size, metrics=metrics) as api:
+            test = LoadTest(api, expressions, duration=args.duration, max_requests=args.requests)
+            if args.mode == 'closed':
+                report = test.run_closed_loop(args.users)
+            else:
+                report = test.run_open_loop(args.rate, args.max_in_flight)
+    finally:
+        if hot_path_logging is not None:
+            hot_path_logging.stop()
+
+    if args.json_path == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+        if args.json_path:
+            with open(args.json_path, 'w', encoding='utf-8') as handle:
+                json.dump(report, handle, indent=2)
+    if metrics is not None:
+        metrics.write_prometheus(args.metrics_path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,64 @@
-class ApiConstants:
-    BASE_URL = "https://newton.vercel.app/api/"
-    API_VERSION = "v2/"
-    SIMPLIFY_URL = "simplify"
-    
-    TIMEOUT = 30000
\ No newline at end of file
+class ApiConstants:
+    BASE_URL = "https://newton.vercel.app/api/"
+    API_VERSION = "v2/"
+    SIMPLIFY_URL = "simplify"
+    
+    TIMEOUT = 30000
+
+    # Connection pool settings for the shared requests.Session
+    POOL_CONNECTIONS = 10
+    POOL_SIZE = 10
+    POOL_BLOCK = False
+
+    # Thread pool size for SimplificationAPI.simplify_batch; keep <= POOL_SIZE
+    # so every worker gets its own pooled connection
+    BATCH_MAX_WORKERS = 10
+
+    # In-memory result cache defaults
+    CACHE_MAX_SIZE = 10000
+    CACHE_TTL_SECONDS = 3600
+
+    # Persistent (SQLite) result cache defaults
+    DISK_CACHE_TIMEOUT_SECONDS = 30
+    DISK_CACHE_COMPACT_INTERVAL = 1000
+
+    # Local simplifier limits: polynomials with larger coefficients, or more rational
+    # root candidates, are left to the API so a request cannot stall the caller
+    LOCAL_MAX_COEFFICIENT = 10 ** 6
+    LOCAL_MAX_ROOT_CANDIDATES = 10000
+
+    # Rows per chunk in a columnar result store (support/helpers/result_store.py)
+    RESULT_STORE_CHUNK_ROWS = 65536
+
+    # Defaults for the asyncio client
+    ASYNC_POOL_SIZE = 100
+    ASYNC_CONCURRENCY = 100
+
+    # Retry policy defaults (opt-in via SimplificationAPI(retry_policy=RetryPolicy()))
+    RETRY_MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_BASE_SECONDS = 0.1
+    RETRY_BACKOFF_MAX_SECONDS = 10
+    RETRY_AFTER_MAX_SECONDS = 60
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    # Retries may add at most this fraction of load on top of a small burst allowance
+    RETRY_BUDGET_RATIO = 0.1
+    RETRY_BUDGET_MAX_TOKENS = 10
+
+    # Circuit breaker defaults (opt-in via SimplificationAPI(circuit_breaker=CircuitBreaker()))
+    CIRCUIT_WINDOW_SIZE = 20
+    CIRCUIT_MINIMUM_CALLS = 10
+    CIRCUIT_FAILURE_RATE = 0.5
+    CIRCUIT_SLOW_CALL_SECONDS = 5
+    CIRCUIT_SLOW_CALL_RATE = 0.8
+    CIRCUIT_OPEN_SECONDS = 30
+    CIRCUIT_HALF_OPEN_CALLS = 3
+
+    # Adaptive (AIMD) concurrency limiter defaults
+    CONCURRENCY_INITIAL_LIMIT = 4
+    CONCURRENCY_MIN_LIMIT = 1
+    CONCURRENCY_MAX_LIMIT = 64
+    CONCURRENCY_BACKOFF_RATIO = 0.5
+    # A call slower than this multiple of the smoothed latency counts as a latency spike
+    CONCURRENCY_LATENCY_TOLERANCE = 2.0
+    # Statuses by which the upstream sheds load; they shrink the adaptive concurrency limit
+    OVERLOAD_STATUSES = (429, 503)
\ No newline at end of file
@@ -1,10 +1,10 @@
-import enum
-
-class HttpMethod(enum.Enum):
-    GET = 'GET'
-    POST = 'POST'
-    PUT = 'PUT'
-    PATCH = 'PATCH'
-    DELETE = 'DELETE'
-    OPTIONS = 'OPTIONS'
+import enum
+
+class HttpMethod(enum.Enum):
+    GET = 'GET'
+    POST = 'POST'
+    PUT = 'PUT'
+    PATCH = 'PATCH'
+    DELETE = 'DELETE'
+    OPTIONS = 'OPTIONS'
     HEAD = 'HEAD'
\ No newline at end of file
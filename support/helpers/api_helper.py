@@ -1,26 +1,30 @@
-from urllib.parse import urlencode, urljoin
-from support.constants.api_constants import ApiConstants
-
-class ApiHelper:
-
-    BASE_URL = ApiConstants.BASE_URL
-    API_VERSION = ApiConstants.API_VERSION
-
-    
-    def build_url(self, endpoint, params=None):
-        base = urljoin(ApiHelper.BASE_URL, ApiHelper.API_VERSION)
-        url = urljoin(base, endpoint)
-        if params:
-            url = f"{url}?{urlencode(params)}"
-        return url
-
-        
-    def build_headers(self, token=None):
-        headers = {
-            'Content-Type': 'application/json',
-        }
-        if token:
-            headers['Authorization'] = f"Bearer {token}"
-        return headers
-
-
+from urllib.parse import urlencode, urljoin
+from support.constants.api_constants import ApiConstants
+
+class ApiHelper:
+
+    BASE_URL = ApiConstants.BASE_URL
+    API_VERSION = ApiConstants.API_VERSION
+
+    def __init__(self, base_url=None):
+        # Allow pointing a single helper at another host (e.g. a local stub server)
+        if base_url:
+            self.BASE_URL = base_url
+
+    def build_url(self, endpoint, params=None):
+        base = urljoin(self.BASE_URL, self.API_VERSION)
+        url = urljoin(base, endpoint)
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        return url
+
+        
+    def build_headers(self, token=None):
+        headers = {
+            'Content-Type': 'application/json',
+        }
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        return headers
+
+
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import threading
+from http.client import responses as http_reasons
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from support.constants.api_constants import ApiConstants
+
+logger = logging.getLogger(__name__)
+
+# Only headers the clients look at are kept in the cassette
+_RECORDED_HEADERS = ('Content-Type', 'Retry-After')
+
+
+def interaction_key(method, url):
+    """
+    Key an interaction by method and path+query, so a cassette replays against any base URL.
+    """
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else '')
+    return f"{method.upper()} {path}"
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    requests transport adapter that records real responses to a cassette or replays them.
+
+    A cassette is an append-only JSON Lines file with one interaction per line;
+    later lines for the same request win. In replay mode responses come from an
+    in-memory index and no sockets are opened.
+
+    Example:
+        api = SimplificationAPI(transport=CassetteAdapter.record("newton.jsonl"))
+        api = SimplificationAPI(transport=CassetteAdapter.replay("newton.jsonl"))
+    """
+
+    MODES = ('record', 'replay')
+
+    def __init__(self, path, mode, inner=None, pool_size=ApiConstants.POOL_SIZE, pool_block=ApiConstants.POOL_BLOCK):
+        """
+        Args:
+            path: Cassette file
+            mode: 'record' to pass requests through and save them, 'replay' to serve saved ones
+            inner: Adapter used for real requests in record mode (default: pooled HTTPAdapter)
+            pool_size: Connections kept by the default inner adapter, like SimplificationAPI(pool_size=...)
+            pool_block: Block when the default inner adapter's pool is exhausted
+        """
+        super().__init__()
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+
+        self.path = str(path)
+        self.mode = mode
+        self.inner = inner
+        self.interactions = self._load(self.path) if os.path.exists(self.path) else {}
+        self._lock = threading.Lock()
+        self._handle = None
+
+        if mode == 'record':
+            self.inner = inner or HTTPAdapter(pool_connections=ApiConstants.POOL_CONNECTIONS,
+                                              pool_maxsize=pool_size, pool_block=pool_block)
+            self._handle = open(self.path, 'a', encoding='utf-8')
+        elif not self.interactions:
+            logger.warning("Cassette %s is empty or missing; every request will fail", self.path)
+
+    @classmethod
+    def record(cls, path, inner=None, pool_size=ApiConstants.POOL_SIZE, pool_block=ApiConstants.POOL_BLOCK):
+        return cls(path, 'record', inner, pool_size, pool_block)
+
+    @classmethod
+    def replay(cls, path):
+        return cls(path, 'replay')
+
+    @staticmethod
+    def _load(path):
+        interactions = {}
+        with open(path, encoding='utf-8') as handle:
+            for line in handle:
+                if line.strip():
+                    interaction = json.loads(line)
+                    interactions[interaction['key']] = interaction
+        return interactions
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = interaction_key(request.method, request.url)
+        if self.mode == 'replay':
+            interaction = self.interactions.get(key)
+            if interaction is None:
+                raise requests.exceptions.ConnectionError(f"No recorded response for {key} in {self.path}",
+                                                          request=request)
+            return self._build_response(request, interaction)
+
+        response = self.inner.send(request, stream=False, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        interaction = {
+            'key': key,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in _RECORDED_HEADERS if name in response.headers},
+            'body': response.content.decode('utf-8', errors='replace'),
+        }
+        line = json.dumps(interaction, separators=(',', ':'), ensure_ascii=False)
+        with self._lock:
+            self.interactions[key] = interaction
+            self._handle.write(line + '\n')
+            self._handle.flush()
+        return response
+
+    def _build_response(self, request, interaction):
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = http_reasons.get(response.status_code, '')
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response._content = interaction['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
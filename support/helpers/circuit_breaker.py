@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+from collections import deque
+import requests
+from support.constants.api_constants import ApiConstants
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of calling the API while the circuit is open.
+    """
+
+
+def is_upstream_failure(error):
+    """
+    Return True if an error says the upstream is unhealthy: timeouts, connection
+    errors, 429 and 5xx. Other HTTP errors (e.g. 404 for a bad expression) do not count.
+    """
+    cause = error.__cause__ or error
+    response = getattr(cause, 'response', None)
+    if isinstance(cause, requests.exceptions.HTTPError) and response is not None:
+        return response.status_code >= 500 or response.status_code == 429
+    return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker driven by the error rate and slow-call rate of recent calls.
+
+    closed:    calls go through; the last `window_size` outcomes are tracked and the
+               circuit opens once at least `minimum_calls` were seen and either rate
+               reaches its threshold.
+    open:      calls are rejected immediately for `open_seconds`.
+    half_open: up to `half_open_calls` trial calls go through; one failure (or slow
+               call) reopens the circuit, all succeeding closes it.
+
+    Transitions are logged and passed to listeners as event dicts with
+    'from_state', 'to_state', 'reason' and 'at'.
+
+    Example:
+        breaker = CircuitBreaker(open_seconds=10)
+        breaker.add_listener(lambda event: print(event['to_state']))
+        api = SimplificationAPI(circuit_breaker=breaker, cache=ResultCache())
+    """
+
+    def __init__(self, window_size=ApiConstants.CIRCUIT_WINDOW_SIZE,
+                 minimum_calls=ApiConstants.CIRCUIT_MINIMUM_CALLS,
+                 failure_rate_threshold=ApiConstants.CIRCUIT_FAILURE_RATE,
+                 slow_call_seconds=ApiConstants.CIRCUIT_SLOW_CALL_SECONDS,
+                 slow_call_rate_threshold=ApiConstants.CIRCUIT_SLOW_CALL_RATE,
+                 open_seconds=ApiConstants.CIRCUIT_OPEN_SECONDS,
+                 half_open_calls=ApiConstants.CIRCUIT_HALF_OPEN_CALLS,
+                 serve_stale=True, clock=time.monotonic):
+        """
+        Args:
+            window_size: Number of recent calls the rates are computed over
+            minimum_calls: Calls needed in the window before the circuit can open
+            failure_rate_threshold: Failure fraction that opens the circuit (0-1)
+            slow_call_seconds: Calls taking at least this long count as slow; None disables
+            slow_call_rate_threshold: Slow-call fraction that opens the circuit (0-1)
+            open_seconds: How long the circuit stays open before trial calls
+            half_open_calls: Number of trial calls in the half-open state
+            serve_stale: While open, answer from the client's cache, even expired entries
+            clock: Monotonic time source, overridable for tests
+        """
+        if window_size <= 0:
+            raise ValueError("window_size must be greater than 0")
+        if not 0 < minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("rate thresholds must be between 0 and 1")
+        if open_seconds <= 0:
+            raise ValueError("open_seconds must be greater than 0")
+        if half_open_calls <= 0:
+            raise ValueError("half_open_calls must be greater than 0")
+
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.serve_stale = serve_stale
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._listeners = []
+
+        self.state = CLOSED
+        self._window = deque(maxlen=window_size)  # (failed, slow) per call
+        self._opened_at = None
+        self._trials_started = 0
+        self._trials_succeeded = 0
+        self.rejected = 0
+        self.transitions = 0
+
+    def add_listener(self, listener):
+        """
+        Call listener(event) on every state transition.
+        """
+        self._listeners.append(listener)
+
+    def allow_request(self):
+        """
+        Return True if a call may go to the API now. Every allowed call must be
+        followed by record_success() or record_failure().
+        """
+        with self._lock:
+            event = None
+            if self.state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+                event = self._transition(HALF_OPEN, f"open for {self.open_seconds}s")
+            if self.state == CLOSED:
+                allowed = True
+            elif self.state == HALF_OPEN and self._trials_started < self.half_open_calls:
+                self._trials_started += 1
+                allowed = True
+            else:
+                self.rejected += 1
+                allowed = False
+        self._emit(event)
+        return allowed
+
+    def record_success(self, duration=0.0):
+        self._record(False, duration)
+
+    def record_failure(self, duration=0.0):
+        self._record(True, duration)
+
+    def _record(self, failed, duration):
+        slow = self.slow_call_seconds is not None and duration >= self.slow_call_seconds
+        with self._lock:
+            event = None
+            if self.state == HALF_OPEN:
+                if failed or slow:
+                    event = self._transition(OPEN, "trial call failed" if failed else "trial call was slow")
+                else:
+                    self._trials_succeeded += 1
+                    if self._trials_succeeded >= self.half_open_calls:
+                        event = self._transition(CLOSED, f"{self.half_open_calls} trial calls succeeded")
+            elif self.state == CLOSED:
+                self._window.append((failed, slow))
+                if len(self._window) >= self.minimum_calls:
+                    failure_rate = sum(1 for f, _ in self._window if f) / len(self._window)
+                    slow_rate = sum(1 for _, s in self._window if s) / len(self._window)
+                    if failure_rate >= self.failure_rate_threshold:
+                        event = self._transition(OPEN, f"failure rate {failure_rate:.0%}")
+                    elif slow_rate >= self.slow_call_rate_threshold:
+                        event = self._transition(OPEN, f"slow call rate {slow_rate:.0%}")
+            # Outcomes of calls started before the circuit opened are ignored
+        self._emit(event)
+
+    def _transition(self, state, reason):
+        """
+        Change state; must be called with the lock held. Returns the event to emit.
+        """
+        event = {'from_state': self.state, 'to_state': state, 'reason': reason, 'at': time.time()}
+        self.state = state
+        self.transitions += 1
+        self._window.clear()
+        self._trials_started = 0
+        self._trials_succeeded = 0
+        self._opened_at = self._clock() if state == OPEN else None
+        return event
+
+    def _emit(self, event):
+        if event is None:
+            return
+        logger.warning("Circuit %s -> %s: %s", event['from_state'], event['to_state'], event['reason'])
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error("Circuit breaker listener failed: %s", e)
+
+    def stats(self):
+        """
+        Return the current state, window counts, rejected calls and number of transitions.
+        """
+        with self._lock:
+            return {
+                'state': self.state,
+                'window_calls': len(self._window),
+                'window_failures': sum(1 for f, _ in self._window if f),
+                'window_slow_calls': sum(1 for _, s in self._window if s),
+                'rejected': self.rejected,
+                'transitions': self.transitions,
+            }
@@ -0,0 +1,125 @@
+import sys
+from collections.abc import Mapping
+
+# _echo value for responses that had no 'expression' key
+_ABSENT = object()
+
+_RESULT_KEYS = ('original_expression', 'response')
+
+
+class SimplifyResult(Mapping):
+    """
+    Memory-compact simplification result with the same read access as the result dict.
+
+    result['original_expression'], result['response']['result'] and dict(result['response'])
+    work as before, but the object holds only a few slots: the operation name is interned
+    (one string shared by all results), and the expression the API echoes back is stored
+    only when it differs from the original. The 'response' mapping is a view created on
+    access. Results are read-only.
+
+    Example:
+        api = SimplificationAPI(compact_results=True)
+        result = api.simplify_custom_expression("x + x")
+        result['response']['result']  # '2 x'
+    """
+
+    __slots__ = ('original_expression', 'operation', 'result', '_echo', '_extra')
+
+    def __init__(self, original_expression, operation, result, echo=None, extra=None):
+        """
+        Args:
+            original_expression: The expression that was simplified
+            operation: API operation name, e.g. 'simplify'
+            result: The simplified expression
+            echo: The response's 'expression' if it differs from original_expression
+            extra: Any other response fields, as a dict
+        """
+        self.original_expression = original_expression
+        self.operation = sys.intern(operation) if isinstance(operation, str) else operation
+        self.result = result
+        self._echo = echo
+        self._extra = extra or None
+
+    @classmethod
+    def from_response(cls, original_expression, response, shared=False):
+        """
+        Build a result from a decoded API response (a mapping); the fields are copied.
+
+        Args:
+            original_expression: The expression that was simplified
+            response: Decoded API response
+            shared: The response was obtained for another spelling of the expression
+                (cache hit, coalesced request); its 'expression' then echoes original_expression
+        """
+        fields = dict(response)
+        operation = fields.pop('operation', None)
+        result = fields.pop('result', None)
+        echo = fields.pop('expression', _ABSENT)
+        if echo == original_expression or (shared and echo is not _ABSENT):
+            echo = None
+        return cls(original_expression, operation, result, echo, fields)
+
+    @property
+    def response(self):
+        return ResponseView(self)
+
+    def __getitem__(self, key):
+        if key == 'original_expression':
+            return self.original_expression
+        if key == 'response':
+            return ResponseView(self)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(_RESULT_KEYS)
+
+    def __len__(self):
+        return len(_RESULT_KEYS)
+
+    def __repr__(self):
+        return f"SimplifyResult({self.original_expression!r}, {dict(self.response)!r})"
+
+    def to_dict(self):
+        """
+        The result in the dict representation returned without compact_results.
+        """
+        return {'original_expression': self.original_expression, 'response': dict(self.response)}
+
+
+class ResponseView(Mapping):
+    """
+    Read-only mapping of a SimplifyResult's response fields.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def _fields(self):
+        owner = self._owner
+        if owner.operation is not None:
+            yield 'operation', owner.operation
+        if owner._echo is None:
+            yield 'expression', owner.original_expression
+        elif owner._echo is not _ABSENT:
+            yield 'expression', owner._echo
+        if owner.result is not None:
+            yield 'result', owner.result
+        if owner._extra:
+            yield from owner._extra.items()
+
+    def __getitem__(self, key):
+        for name, value in self._fields():
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (name for name, _ in self._fields())
+
+    def __len__(self):
+        return sum(1 for _ in self._fields())
+
+    def __repr__(self):
+        return repr(dict(self._fields()))
@@ -1,52 +1,387 @@
-import random
-import operator
-
-class ArithmeticExpressionGenerator:
-    OPERATORS = [
-        ('+', operator.add),
-        ('-', operator.sub),
-        ('*', operator.mul),
-        ('/', operator.truediv)
-    ]
-
-    def generate_expression(self, num_terms=3, min_value=1, max_value=20):
-        """
-        Generates a random algebraic expression with variable x.
-        Example: "2x^2 + 3x + 5" or "x^3 - 4x + 1"
-        """
-        expression = []
-        
-        for i in range(num_terms):
-            # Generate coefficient (can be 1 and omitted for cleaner look)
-            coeff = random.randint(min_value, max_value)
-            
-            # Generate power for x (0 means constant term, 1 means x, 2+ means x^power)
-            power = random.randint(0, 3)
-            
-            # Build the term
-            term = ""
-            
-            if power == 0:
-                # Constant term
-                term = str(coeff)
-            elif power == 1:
-                # Linear term (x)
-                if coeff == 1:
-                    term = "x"
-                else:
-                    term = f"{coeff}x"
-            else:
-                # Higher power term (x^2, x^3, etc.)
-                if coeff == 1:
-                    term = f"x^{power}"
-                else:
-                    term = f"{coeff}x^{power}"
-            
-            expression.append(term)
-            
-            # Add operator between terms (except for last term)
-            if i < num_terms - 1:
-                op = random.choice(['+', '-'])
-                expression.append(op)
-        
-        return ' '.join(expression)
\ No newline at end of file
+import random
+import operator
+import sys
+from collections.abc import Sequence
+from itertools import islice, product
+
+class ArithmeticExpressionGenerator:
+    OPERATORS = [
+        ('+', operator.add),
+        ('-', operator.sub),
+        ('*', operator.mul),
+        ('/', operator.truediv)
+    ]
+    # Highest power of x used in generated terms
+    MAX_POWER = 3
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Seed for this generator's private random.Random; None seeds from the OS
+        """
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def generate_expression(self, num_terms=3, min_value=1, max_value=20):
+        """
+        Generates a random algebraic expression with variable x.
+        Example: "2x^2 + 3x + 5" or "x^3 - 4x + 1"
+        """
+        expression = []
+        
+        for i in range(num_terms):
+            # Generate coefficient (can be 1 and omitted for cleaner look)
+            coeff = self.random.randint(min_value, max_value)
+            
+            # Generate power for x (0 means constant term, 1 means x, 2+ means x^power)
+            power = self.random.randint(0, self.MAX_POWER)
+            
+            expression.append(self.format_term(coeff, power))
+            
+            # Add operator between terms (except for last term)
+            if i < num_terms - 1:
+                op = self.random.choice(['+', '-'])
+                expression.append(op)
+        
+        return ' '.join(expression)
+
+    @staticmethod
+    def format_term(coeff, power):
+        """
+        Formats a single term, e.g. "5", "x", "3x", "x^2" or "4x^3".
+        """
+        if power == 0:
+            # Constant term
+            return str(coeff)
+        elif power == 1:
+            # Linear term (x)
+            if coeff == 1:
+                return "x"
+            return f"{coeff}x"
+        else:
+            # Higher power term (x^2, x^3, etc.)
+            if coeff == 1:
+                return f"x^{power}"
+            return f"{coeff}x^{power}"
+
+    def generate_batch(self, n, num_terms=3, min_value=1, max_value=20, seed=None):
+        """
+        Generates n expressions in the same format as generate_expression.
+        All coefficients, powers and operators are drawn as NumPy arrays in one shot.
+        When the coefficient range is small next to the batch, terms are looked up from a
+        precomputed table instead of being formatted per term; otherwise only the sampled
+        terms are formatted, so the cost never grows with the width of the range.
+        
+        Args:
+            n: Number of expressions to generate
+            num_terms: Number of terms per expression (default: 3)
+            min_value: Minimum coefficient (default: 1)
+            max_value: Maximum coefficient (default: 20)
+            seed: Seed for numpy.random.default_rng; None draws one from this generator
+            
+        Returns:
+            list: n expression strings
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("generate_batch requires numpy (pip install numpy)")
+        
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if num_terms <= 0:
+            raise ValueError("num_terms must be greater than 0")
+        if min_value > max_value:
+            raise ValueError("min_value must not be greater than max_value")
+        if n == 0:
+            return []
+        
+        if seed is None:
+            # Keeps batches reproducible when the generator itself was seeded
+            seed = self.random.getrandbits(64)
+        rng = np.random.default_rng(seed)
+        num_powers = self.MAX_POWER + 1
+        operator_table = np.array([' + ', ' - '], dtype=object)
+        
+        coeffs = rng.integers(min_value, max_value + 1, size=(n, num_terms))
+        powers = rng.integers(0, num_powers, size=(n, num_terms))
+        operators = rng.integers(0, 2, size=(n, num_terms - 1))
+        
+        table_size = (max_value - min_value + 1) * num_powers
+        if table_size <= coeffs.size:
+            # Term table indexed by (coeff - min_value) * num_powers + power
+            term_table = np.array([
+                self.format_term(coeff, power)
+                for coeff in range(min_value, max_value + 1)
+                for power in range(num_powers)
+            ], dtype=object)
+            terms = term_table[(coeffs - min_value) * num_powers + powers]
+        else:
+            terms = np.frompyfunc(self.format_term, 2, 1)(coeffs.tolist(), powers.tolist())
+        
+        # Concatenate column by column; object arrays add element-wise as Python strings
+        expressions = terms[:, 0].copy()
+        for i in range(1, num_terms):
+            expressions += operator_table[operators[:, i - 1]]
+            expressions += terms[:, i]
+        
+        return expressions.tolist()
+
+    def stream(self, seed, num_terms=3, min_value=1, max_value=20):
+        """
+        Returns a lazy, unbounded and reproducible ExpressionStream.
+        """
+        return ExpressionStream(seed, num_terms, min_value, max_value)
+
+    def space(self, num_terms=3, min_value=1, max_value=20):
+        """
+        Returns the ExpressionSpace of every expression generate_expression can produce.
+        """
+        return ExpressionSpace(num_terms, min_value, max_value)
+
+
+class ExpressionStream:
+    """
+    Unbounded stream of generated expressions that is reproducible from its seed.
+    
+    Iterating yields expressions lazily and restarts from the beginning each time.
+    spawn() derives child streams with their own seeds, so parallel workers get
+    deterministic inputs without coordinating. Children are not disjoint: they draw
+    from the same finite set of expressions, so siblings can produce the same
+    expression. Use ExpressionSpace.shard when each expression must go to exactly
+    one worker.
+    
+    Example:
+        stream = ExpressionStream(seed=1234, num_terms=3)
+        workers = stream.spawn(8)
+        for expression in workers[worker_index]:
+            ...
+    """
+    
+    def __init__(self, seed, num_terms=3, min_value=1, max_value=20, spawn_key=()):
+        """
+        Args:
+            seed: Root seed (int or str) shared by the stream and all its children
+            num_terms: Number of terms per expression (default: 3)
+            min_value: Minimum coefficient (default: 1)
+            max_value: Maximum coefficient (default: 20)
+            spawn_key: Path of child indices from the root stream (default: root)
+        """
+        if seed is None:
+            raise ValueError("seed is required for a reproducible stream")
+        if num_terms <= 0:
+            raise ValueError("num_terms must be greater than 0")
+        if min_value > max_value:
+            raise ValueError("min_value must not be greater than max_value")
+        
+        self.seed = seed
+        self.num_terms = num_terms
+        self.min_value = min_value
+        self.max_value = max_value
+        self.spawn_key = tuple(spawn_key)
+    
+    @property
+    def stream_seed(self):
+        """
+        Seed of this stream's generator; children hash the root seed with their spawn key.
+        """
+        if not self.spawn_key:
+            return self.seed
+        import hashlib
+        digest = hashlib.sha256(repr((self.seed, self.spawn_key)).encode('utf-8')).digest()
+        return int.from_bytes(digest[:16], 'big')
+    
+    def __iter__(self):
+        generator = ArithmeticExpressionGenerator(seed=self.stream_seed)
+        while True:
+            yield generator.generate_expression(self.num_terms, self.min_value, self.max_value)
+    
+    def take(self, n):
+        """
+        Returns the first n expressions of the stream.
+        """
+        return list(islice(self, n))
+    
+    def child(self, index):
+        """
+        Returns the index-th child stream. Its expressions may overlap with those
+        of its siblings, see the class docstring.
+        """
+        if index < 0:
+            raise ValueError("index must be non-negative")
+        return ExpressionStream(self.seed, self.num_terms, self.min_value, self.max_value,
+                                self.spawn_key + (index,))
+    
+    def spawn(self, num_workers):
+        """
+        Returns num_workers child streams, one per worker. Siblings can yield the
+        same expressions; use ExpressionSpace.shard for disjoint partitions.
+        """
+        if num_workers <= 0:
+            raise ValueError("num_workers must be greater than 0")
+        return [self.child(index) for index in range(num_workers)]
+
+
+class ExpressionSpace(Sequence):
+    """
+    Every expression generate_expression can produce for the given parameters, in a fixed order.
+    
+    An expression is a mixed-radix number over its terms (coefficient and power) and the
+    +/- operators between them, so the space is counted exactly, the k-th expression is
+    built directly from k (unrank) and an expression maps back to its index (rank).
+    Indexes are unique per expression string, so exhaustive, sharded or sampled runs
+    never repeat an expression and need no dedup bookkeeping. Expressions that are
+    equal only algebraically (x + 1 and 1 + x) are distinct entries.
+    
+    Example:
+        space = ExpressionSpace(num_terms=2, min_value=1, max_value=5)
+        len(space)             # 800
+        space[0]               # '1 + 1'
+        space.index("x - 3")   # 68
+        for rank in space.shard(worker_index, num_workers):
+            simplify(space[rank])
+    """
+    
+    OPERATORS = ('+', '-')
+    
+    def __init__(self, num_terms=3, min_value=1, max_value=20):
+        """
+        Args:
+            num_terms: Number of terms per expression (default: 3)
+            min_value: Minimum coefficient (default: 1)
+            max_value: Maximum coefficient (default: 20)
+        """
+        if num_terms <= 0:
+            raise ValueError("num_terms must be greater than 0")
+        if min_value > max_value:
+            raise ValueError("min_value must not be greater than max_value")
+        
+        self.num_terms = num_terms
+        self.min_value = min_value
+        self.max_value = max_value
+        
+        # Term table indexed by (coeff - min_value) * num_powers + power, as in generate_batch
+        self.terms = [
+            ArithmeticExpressionGenerator.format_term(coeff, power)
+            for coeff in range(min_value, max_value + 1)
+            for power in range(ArithmeticExpressionGenerator.MAX_POWER + 1)
+        ]
+        self._term_index = {term: index for index, term in enumerate(self.terms)}
+        self.size = len(self.terms) ** num_terms * len(self.OPERATORS) ** (num_terms - 1)
+    
+    def __len__(self):
+        # len() is limited to sys.maxsize; self.size is exact for any space
+        return self.size
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.unrank(rank) for rank in range(self.size)[index]]
+        if not -self.size <= index < self.size:
+            raise IndexError("expression index out of range")
+        return self.unrank(index % self.size)
+    
+    def __iter__(self):
+        # Same order as unrank, without the per-expression arithmetic
+        factors = [self.terms] + [self.OPERATORS, self.terms] * (self.num_terms - 1)
+        for parts in product(*factors):
+            yield ' '.join(parts)
+    
+    def __contains__(self, expression):
+        try:
+            self.rank(expression)
+        except ValueError:
+            return False
+        return True
+    
+    def unrank(self, rank):
+        """
+        Returns the expression at index rank (0 <= rank < size) in O(num_terms).
+        """
+        if not 0 <= rank < self.size:
+            raise IndexError("expression index out of range")
+        num_term_choices = len(self.terms)
+        rank, term = divmod(rank, num_term_choices)
+        parts = [self.terms[term]]
+        for _ in range(self.num_terms - 1):
+            rank, op = divmod(rank, len(self.OPERATORS))
+            rank, term = divmod(rank, num_term_choices)
+            parts += [self.OPERATORS[op], self.terms[term]]
+        return ' '.join(reversed(parts))
+    
+    def rank(self, expression):
+        """
+        Returns the index of expression, written as generate_expression writes it.
+        
+        Raises:
+            ValueError: If the expression is not in this space
+        """
+        tokens = expression.split(' ') if isinstance(expression, str) else []
+        if len(tokens) != 2 * self.num_terms - 1:
+            raise ValueError(f"{expression!r} is not in this expression space")
+        rank = 0
+        for position, token in enumerate(tokens):
+            if position % 2:
+                if token not in self.OPERATORS:
+                    raise ValueError(f"{expression!r} is not in this expression space")
+                rank = rank * len(self.OPERATORS) + self.OPERATORS.index(token)
+            else:
+                if token not in self._term_index:
+                    raise ValueError(f"{expression!r} is not in this expression space")
+                rank = rank * len(self.terms) + self._term_index[token]
+        return rank
+    
+    def index(self, expression, start=0, stop=None):
+        """
+        Returns the index of expression (by rank, not by scanning the space).
+        """
+        rank = self.rank(expression)
+        if rank < start or (stop is not None and rank >= stop):
+            raise ValueError(f"{expression!r} is not in the given range")
+        return rank
+    
+    def count(self, expression):
+        return 1 if expression in self else 0
+    
+    def shard(self, index, num_shards):
+        """
+        Returns the range of indexes for shard index of num_shards.
+        
+        Shards are contiguous, disjoint, differ in size by at most one and together
+        cover the whole space.
+        """
+        if num_shards <= 0:
+            raise ValueError("num_shards must be greater than 0")
+        if not 0 <= index < num_shards:
+            raise ValueError("index must be in range(num_shards)")
+        return range(self.size * index // num_shards, self.size * (index + 1) // num_shards)
+    
+    def expressions(self, ranks):
+        """
+        Lazily yields the expression for each index in ranks, e.g. a shard.
+        """
+        for rank in ranks:
+            yield self.unrank(rank)
+    
+    def sample(self, n, seed=None, ranks=None):
+        """
+        Returns n distinct expressions drawn uniformly without replacement.
+        
+        Args:
+            n: Number of expressions
+            seed: Seed for random.Random; None seeds from the OS
+            ranks: Range of indexes to draw from, e.g. a shard (default: the whole space)
+        """
+        ranks = range(self.size) if ranks is None else ranks
+        # len() of a range is limited to sys.maxsize
+        total = max(0, (ranks.stop - ranks.start + ranks.step - (1 if ranks.step > 0 else -1)) // ranks.step)
+        if not 0 <= n <= total:
+            raise ValueError("n must be between 0 and the number of expressions")
+        rng = random.Random(seed)
+        if total <= sys.maxsize:
+            positions = rng.sample(range(total), n)
+        else:
+            # Too large for random.sample; n is tiny in comparison, so redraws are rare
+            positions = {}
+            while len(positions) < n:
+                positions.setdefault(rng.randrange(total), None)
+        return [self.unrank(ranks[position]) for position in positions]
\ No newline at end of file
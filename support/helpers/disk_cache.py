@@ -0,0 +1,360 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from support.constants.api_constants import ApiConstants
+from support.helpers.result_cache import normalize_expression
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+_CREATED_AT_INDEX = "CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)"
+
+# SQLite limits the number of bound parameters per statement
+_PRELOAD_CHUNK_SIZE = 500
+
+
+class DiskResultCache:
+    """
+    Persistent simplify response cache stored in SQLite, shared across runs and processes.
+
+    The database runs in WAL mode so several processes can read while one writes.
+    All threads share one connection, guarded by a lock, which close() closes.
+    Cache writes never fail a call: SQLite errors are logged and the write is
+    dropped, and writes made during a compaction are held in memory until it ends
+    instead of waiting for VACUUM. It exposes the same get/set/stats interface as
+    ResultCache and can be passed to SimplificationAPI(cache=...).
+
+    Example:
+        cache = DiskResultCache("simplify_cache.sqlite3", max_bytes=50 * 1024 * 1024)
+        cache.preload(corpus)  # warm start: one bulk read instead of a query per call
+        api = SimplificationAPI(cache=cache)
+    """
+
+    def __init__(self, path, ttl=None, max_bytes=None,
+                 compact_interval=ApiConstants.DISK_CACHE_COMPACT_INTERVAL,
+                 timeout=ApiConstants.DISK_CACHE_TIMEOUT_SECONDS):
+        """
+        Args:
+            path: SQLite database file; created if missing
+            ttl: Seconds an entry stays valid; None disables expiry (default: None)
+            max_bytes: Compact automatically once stored data exceeds this size; the size check
+                and compaction run on a background thread, never in set() (default: None)
+            compact_interval: Writes between automatic size checks (default: ApiConstants.DISK_CACHE_COMPACT_INTERVAL)
+            timeout: Seconds to wait for another process holding the write lock
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self.timeout = timeout
+
+        # _lock guards counters and the in-memory entries; _db_lock guards the shared
+        # connection, the compaction count and the writes deferred while compacting
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._preloaded = {}
+        self._pending = {}
+        self._compacting = 0
+        self._writes_since_check = 0
+        self._compaction = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._db = self._open()
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+            self._db.execute(_CREATED_AT_INDEX)
+
+    def _open(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        # WAL makes NORMAL durable against application crashes, which is enough for a cache
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _is_expired(self, created_at):
+        return self.ttl is not None and time.time() - created_at >= self.ttl
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, expression, allow_expired=False):
+        """
+        Return the cached response for an expression, or None on a miss.
+
+        With allow_expired=True an expired entry is still returned (and kept).
+        A database error is logged and counted as a miss.
+        """
+        key = normalize_expression(expression)
+
+        entry = self._preloaded.get(key)
+        if entry is None:
+            try:
+                with self._db_lock:
+                    row = self._pending.get(key) or self._db.execute(
+                        "SELECT key, response, created_at FROM results WHERE key = ?", (key,)
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Reading %s from %s failed: %s", key, self.path, e)
+                row = None
+            entry = (json.loads(row[1]), row[2]) if row else None
+
+        if entry is None:
+            self._count('misses')
+            return None
+
+        response, created_at = entry
+        if not allow_expired and self._is_expired(created_at):
+            with self._lock:
+                self._preloaded.pop(key, None)
+            self._count('expirations')
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return response
+
+    def set(self, expression, response):
+        """
+        Store a response, replacing any existing entry for the expression.
+
+        Errors are logged and the entry is dropped; during a compaction the entry is
+        written once the compaction has finished.
+        """
+        key = normalize_expression(expression)
+        created_at = time.time()
+        row = (key, json.dumps(response, separators=(',', ':')), created_at)
+        with self._lock:
+            if key in self._preloaded:
+                self._preloaded[key] = (response, created_at)
+        try:
+            with self._db_lock:
+                if self._compacting:
+                    self._pending[key] = row
+                    return
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO results (key, response, created_at) VALUES (?, ?, ?)", row)
+        except sqlite3.Error as e:
+            logger.warning("Caching %s in %s failed: %s", key, self.path, e)
+            return
+
+        with self._lock:
+            if self.max_bytes is None:
+                return
+            self._writes_since_check += 1
+            # At most one compaction at a time; writes keep counting while it runs
+            if self._writes_since_check < self.compact_interval or self._compaction is not None:
+                return
+            self._writes_since_check = 0
+            self._compaction = threading.Thread(target=self._compact_in_background,
+                                                name='disk-cache-compaction', daemon=True)
+            self._compaction.start()
+
+    def _compact_in_background(self):
+        """
+        Size check and compaction for set(), run on their own thread so VACUUM never blocks a request.
+        """
+        try:
+            if self.data_size() > self.max_bytes:
+                self.compact()
+        except sqlite3.Error as e:
+            logger.error("Background compaction of %s failed: %s", self.path, e)
+        finally:
+            with self._lock:
+                self._compaction = None
+
+    def wait_for_compaction(self, timeout=None):
+        """
+        Wait until a background compaction started by set() has finished.
+
+        Returns:
+            bool: True if no compaction is running anymore
+        """
+        with self._lock:
+            compaction = self._compaction
+        if compaction is not None:
+            compaction.join(timeout)
+            return not compaction.is_alive()
+        return True
+
+    def preload(self, expressions=None):
+        """
+        Load entries into memory in bulk so subsequent gets skip SQLite entirely.
+
+        Args:
+            expressions: Only preload these expressions; None loads the whole cache
+
+        Returns:
+            int: Number of entries loaded
+        """
+        with self._db_lock:
+            if expressions is None:
+                rows = self._db.execute("SELECT key, response, created_at FROM results").fetchall()
+            else:
+                keys = list({normalize_expression(expression) for expression in expressions})
+                rows = []
+                for start in range(0, len(keys), _PRELOAD_CHUNK_SIZE):
+                    chunk = keys[start:start + _PRELOAD_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows.extend(self._db.execute(
+                        f"SELECT key, response, created_at FROM results WHERE key IN ({placeholders})", chunk
+                    ).fetchall())
+
+        entries = {key: (json.loads(response), created_at)
+                   for key, response, created_at in rows if not self._is_expired(created_at)}
+        with self._lock:
+            self._preloaded.update(entries)
+        logger.info("Preloaded %d cached responses from %s", len(entries), self.path)
+        return len(entries)
+
+    @staticmethod
+    def _data_size(connection):
+        row = connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(key) + LENGTH(response)), 0) FROM results"
+        ).fetchone()
+        return row[0]
+
+    def data_size(self):
+        """
+        Return the approximate number of bytes of stored keys and responses.
+        """
+        with self._db_lock:
+            return self._data_size(self._db)
+
+    def compact(self, max_bytes=None):
+        """
+        Drop expired entries, then the oldest entries until the data fits in max_bytes,
+        and reclaim the freed space on disk.
+
+        Runs on its own connection. Writes made meanwhile are held in memory and
+        stored when it finishes, so they do not wait for VACUUM.
+
+        Args:
+            max_bytes: Target size; defaults to the max_bytes given at construction
+
+        Returns:
+            int: Number of entries removed
+        """
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        with self._db_lock:
+            self._compacting += 1
+        connection = self._open()
+        removed = 0
+        try:
+            with connection:
+                if self.ttl is not None:
+                    removed += connection.execute(
+                        "DELETE FROM results WHERE created_at <= ?", (time.time() - self.ttl,)
+                    ).rowcount
+
+                if max_bytes is not None:
+                    excess = self._data_size(connection) - max_bytes
+                    if excess > 0:
+                        # Walk the oldest rows until enough bytes are covered, then delete them in one statement
+                        freed = 0
+                        cutoff = None
+                        for created_at, size in connection.execute(
+                            "SELECT created_at, LENGTH(key) + LENGTH(response) FROM results ORDER BY created_at"
+                        ):
+                            freed += size
+                            cutoff = created_at
+                            if freed >= excess:
+                                break
+                        removed += connection.execute(
+                            "DELETE FROM results WHERE created_at <= ?", (cutoff,)
+                        ).rowcount
+
+            if removed:
+                connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                connection.execute("VACUUM")
+                with self._lock:
+                    self._preloaded.clear()
+                    self.evictions += removed
+                logger.info("Compacted %s: removed %d entries", self.path, removed)
+        finally:
+            connection.close()
+            self._finish_compaction()
+        return removed
+
+    def _finish_compaction(self):
+        """
+        Store the writes deferred while compacting, once the last compaction has finished.
+        """
+        with self._db_lock:
+            self._compacting -= 1
+            if self._compacting or not self._pending:
+                return
+            rows, self._pending = list(self._pending.values()), {}
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO results (key, response, created_at) VALUES (?, ?, ?)", rows)
+            except sqlite3.Error as e:
+                logger.warning("Caching %d deferred entries in %s failed: %s", len(rows), self.path, e)
+
+    def invalidate(self, expression):
+        key = normalize_expression(expression)
+        with self._lock:
+            self._preloaded.pop(key, None)
+        with self._db_lock, self._db:
+            self._pending.pop(key, None)
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._preloaded.clear()
+        with self._db_lock, self._db:
+            self._pending.clear()
+            self._db.execute("DELETE FROM results")
+
+    def stats(self):
+        """
+        Return hit/miss/eviction counters and the current size.
+        """
+        with self._lock:
+            counters = {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+        counters['size'] = len(self)
+        counters['preloaded'] = len(self._preloaded)
+        return counters
+
+    def close(self):
+        """
+        Close the connection, after any background compaction has finished.
+        """
+        self.wait_for_compaction()
+        with self._db_lock:
+            self._db.close()
+
+    def __len__(self):
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,87 @@
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Timings of the connection work done by the current thread since the last take
+_state = threading.local()
+
+
+def take_connection_timing():
+    """
+    Return and reset the connection timings recorded on this thread.
+
+    Returns:
+        dict: 'connect' (seconds spent opening connections, 0.0 if none were opened),
+        'ttfb' (seconds from sending the last request to its response headers, or None)
+        and 'reused' (whether the last request went over an existing connection, or None)
+    """
+    timing = {
+        'connect': getattr(_state, 'connect', 0.0),
+        'ttfb': getattr(_state, 'ttfb', None),
+        'reused': getattr(_state, 'reused', None),
+    }
+    _state.connect = 0.0
+    _state.ttfb = None
+    _state.reused = None
+    return timing
+
+
+class _TimedConnectionMixin:
+    """
+    Record connect time, time to first byte and connection reuse in the thread-local state.
+    requests drives a connection from the calling thread, so the state belongs to that call.
+    """
+
+    requests_sent = 0
+    _request_started_at = None
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _state.connect = getattr(_state, 'connect', 0.0) + time.perf_counter() - started_at
+
+    def request(self, *args, **kwargs):
+        _state.reused = self.requests_sent > 0
+        self.requests_sent += 1
+        self._request_started_at = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        if self._request_started_at is not None:
+            _state.ttfb = time.perf_counter() - self._request_started_at
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections record connect time, time to first byte
+    and reuse; read them with take_connection_timing() after each request.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
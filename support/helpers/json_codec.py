@@ -0,0 +1,139 @@
+import importlib
+import importlib.util
+import json
+from functools import lru_cache
+
+# Libraries tried by get_decoder('auto') and get_encoder('auto'), fastest first;
+# the third-party ones are optional
+AUTO_DECODERS = ('orjson', 'ujson', 'json')
+
+
+class RawJSON:
+    """
+    An undecoded JSON response body, kept as the bytes received.
+
+    Returned by the 'raw' decoder (load_raw) so results that are only forwarded (e.g.
+    written to a JSONL file) skip decoding and re-encoding; loads() decodes on demand.
+    """
+
+    __slots__ = ('body',)
+
+    def __init__(self, body):
+        self.body = bytes(body)
+
+    def __bytes__(self):
+        return self.body
+
+    def __eq__(self, other):
+        return isinstance(other, RawJSON) and other.body == self.body
+
+    def __hash__(self):
+        return hash(self.body)
+
+    def __repr__(self):
+        return f"RawJSON({self.body!r})"
+
+    def loads(self):
+        return json.loads(self.body)
+
+    def compact(self):
+        """
+        The body on a single line, safe to embed in JSONL. JSON strings cannot contain raw
+        line breaks, so any present are insignificant whitespace.
+        """
+        body = self.body
+        if b'\n' in body or b'\r' in body:
+            body = body.replace(b'\r', b' ').replace(b'\n', b' ')
+        return body
+
+
+# Closing bracket expected for each opening one of a JSON object or array body
+_RAW_BRACKETS = {ord('{'): ord('}'), ord('['): ord(']')}
+
+
+@lru_cache(maxsize=None)
+def _validating_loads():
+    """
+    orjson.loads if orjson is installed (fast enough to validate forwarded bodies), else None.
+    """
+    if importlib.util.find_spec('orjson') is None:
+        return None
+    return importlib.import_module('orjson').loads
+
+
+def load_raw(body):
+    """
+    The 'raw' decoder: keep a JSON object or array body as RawJSON.
+
+    The body is only checked structurally (non-empty, enclosed in matching brackets),
+    and parsed with orjson when it is installed, so an HTML error page or a truncated
+    body is rejected instead of being forwarded.
+
+    Raises:
+        ValueError: If the body is not a JSON object or array
+    """
+    stripped = bytes(body).strip()
+    if not stripped or _RAW_BRACKETS.get(stripped[0]) != stripped[-1]:
+        raise ValueError("Response body is not a JSON object or array")
+    loads = _validating_loads()
+    if loads is not None:
+        # orjson.JSONDecodeError is a ValueError
+        loads(stripped)
+    return RawJSON(body)
+
+
+def available_decoders():
+    """
+    Names of the decoders that can be used here, in AUTO_DECODERS order, plus 'raw'.
+    """
+    names = [name for name in AUTO_DECODERS if name == 'json' or importlib.util.find_spec(name) is not None]
+    return names + ['raw']
+
+
+def _import(name):
+    if name == 'auto':
+        name = available_decoders()[0]
+    if name not in AUTO_DECODERS:
+        raise ValueError(f"Unknown JSON library '{name}'; expected auto or {', '.join(AUTO_DECODERS)}")
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"JSON library '{name}' is not installed") from e
+
+
+def get_decoder(name='auto'):
+    """
+    Return a function turning a JSON body (bytes) into Python objects.
+
+    Args:
+        name: 'auto' (fastest installed library), 'orjson', 'ujson', 'json' or 'raw'
+            (keep the body as RawJSON)
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named library is not installed
+    """
+    if name == 'raw':
+        return load_raw
+    module = _import(name)
+    return module.loads
+
+
+def get_encoder(name='auto'):
+    """
+    Return a function serializing Python objects to compact UTF-8 JSON bytes
+    (non-ASCII characters are kept as-is).
+
+    Args:
+        name: 'auto' (fastest installed library), 'orjson', 'ujson' or 'json'
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named library is not installed
+    """
+    module = _import(name)
+    if module.__name__ == 'orjson':
+        return module.dumps
+    if module.__name__ == 'ujson':
+        return lambda obj: module.dumps(obj, ensure_ascii=False).encode('utf-8')
+    return lambda obj: module.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,138 @@
+import threading
+
+# 2^7 sub-buckets per power of two keeps every recorded value within 1/64 (~1.6%)
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+
+
+def _bucket_index(value):
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return _SUB_BUCKET_COUNT + (shift - 1) * _SUB_BUCKET_HALF + (value >> shift) - _SUB_BUCKET_HALF
+
+
+def _bucket_upper_bound(index):
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift = (index - _SUB_BUCKET_COUNT) // _SUB_BUCKET_HALF + 1
+    top = (index - _SUB_BUCKET_COUNT) % _SUB_BUCKET_HALF + _SUB_BUCKET_HALF
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory log-linear latency histogram (HdrHistogram-style).
+
+    Latencies are recorded in seconds and stored as microsecond buckets with
+    ~1.6% relative precision, so memory does not grow with the number of samples.
+
+    Example:
+        histogram = LatencyHistogram()
+        histogram.record(0.120)
+        histogram.percentile(99)  # seconds
+    """
+
+    def __init__(self, max_seconds=3600):
+        """
+        Args:
+            max_seconds: Largest trackable latency; larger samples are clamped (default: 3600)
+        """
+        if max_seconds <= 0:
+            raise ValueError("max_seconds must be greater than 0")
+
+        self.max_micros = int(max_seconds * 1_000_000)
+        self._counts = [0] * (_bucket_index(self.max_micros) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_micros = 0
+        self.min_micros = None
+        self.max_micros_seen = 0
+
+    def record(self, seconds):
+        """
+        Record one latency sample given in seconds.
+        """
+        micros = min(max(int(seconds * 1_000_000), 0), self.max_micros)
+        index = _bucket_index(micros)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_micros += micros
+            if self.min_micros is None or micros < self.min_micros:
+                self.min_micros = micros
+            if micros > self.max_micros_seen:
+                self.max_micros_seen = micros
+
+    def merge(self, other):
+        """
+        Add all samples from another histogram with the same max_seconds.
+        """
+        if other.max_micros != self.max_micros:
+            raise ValueError("Cannot merge histograms with different max_seconds")
+        with other._lock:
+            counts = list(other._counts)
+            count, total, low, high = other.count, other.total_micros, other.min_micros, other.max_micros_seen
+        with self._lock:
+            for index, bucket_count in enumerate(counts):
+                self._counts[index] += bucket_count
+            self.count += count
+            self.total_micros += total
+            if low is not None and (self.min_micros is None or low < self.min_micros):
+                self.min_micros = low
+            self.max_micros_seen = max(self.max_micros_seen, high)
+
+    def percentile(self, percent):
+        """
+        Return the latency in seconds at or below which `percent` of samples fall.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            # Nearest-rank: the smallest bucket covering ceil(percent% of count) samples
+            rank = max(1, -(-self.count * percent // 100))
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank:
+                    micros = min(_bucket_upper_bound(index), self.max_micros_seen)
+                    return micros / 1_000_000
+        return self.max_micros_seen / 1_000_000
+
+    @property
+    def mean(self):
+        return self.total_micros / self.count / 1_000_000 if self.count else 0.0
+
+    @property
+    def min(self):
+        return (self.min_micros or 0) / 1_000_000
+
+    @property
+    def max(self):
+        return self.max_micros_seen / 1_000_000
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)):
+        """
+        Return count, min/mean/max and the requested percentiles in milliseconds.
+        """
+        summary = {
+            'count': self.count,
+            'min_ms': self.min * 1000,
+            'mean_ms': self.mean * 1000,
+            'max_ms': self.max * 1000,
+        }
+        for percent in percentiles:
+            label = f"p{percent:g}".replace('.', '')
+            summary[f"{label}_ms"] = self.percentile(percent) * 1000
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = 0
+            self.total_micros = 0
+            self.min_micros = None
+            self.max_micros_seen = 0
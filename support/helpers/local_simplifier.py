@@ -0,0 +1,214 @@
+import re
+import threading
+from math import gcd
+from support.constants.api_constants import ApiConstants
+
+# One signed term: optional coefficient, optional x with optional power
+_TERM = re.compile(r'([+-]?)(\d*)(x(?:\^(\d+))?)?')
+
+
+def parse_polynomial(expression, max_degree=3):
+    """
+    Parse a univariate integer polynomial such as "2x^2 + 3x - 5".
+
+    Returns:
+        dict: {power: coefficient} with like terms combined (zero coefficients dropped),
+        or None if the expression is not a polynomial of degree <= max_degree
+    """
+    expression = expression or ''
+    # Whitespace is insignificant except between digits ("2 3" is not 23)
+    if re.search(r'\d\s+\d', expression):
+        return None
+    compact = re.sub(r'\s+', '', expression)
+    if not compact:
+        return None
+
+    coefficients = {}
+    position = 0
+    while position < len(compact):
+        match = _TERM.match(compact, position)
+        sign, digits, variable, power = match.groups()
+        # Every term after the first needs an explicit operator
+        if match.end() == position or (position > 0 and not sign) or not (digits or variable):
+            return None
+
+        coefficient = int(digits) if digits else 1
+        if sign == '-':
+            coefficient = -coefficient
+        if variable is None:
+            exponent = 0
+        elif power is None:
+            exponent = 1
+        else:
+            exponent = int(power)
+            # "x^0" and "x^01" are valid but unusual; leave them to the API
+            if exponent == 0 or power.startswith('0'):
+                return None
+        if exponent > max_degree:
+            return None
+
+        coefficients[exponent] = coefficients.get(exponent, 0) + coefficient
+        position = match.end()
+
+    return {power: coeff for power, coeff in coefficients.items() if coeff != 0}
+
+
+def format_monomial(coefficient, power):
+    """
+    Format one term the way the Newton API does, e.g. "2 x", "x^3", "-x", "7".
+    """
+    if power == 0:
+        return str(coefficient)
+    variable = "x" if power == 1 else f"x^{power}"
+    if coefficient == 1:
+        return variable
+    if coefficient == -1:
+        return f"-{variable}"
+    return f"{coefficient} {variable}"
+
+
+def format_polynomial(coefficients):
+    """
+    Format a polynomial in descending powers, e.g. "x^2 + 2 x - 3".
+    """
+    parts = []
+    for power in sorted(coefficients, reverse=True):
+        coefficient = coefficients[power]
+        if not parts:
+            parts.append(format_monomial(coefficient, power))
+        else:
+            operator_ = '-' if coefficient < 0 else '+'
+            parts.append(f"{operator_} {format_monomial(abs(coefficient), power)}")
+    return ' '.join(parts)
+
+
+def divisors(n):
+    """
+    Return the positive divisors of n > 0.
+    """
+    small, large = [], []
+    d = 1
+    while d * d <= n:
+        if n % d == 0:
+            small.append(d)
+            if d * d != n:
+                large.append(n // d)
+        d += 1
+    return small + large[::-1]
+
+
+def has_rational_root(coefficients, max_coefficient=ApiConstants.LOCAL_MAX_COEFFICIENT,
+                      max_candidates=ApiConstants.LOCAL_MAX_ROOT_CANDIDATES):
+    """
+    Rational root test: True if some p/q with p | a0 and q | an is a root.
+
+    Returns:
+        bool: Whether a rational root exists, or None if the test was not run because
+        a0 or an exceeds max_coefficient or there are more than max_candidates (p, q) pairs
+    """
+    degree = max(coefficients)
+    constant = abs(coefficients.get(0, 0))
+    leading = abs(coefficients[degree])
+    if constant == 0:
+        return True
+    if constant > max_coefficient or leading > max_coefficient:
+        return None
+
+    numerators, denominators = divisors(constant), divisors(leading)
+    if len(numerators) * len(denominators) > max_candidates:
+        return None
+    for p in numerators:
+        for q in denominators:
+            # p/q is a root iff the sum of c * p^k * q^(degree - k) is 0
+            for signed in (p, -p):
+                if sum(c * signed ** power * q ** (degree - power) for power, c in coefficients.items()) == 0:
+                    return True
+    return False
+
+
+class LocalSimplifier:
+    """
+    Offline simplifier for the univariate polynomials produced by ArithmeticExpressionGenerator.
+
+    It combines like terms and factors out a common integer factor and common
+    power of x. Results whose factored form the API might render differently
+    (negative leading coefficient, or a remaining factor with rational roots
+    such as x^2 + 2x + 1) are left to the remote API, as is anything it cannot parse
+    or whose coefficients are too large to test quickly (ApiConstants.LOCAL_MAX_COEFFICIENT).
+
+    Example:
+        engine = LocalSimplifier()
+        engine.simplify("2x + 4")  # {'operation': 'simplify', 'expression': '2x + 4', 'result': '2 (x + 2)'}
+        api = SimplificationAPI(local_engine=engine)
+    """
+
+    def __init__(self, max_degree=3):
+        self.max_degree = max_degree
+        self._lock = threading.Lock()
+        self.local_resolutions = 0
+        self.remote_fallbacks = 0
+
+    def simplify(self, expression):
+        """
+        Return a simplify response for the expression, or None if it must go to the API.
+        """
+        result = self.simplify_to_string(expression)
+        with self._lock:
+            if result is None:
+                self.remote_fallbacks += 1
+            else:
+                self.local_resolutions += 1
+        if result is None:
+            return None
+        return {
+            'operation': 'simplify',
+            'expression': expression,
+            'result': result
+        }
+
+    def simplify_to_string(self, expression):
+        """
+        Return the simplified expression as a string, or None if it is not handled locally.
+        """
+        coefficients = parse_polynomial(expression, self.max_degree)
+        if coefficients is None:
+            return None
+        if not coefficients:
+            return "0"
+
+        degree = max(coefficients)
+        if coefficients[degree] < 0:
+            return None
+        if len(coefficients) == 1:
+            return format_monomial(coefficients[degree], degree)
+
+        # Factor out the common integer factor and the common power of x
+        common_factor = 0
+        for coefficient in coefficients.values():
+            common_factor = gcd(common_factor, coefficient)
+        lowest_power = min(coefficients)
+        remaining = {power - lowest_power: coeff // common_factor for power, coeff in coefficients.items()}
+
+        # A rational root (or coefficients too large to test) leaves the factoring to the API
+        if max(remaining) >= 2 and has_rational_root(remaining) is not False:
+            return None
+
+        factors = []
+        if common_factor > 1:
+            factors.append(str(common_factor))
+        if lowest_power > 0:
+            factors.append(format_monomial(1, lowest_power))
+        if not factors:
+            return format_polynomial(remaining)
+        factors.append(f"({format_polynomial(remaining)})")
+        return ' '.join(factors)
+
+    def stats(self):
+        """
+        Return how many expressions were resolved locally and how many went to the API.
+        """
+        with self._lock:
+            return {
+                'local': self.local_resolutions,
+                'remote': self.remote_fallbacks,
+            }
@@ -0,0 +1,128 @@
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure_logging(level=logging.INFO, fmt=LOG_FORMAT):
+    """
+    Configure the root logger for scripts (the format the clients used to set on import).
+    Library modules never call this; applications do.
+    """
+    logging.basicConfig(level=level, format=fmt)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Pass every `every`-th record below min_level per message template; records at or
+    above min_level always pass. Sampling per template (record.msg, before %-formatting)
+    keeps every kind of per-request message visible at a reduced rate.
+    """
+
+    def __init__(self, every=100, min_level=logging.WARNING):
+        super().__init__()
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.min_level = min_level
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record):
+        if record.levelno >= self.min_level or self.every == 1:
+            return True
+        with self._lock:
+            count = self._counts.get(record.msg, 0)
+            self._counts[record.msg] = count + 1
+            if count % self.every == 0:
+                return True
+            self.dropped += 1
+            return False
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted; the listener thread formats them.
+
+    The stock QueueHandler formats the message on the calling thread. Exception
+    tracebacks are still rendered here so no frames outlive the call.
+    """
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class HotPathLogging:
+    """
+    Low-overhead logging for high request rates.
+
+    Records from `logger_name` are sampled, put on an in-memory queue without being
+    formatted, and written by a background QueueListener, so the calling thread
+    never blocks on I/O. The logger stops propagating to the root logger while
+    active and is restored by stop().
+
+    Example:
+        with HotPathLogging(sample_every=100):
+            api.simplify_batch(expressions)
+    """
+
+    def __init__(self, sample_every=100, level=logging.INFO, handlers=None, logger_name='support', fmt=LOG_FORMAT):
+        """
+        Args:
+            sample_every: Keep one in this many records per message below WARNING (default: 100)
+            level: Level for the logger while active (default: INFO)
+            handlers: Handlers the listener writes to (default: a stderr StreamHandler)
+            logger_name: Logger whose records are routed through the queue (default: 'support')
+            fmt: Format for the default handler
+        """
+        if handlers is None:
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(logging.Formatter(fmt))
+            handlers = [stream_handler]
+
+        self.logger = logging.getLogger(logger_name)
+        self.level = level
+        self.handlers = handlers
+        self.sampler = SamplingFilter(sample_every)
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = DeferredQueueHandler(self.queue)
+        self.queue_handler.addFilter(self.sampler)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._saved = None
+
+    def start(self):
+        if self._saved is not None:
+            return self
+        self._saved = (self.logger.level, self.logger.propagate)
+        self.logger.setLevel(self.level)
+        self.logger.propagate = False
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+        return self
+
+    def stop(self):
+        """
+        Flush queued records, stop the listener thread and restore the logger.
+        """
+        if self._saved is None:
+            return
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        level, propagate = self._saved
+        self.logger.setLevel(level)
+        self.logger.propagate = propagate
+        self._saved = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
@@ -0,0 +1,200 @@
+import logging
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from support.helpers.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Per-request phases recorded as histograms, in seconds
+PHASES = ('queue_wait', 'connect', 'ttfb', 'decode', 'total')
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_METRIC_NAME = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def _escape_label_value(value):
+    # Exposition format: backslash, double quote and line feed are escaped in label values
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+class ClientMetrics:
+    """
+    In-process counters and latency histograms for simplify calls.
+
+    SimplificationAPI(metrics=...) reports one timing record per call:
+    'expression', 'result' (successful calls), 'source' (remote, local, cache, coalesced,
+    stale), 'outcome' (ok, or an error category from error_category: timeout, connection,
+    http_<status>, decode, circuit_open or error), 'status', 'attempts', 'reused_connection' and the
+    PHASES in seconds (None when a phase did not happen). Records go to the
+    histograms and to every hook; collectors add the stats() of other components
+    (cache, retry policy, ...) at export time.
+
+    Example:
+        metrics = ClientMetrics()
+        metrics.add_hook(lambda record: print(record['total']))
+        api = SimplificationAPI(metrics=metrics, cache=ResultCache())
+        ...
+        metrics.write_prometheus("/var/lib/node_exporter/newton.prom")
+    """
+
+    def __init__(self, namespace='newton_client'):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._hooks = []
+        self._collectors = {}
+        self.histograms = {phase: LatencyHistogram() for phase in PHASES}
+        self.requests = {}
+        self.attempts = 0
+        self.connections = {'new': 0, 'reused': 0}
+
+    def add_hook(self, hook):
+        """
+        Call hook(record) for every finished request.
+        """
+        self._hooks.append(hook)
+
+    def add_collector(self, name, stats_fn):
+        """
+        Export the numeric values of stats_fn() as gauges named <namespace>_<name>_<key>.
+        """
+        self._collectors[name] = stats_fn
+
+    def observe(self, record):
+        """
+        Record one finished request.
+        """
+        for phase in PHASES:
+            if record.get(phase) is not None:
+                self.histograms[phase].record(record[phase])
+        key = (record.get('source', 'remote'), record.get('outcome', 'ok'))
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.attempts += record.get('attempts') or 0
+            if record.get('reused_connection') is not None:
+                self.connections['reused' if record['reused_connection'] else 'new'] += 1
+
+        for hook in list(self._hooks):
+            try:
+                hook(record)
+            except Exception as e:
+                logger.error("Metrics hook failed: %s", e)
+
+    def snapshot(self):
+        """
+        Return counters, connection reuse, phase summaries (ms) and collector stats as a dict.
+        """
+        with self._lock:
+            requests_by_source = {f"{source}/{outcome}": count for (source, outcome), count in self.requests.items()}
+            snapshot = {
+                'requests': dict(sorted(requests_by_source.items())),
+                'attempts': self.attempts,
+                'connections': dict(self.connections),
+            }
+        snapshot['phases'] = {phase: histogram.summary() for phase, histogram in self.histograms.items()}
+        snapshot['collectors'] = {name: self._collect(name, stats_fn) for name, stats_fn in self._collectors.items()}
+        return snapshot
+
+    def _collect(self, name, stats_fn):
+        try:
+            return stats_fn()
+        except Exception as e:
+            logger.error("Metrics collector '%s' failed: %s", name, e)
+            return {}
+
+    def prometheus_text(self):
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_requests_total Simplify calls by source and outcome.",
+            f"# TYPE {ns}_requests_total counter",
+        ]
+        with self._lock:
+            for (source, outcome), count in sorted(self.requests.items()):
+                lines.append(f"{ns}_requests_total{_format_labels({'source': source, 'outcome': outcome})} {count}")
+            lines += [
+                f"# HELP {ns}_attempts_total HTTP attempts including retries.",
+                f"# TYPE {ns}_attempts_total counter",
+                f"{ns}_attempts_total {self.attempts}",
+                f"# HELP {ns}_connections_total Requests by whether the pooled connection was reused.",
+                f"# TYPE {ns}_connections_total counter",
+            ]
+            for kind, count in self.connections.items():
+                lines.append(f"{ns}_connections_total{_format_labels({'reused': str(kind == 'reused').lower()})} {count}")
+
+        lines += [
+            f"# HELP {ns}_request_seconds Per-request time spent in each phase.",
+            f"# TYPE {ns}_request_seconds summary",
+        ]
+        for phase, histogram in self.histograms.items():
+            for quantile in (0.5, 0.9, 0.99):
+                labels = _format_labels({'phase': phase, 'quantile': quantile})
+                lines.append(f"{ns}_request_seconds{labels} {histogram.percentile(quantile * 100):.6f}")
+            labels = _format_labels({'phase': phase})
+            lines.append(f"{ns}_request_seconds_sum{labels} {histogram.total_micros / 1_000_000:.6f}")
+            lines.append(f"{ns}_request_seconds_count{labels} {histogram.count}")
+
+        for name, stats_fn in self._collectors.items():
+            for key, value in self._collect(name, stats_fn).items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                metric = _METRIC_NAME.sub('_', f"{ns}_{name}_{key}")
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """
+        Atomically write the exposition text to a file, e.g. for the node_exporter textfile collector.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                handle.write(self.prometheus_text())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def serve_prometheus(self, port=0, host='127.0.0.1'):
+        """
+        Serve the exposition text on http://host:port/metrics from a daemon thread.
+
+        Returns:
+            ThreadingHTTPServer: Call shutdown() to stop it; server_address holds the bound port
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Metrics endpoint: " + format, *args)
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-endpoint', daemon=True).start()
+        logger.info("Serving metrics on http://%s:%d/metrics", host, server.server_address[1])
+        return server
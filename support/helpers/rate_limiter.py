@@ -0,0 +1,208 @@
+import threading
+import time
+from support.constants.api_constants import ApiConstants
+
+# Smoothing factor for the latency baseline; small so one spike barely moves it
+_LATENCY_ALPHA = 0.05
+# Latency spikes are only judged once the baseline has this many samples
+_LATENCY_WARMUP = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`. acquire() reserves
+    a token and sleeps until it is due, so waiting callers are served in arrival order.
+
+    Example:
+        limiter = TokenBucket(rate=20)
+        api = SimplificationAPI(rate_limiter=limiter)
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity, i.e. requests allowed back to back (default: one second's worth)
+            clock: Monotonic time source, overridable for tests
+            sleep: Sleep function, overridable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        burst = burst if burst is not None else max(1, rate)
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self):
+        """
+        Take a token if one is available now; returns False instead of waiting.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.acquired += 1
+            return True
+
+    def acquire(self):
+        """
+        Take a token, sleeping until it is available.
+
+        Returns:
+            float: Seconds waited
+        """
+        with self._lock:
+            self._refill()
+            # Going negative reserves a future token for this caller
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited_seconds += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def stats(self):
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'acquired': self.acquired,
+                'waited_seconds': self.waited_seconds,
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on in-flight requests.
+
+    Each healthy call raises the limit by increase/limit (about +1 per limit's worth of
+    calls, as in TCP congestion avoidance). A dropped call (429/503, timeout) or a call
+    slower than latency_tolerance times the smoothed latency cuts the limit by
+    backoff_ratio, at most once per round trip: calls started before the last cut
+    cannot trigger another one.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+        api = SimplificationAPI(pool_size=64, concurrency_limiter=limiter)
+        api.simplify_batch(expressions, max_workers=64)
+        limiter.stats()['limit']
+    """
+
+    def __init__(self, initial_limit=ApiConstants.CONCURRENCY_INITIAL_LIMIT,
+                 min_limit=ApiConstants.CONCURRENCY_MIN_LIMIT,
+                 max_limit=ApiConstants.CONCURRENCY_MAX_LIMIT,
+                 increase=1.0,
+                 backoff_ratio=ApiConstants.CONCURRENCY_BACKOFF_RATIO,
+                 latency_tolerance=ApiConstants.CONCURRENCY_LATENCY_TOLERANCE,
+                 clock=time.monotonic):
+        """
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase: Limit added per limit's worth of healthy calls
+            backoff_ratio: Factor the limit is multiplied by on overload (0-1)
+            latency_tolerance: Latency spike threshold relative to the smoothed latency; None disables
+            clock: Monotonic time source, overridable for tests
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if latency_tolerance is not None and latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._condition = threading.Condition()
+
+        self._limit = float(initial_limit)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.baseline_latency = None
+        self._samples = 0
+        self._last_decrease_at = None
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    def acquire(self):
+        """
+        Wait for a free slot.
+
+        Returns:
+            float: Start time to pass back to release()
+        """
+        with self._condition:
+            while self.in_flight >= int(self._limit):
+                self._condition.wait()
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return self._clock()
+
+    def release(self, started_at, dropped=False):
+        """
+        Free a slot and adjust the limit from the call's outcome.
+
+        Args:
+            started_at: Value returned by acquire()
+            dropped: True if the upstream shed the call (429/503) or it timed out
+        """
+        now = self._clock()
+        latency = now - started_at
+        with self._condition:
+            self.in_flight -= 1
+            spike = (not dropped and self.latency_tolerance is not None and self._samples >= _LATENCY_WARMUP
+                     and latency > self.baseline_latency * self.latency_tolerance)
+            if not dropped:
+                self._samples += 1
+                self.baseline_latency = latency if self.baseline_latency is None else (
+                    (1 - _LATENCY_ALPHA) * self.baseline_latency + _LATENCY_ALPHA * latency)
+
+            if dropped or spike:
+                if self._last_decrease_at is None or started_at >= self._last_decrease_at:
+                    self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                    self._last_decrease_at = now
+                    self.decreases += 1
+            elif self._limit < self.max_limit:
+                before = int(self._limit)
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+                if int(self._limit) > before:
+                    self.increases += 1
+            self._condition.notify_all()
+
+    def stats(self):
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self.in_flight,
+                'peak_in_flight': self.peak_in_flight,
+                'baseline_latency_ms': (self.baseline_latency or 0.0) * 1000,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
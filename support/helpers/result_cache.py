@@ -0,0 +1,114 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from support.constants.api_constants import ApiConstants
+
+# Whitespace between two operands ("2 3x") separates tokens and must not be dropped
+_WHITESPACE = re.compile(r'(?<=\w)(\s+)(?=\w)|\s+')
+
+
+def normalize_expression(expression):
+    """
+    Build the cache key for an expression.
+    Whitespace around operators is not significant, so "2x+4" and " 2x + 4 " share a key.
+    Whitespace between operands is kept as one space, so "2 3x" and "23x" do not.
+    """
+    return _WHITESPACE.sub(lambda match: ' ' if match.group(1) else '', expression)
+
+
+class ResultCache:
+    """
+    Thread-safe in-memory cache of simplify responses with LRU eviction and TTL.
+
+    Example:
+        cache = ResultCache(max_size=1000, ttl=600)
+        api = SimplificationAPI(cache=cache)
+        ...
+        print(cache.stats())
+    """
+
+    def __init__(self, max_size=ApiConstants.CACHE_MAX_SIZE, ttl=ApiConstants.CACHE_TTL_SECONDS, clock=time.monotonic):
+        """
+        Args:
+            max_size: Maximum number of cached expressions (default: ApiConstants.CACHE_MAX_SIZE)
+            ttl: Seconds an entry stays valid; None disables expiry (default: ApiConstants.CACHE_TTL_SECONDS)
+            clock: Monotonic time source, overridable for tests
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, expression, allow_expired=False):
+        """
+        Return the cached response for an expression, or None on a miss.
+
+        With allow_expired=True an expired entry is still returned (and kept),
+        e.g. to serve stale results while the API is unavailable.
+        """
+        key = normalize_expression(expression)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            response, expires_at = entry
+            if not allow_expired and expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, expression, response):
+        """
+        Store a response, evicting the least recently used entry when full.
+        """
+        key = normalize_expression(expression)
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (response, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, expression):
+        with self._lock:
+            self._entries.pop(normalize_expression(expression), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return hit/miss/eviction counters and the current size.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,349 @@
+import bisect
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import namedtuple
+from support.constants.api_constants import ApiConstants
+
+# File layout (all integers in the byte order of the writing host, recorded in the header):
+#
+#   file header   magic, byte order
+#   chunk*        chunk header: b'CHNK', row count, byte size of each text blob
+#                 status      uint16 per row (0: no HTTP response)
+#                 latency     float64 seconds per row (NaN: unknown)
+#                 expression  uint32 offsets (rows + 1), then UTF-8 blob
+#                 result      uint32 offsets (rows + 1), then UTF-8 blob
+#                 error       uint32 offsets (rows + 1), then UTF-8 blob
+#
+# Every section starts on an 8-byte boundary so it can be viewed in place. Chunks are
+# written whole and only appended; a chunk cut short by a crash is ignored by readers
+# and truncated by the next writer.
+_MAGIC = b'NRSTORE1'
+_FILE_HEADER = struct.Struct('<8sB7x')
+_CHUNK_MAGIC = b'CHNK'
+_CHUNK_HEADER = struct.Struct('=4sI3Q')
+_BYTE_ORDERS = {'little': 0, 'big': 1}
+
+TEXT_COLUMNS = ('expression', 'result', 'error')
+COLUMNS = ('expression', 'result', 'status', 'latency', 'error')
+
+StoredResult = namedtuple('StoredResult', COLUMNS)
+
+
+def _padded(length):
+    return (length + 7) & ~7
+
+
+def _layout(rows, blob_sizes):
+    """
+    Return ([(offset, length) per section], chunk length), offsets relative to the chunk.
+    """
+    lengths = [rows * 2, rows * 8]
+    for blob_size in blob_sizes:
+        lengths += [(rows + 1) * 4, blob_size]
+    sections = []
+    position = _CHUNK_HEADER.size
+    for length in lengths:
+        sections.append((position, length))
+        position += _padded(length)
+    return sections, position
+
+
+def _check_header(data, path):
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError(f"{path} is not a result store")
+    magic, byte_order = _FILE_HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a result store")
+    if byte_order != _BYTE_ORDERS[sys.byteorder]:
+        raise ValueError(f"{path} was written on a host with a different byte order")
+
+
+def _scan(data):
+    """
+    Return ([(offset, rows, blob_sizes) per complete chunk], end of the last complete chunk).
+    """
+    chunks = []
+    offset = _FILE_HEADER.size
+    while offset + _CHUNK_HEADER.size <= len(data):
+        magic, rows, *blob_sizes = _CHUNK_HEADER.unpack_from(data, offset)
+        if magic != _CHUNK_MAGIC:
+            break
+        _, length = _layout(rows, blob_sizes)
+        if offset + length > len(data):
+            break
+        chunks.append((offset, rows, blob_sizes))
+        offset += length
+    return chunks, offset
+
+
+class ResultStoreWriter:
+    """
+    Append-only writer for batch results in a chunked, columnar file.
+
+    Rows are buffered and written as one chunk every chunk_rows rows (and on flush/close),
+    so a run can be read back, or resumed by appending, while it is in progress.
+    Thread-safe; observe() can be registered as a ClientMetrics hook:
+
+    Example:
+        with ResultStoreWriter("results.nrs") as store:
+            metrics = ClientMetrics()
+            metrics.add_hook(store.observe)
+            with SimplificationAPI(metrics=metrics) as api:
+                for _ in api.simplify_batch_unordered(expressions):
+                    pass
+    """
+
+    def __init__(self, path, chunk_rows=ApiConstants.RESULT_STORE_CHUNK_ROWS):
+        """
+        Args:
+            path: Store file; created if missing, appended to otherwise
+            chunk_rows: Rows per chunk (default: ApiConstants.RESULT_STORE_CHUNK_ROWS)
+
+        Raises:
+            ValueError: If chunk_rows is not positive or path is not a result store
+        """
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be greater than 0")
+        self.path = str(path)
+        self.chunk_rows = chunk_rows
+        self._lock = threading.Lock()
+        self._file = self._open(self.path)
+        self._reset_buffers()
+
+    @staticmethod
+    def _open(path):
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            handle = open(path, 'wb')
+            handle.write(_FILE_HEADER.pack(_MAGIC, _BYTE_ORDERS[sys.byteorder]))
+            handle.flush()
+            return handle
+
+        handle = open(path, 'r+b')
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            _check_header(data, path)
+            _, end = _scan(data)
+        # Drop a chunk left incomplete by an interrupted writer
+        handle.truncate(end)
+        handle.seek(end)
+        return handle
+
+    def _reset_buffers(self):
+        self._status = array('H')
+        self._latency = array('d')
+        self._text = {name: [] for name in TEXT_COLUMNS}
+
+    def append(self, expression, result=None, status=None, latency=None, error=None):
+        """
+        Add one row. Missing status is stored as 0, missing latency as NaN, and empty
+        text as None.
+        """
+        with self._lock:
+            self._text['expression'].append(expression)
+            self._text['result'].append(result)
+            self._text['error'].append(error)
+            self._status.append(status or 0)
+            self._latency.append(math.nan if latency is None else latency)
+            if len(self._status) >= self.chunk_rows:
+                self._write_chunk()
+
+    def observe(self, record):
+        """
+        ClientMetrics hook: store a finished call's expression, result, status, total time and error.
+        """
+        self.append(record.get('expression'), record.get('result'), record.get('status'),
+                    record.get('total'), record.get('error'))
+
+    def _write_chunk(self):
+        rows = len(self._status)
+        if not rows:
+            return
+        sections = [self._status.tobytes(), self._latency.tobytes()]
+        blob_sizes = []
+        for name in TEXT_COLUMNS:
+            encoded = [value.encode('utf-8') if value else b'' for value in self._text[name]]
+            offsets = array('I', [0])
+            total = 0
+            for value in encoded:
+                total += len(value)
+                offsets.append(total)
+            if total > 0xFFFFFFFF:
+                raise ValueError(f"{name} column exceeds 4 GiB in one chunk; lower chunk_rows")
+            sections += [offsets.tobytes(), b''.join(encoded)]
+            blob_sizes.append(total)
+
+        parts = [_CHUNK_HEADER.pack(_CHUNK_MAGIC, rows, *blob_sizes)]
+        for section in sections:
+            parts += [section, b'\0' * (_padded(len(section)) - len(section))]
+        self._file.write(b''.join(parts))
+        self._file.flush()
+        self._reset_buffers()
+
+    def flush(self):
+        """
+        Write buffered rows as a chunk so readers can see them.
+        """
+        with self._lock:
+            self._write_chunk()
+
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_chunk()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TextColumn:
+    """
+    Strings of one chunk column, decoded on access from the mapped file.
+    """
+
+    __slots__ = ('offsets', 'blob')
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("row index out of range")
+        index %= len(self)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return str(self.blob[start:end], 'utf-8') if end > start else None
+
+    def __iter__(self):
+        offsets, blob = self.offsets, self.blob
+        for index in range(len(self)):
+            start, end = offsets[index], offsets[index + 1]
+            yield str(blob[start:end], 'utf-8') if end > start else None
+
+
+class StoreChunk:
+    """
+    One chunk of a ResultStore. status and latency are memoryviews of the mapped file
+    (formats 'H' and 'd'), usable without copying, e.g. numpy.frombuffer(chunk.latency).
+    """
+
+    def __init__(self, data, offset, rows, blob_sizes):
+        sections, _ = _layout(rows, blob_sizes)
+        views = [data[offset + start:offset + start + length] for start, length in sections]
+        self.rows = rows
+        self.status = views[0].cast('H')
+        self.latency = views[1].cast('d')
+        self.expression, self.result, self.error = (
+            TextColumn(views[i].cast('I'), views[i + 1]) for i in (2, 4, 6))
+        self._views = views
+
+    def __len__(self):
+        return self.rows
+
+    def column(self, name):
+        if name not in COLUMNS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def release(self):
+        for view in (self.status, self.latency, self.expression.offsets, self.result.offsets,
+                     self.error.offsets, *self._views):
+            view.release()
+
+
+class ResultStore:
+    """
+    Read-only, memory-mapped access to a store written by ResultStoreWriter.
+
+    Nothing is loaded up front: rows and columns are read from the mapping as they
+    are accessed, so stores far larger than RAM can be scanned.
+
+    Example:
+        with ResultStore("results.nrs") as store:
+            errors = sum(1 for error in store.column('error') if error)
+            slow = [row.expression for row in store if row.latency > 1.0]
+    """
+
+    def __init__(self, path):
+        """
+        Raises:
+            ValueError: If path is not a result store
+        """
+        self.path = str(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a result store")
+        try:
+            _check_header(self._mmap, self.path)
+        except ValueError:
+            self.close()
+            raise
+        self._data = memoryview(self._mmap)
+        chunks, _ = _scan(self._mmap)
+        self.chunks = [StoreChunk(self._data, *chunk) for chunk in chunks]
+        self._starts = []
+        total = 0
+        for chunk in self.chunks:
+            self._starts.append(total)
+            total += chunk.rows
+        self._rows = total
+
+    def __len__(self):
+        return self._rows
+
+    def __getitem__(self, index):
+        if not -self._rows <= index < self._rows:
+            raise IndexError("row index out of range")
+        index %= self._rows
+        position = bisect.bisect_right(self._starts, index) - 1
+        chunk, row = self.chunks[position], index - self._starts[position]
+        return StoredResult(chunk.expression[row], chunk.result[row], chunk.status[row],
+                            chunk.latency[row], chunk.error[row])
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from map(StoredResult, chunk.expression, chunk.result, chunk.status,
+                           chunk.latency, chunk.error)
+
+    def column(self, name):
+        """
+        Iterate over one column across all chunks.
+
+        Raises:
+            KeyError: If name is not one of COLUMNS
+        """
+        if name not in COLUMNS:
+            raise KeyError(name)
+        for chunk in self.chunks:
+            yield from chunk.column(name)
+
+    def close(self):
+        for chunk in getattr(self, 'chunks', ()):
+            chunk.release()
+        self.chunks = []
+        if getattr(self, '_data', None) is not None:
+            self._data.release()
+            self._data = None
+        if getattr(self, '_mmap', None) is not None and not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
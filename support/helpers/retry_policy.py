@@ -0,0 +1,186 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from support.constants.api_constants import ApiConstants
+
+
+def parse_retry_after(value, now=None):
+    """
+    Parse a Retry-After header given as delay-seconds or an HTTP date.
+
+    Returns:
+        float: Seconds to wait (never negative), or None if the value is missing or invalid
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries to a fraction of request volume.
+
+    Every completed request deposits `ratio` tokens and every retry withdraws one,
+    so in steady state retries add at most `ratio` extra load; `max_tokens` is the
+    burst allowance (and the starting balance). During an outage the balance runs
+    out and failed requests stop being retried.
+    """
+
+    def __init__(self, ratio=ApiConstants.RETRY_BUDGET_RATIO, max_tokens=ApiConstants.RETRY_BUDGET_MAX_TOKENS):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self):
+        """
+        Take one token for a retry; returns False if the budget is exhausted.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is retried.
+
+    Timeouts, connection errors and responses with a retryable status are retried
+    with capped exponential backoff and full jitter, or after the server's
+    Retry-After delay when one is sent. A shared RetryBudget stops retries from
+    amplifying load during an outage.
+
+    Example:
+        policy = RetryPolicy(max_attempts=4)
+        api = SimplificationAPI(retry_policy=policy)
+        api.simplify_batch(expressions)
+        policy.stats()  # {'requests': ..., 'retries': ..., 'attempts_per_request': {1: ..., 2: ...}}
+    """
+
+    def __init__(self, max_attempts=ApiConstants.RETRY_MAX_ATTEMPTS,
+                 backoff_base=ApiConstants.RETRY_BACKOFF_BASE_SECONDS,
+                 backoff_max=ApiConstants.RETRY_BACKOFF_MAX_SECONDS,
+                 retry_statuses=ApiConstants.RETRY_STATUSES,
+                 retry_exceptions=None,
+                 max_retry_after=ApiConstants.RETRY_AFTER_MAX_SECONDS,
+                 budget=None, sleep=time.sleep, rng=None):
+        """
+        Args:
+            max_attempts: Total attempts per request including the first (default: 3)
+            backoff_base: Backoff ceiling for the first retry in seconds, doubled per retry
+            backoff_max: Upper bound for the backoff ceiling in seconds
+            retry_statuses: HTTP status codes worth retrying (default: 429 and 5xx gateway errors)
+            retry_exceptions: Exception classes worth retrying (default: requests Timeout and ConnectionError)
+            max_retry_after: Give up instead of honoring a longer Retry-After (seconds)
+            budget: RetryBudget shared by all requests; a default one is created if None
+            sleep: Sleep function, overridable for tests
+            rng: random.Random used for jitter, overridable for tests
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must be non-negative")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        if retry_exceptions is None:
+            import requests
+            retry_exceptions = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.sleep = sleep
+        self.random = rng or random.Random()
+
+        self._lock = threading.Lock()
+        self.attempts_per_request = {}
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def is_retryable(self, error, status_code=None):
+        if status_code is not None:
+            return status_code in self.retry_statuses
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, attempt):
+        """
+        Full-jitter backoff after the given failed attempt: uniform in [0, min(max, base * 2^(attempt-1))].
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return self.random.uniform(0, ceiling)
+
+    def retry_delay(self, attempt, error, status_code=None, retry_after=None):
+        """
+        Return how long to wait before retrying a failed attempt, or None to give up.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+            error: The requests exception raised by the attempt
+            status_code: HTTP status of the response, if one was received
+            retry_after: Raw Retry-After header value, if any
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error, status_code):
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(attempt)
+        elif delay > self.max_retry_after:
+            return None
+
+        if not self.budget.withdraw():
+            with self._lock:
+                self.budget_exhausted += 1
+            return None
+        with self._lock:
+            self.retries += 1
+        return delay
+
+    def record_attempts(self, attempts):
+        """
+        Record how many attempts a finished request took and refill the budget.
+        """
+        self.budget.deposit()
+        with self._lock:
+            self.attempts_per_request[attempts] = self.attempts_per_request.get(attempts, 0) + 1
+
+    def stats(self):
+        """
+        Return request, attempt and retry counts plus the attempts-per-request distribution.
+        """
+        with self._lock:
+            requests_count = sum(self.attempts_per_request.values())
+            attempts = sum(n * count for n, count in self.attempts_per_request.items())
+            return {
+                'requests': requests_count,
+                'attempts': attempts,
+                'retries': self.retries,
+                'budget_exhausted': self.budget_exhausted,
+                'mean_attempts': attempts / requests_count if requests_count else 0.0,
+                'attempts_per_request': dict(sorted(self.attempts_per_request.items())),
+            }
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution (threaded callers).
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait and receive the same result or exception.
+
+    Example:
+        flight = SingleFlight()
+        result, shared = flight.do(key, lambda: fetch(key))
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """
+        Run fn() unless a call for key is already in flight, then wait for that one.
+
+        Returns:
+            tuple: (result, shared) where shared is True if the result came from another caller
+
+        Raises:
+            Exception: Whatever fn() raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.event.set()
+        else:
+            call.event.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
+
+    def stats(self):
+        """
+        Return how many calls were executed and how many were collapsed into them.
+        """
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight for callers on one event loop.
+
+    Example:
+        flight = AsyncSingleFlight()
+        result, shared = await flight.do(key, lambda: fetch(key))
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key, coroutine_fn):
+        """
+        Await coroutine_fn() unless a call for key is already in flight, then await that one.
+
+        Returns:
+            tuple: (result, shared) where shared is True if the result came from another caller
+
+        Raises:
+            Exception: Whatever coroutine_fn() raised, re-raised in every waiting caller
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # Shield so a cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executed += 1
+        try:
+            result = await coroutine_fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[key]
+
+    def stats(self):
+        """
+        Return how many calls were executed and how many were collapsed into them.
+        """
+        return {
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._calls),
+        }
@@ -0,0 +1,31 @@
+"""
+In-process requests transport answering every request with a canned simplify response.
+
+Mounted with SimplificationAPI(transport=EchoAdapter()), requests never reach a socket,
+so benchmarks measure the client's own per-call cost.
+"""
+
+import json
+import requests
+from requests.adapters import BaseAdapter
+
+RESPONSE_BODY = json.dumps({'operation': 'simplify', 'expression': 'x', 'result': 'x'}).encode()
+
+
+class EchoAdapter(BaseAdapter):
+    """Answer every request in-process with a canned simplify response."""
+
+    def __init__(self, body=RESPONSE_BODY):
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Newton API simplify route with latency and fault injection.
+
+Implements GET /api/v2/simplify/<expression> on a stdlib asyncio HTTP/1.1 server
+(keep-alive, no thread per connection), answering from a fixture table, then the
+LocalSimplifier, then by echoing the expression back.
+
+Usage:
+    python -m support.mocks.newton_stub_server --port 8001 --latency lognormal:0.05:0.5 --error-rate 0.01 --throttle-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from urllib.parse import unquote
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from support.constants.api_constants import ApiConstants
+from support.helpers.local_simplifier import LocalSimplifier
+
+logger = logging.getLogger(__name__)
+
+SIMPLIFY_PREFIX = f"/api/{ApiConstants.API_VERSION}{ApiConstants.SIMPLIFY_URL}/"
+
+_REASONS = {
+    200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed', 429: 'Too Many Requests',
+    500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+# Largest request head accepted before the connection is dropped
+_MAX_HEAD_BYTES = 64 * 1024
+
+
+class LatencyDistribution:
+    """
+    Response delay in seconds drawn from a named distribution.
+
+    Specs: "none", "fixed:<s>", "uniform:<low>:<high>", "exponential:<mean>",
+    "lognormal:<median>:<sigma>".
+    """
+
+    KINDS = ('none', 'fixed', 'uniform', 'exponential', 'lognormal')
+
+    def __init__(self, kind='none', *params):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}'; expected one of {', '.join(self.KINDS)}")
+        expected = {'none': 0, 'fixed': 1, 'uniform': 2, 'exponential': 1, 'lognormal': 2}[kind]
+        if len(params) != expected:
+            raise ValueError(f"Latency distribution '{kind}' takes {expected} parameter(s)")
+        if any(param < 0 for param in params):
+            raise ValueError("Latency parameters must be non-negative")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec):
+        kind, *params = spec.split(':')
+        return cls(kind, *(float(param) for param in params))
+
+    def sample(self, rng):
+        if self.kind == 'none':
+            return 0.0
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'exponential':
+            mean = self.params[0]
+            return rng.expovariate(1 / mean) if mean > 0 else 0.0
+        median, sigma = self.params
+        return rng.lognormvariate(0, sigma) * median
+
+    def __repr__(self):
+        return ':'.join([self.kind] + [f"{param:g}" for param in self.params])
+
+
+class FaultConfig:
+    """
+    Fault injection settings. Rates are per-request probabilities between 0 and 1.
+    """
+
+    def __init__(self, latency=None, error_rate=0.0, error_status=503, throttle_rate=0.0,
+                 retry_after=1, slow_rate=0.0, slow_chunk_delay=0.5):
+        """
+        Args:
+            latency: LatencyDistribution (or spec string) applied before every response
+            error_rate: Probability of answering with error_status
+            error_status: Status code used for injected errors (default: 503)
+            throttle_rate: Probability of answering 429 with a Retry-After header
+            retry_after: Retry-After value in seconds for 429 responses (default: 1)
+            slow_rate: Probability of a slow-loris response, trickled out one byte at a time
+            slow_chunk_delay: Seconds between bytes of a slow response (default: 0.5)
+        """
+        for name, rate in (('error_rate', error_rate), ('throttle_rate', throttle_rate), ('slow_rate', slow_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if error_rate + throttle_rate > 1:
+            raise ValueError("error_rate + throttle_rate must not exceed 1")
+        if isinstance(latency, str):
+            latency = LatencyDistribution.parse(latency)
+
+        self.latency = latency or LatencyDistribution()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.slow_rate = slow_rate
+        self.slow_chunk_delay = slow_chunk_delay
+
+
+class NewtonStubServer:
+    """
+    Newton simplify endpoint served from a background event loop thread.
+
+    Example:
+        with NewtonStubServer(faults=FaultConfig(latency="fixed:0.05", throttle_rate=0.1)) as server:
+            api = SimplificationAPI(base_url=server.base_url)
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, fixtures=None, faults=None, local_engine=None, seed=None):
+        """
+        Args:
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one (default: 0)
+            fixtures: {expression: response dict or result string} answered verbatim
+            faults: FaultConfig for latency and error injection (default: no faults)
+            local_engine: LocalSimplifier used when an expression has no fixture
+            seed: Seed for fault and latency sampling (default: None)
+        """
+        self.host = host
+        self.port = port
+        self.fixtures = dict(fixtures or {})
+        self.faults = faults or FaultConfig()
+        self.local_engine = local_engine or LocalSimplifier()
+        self.rng = random.Random(seed)
+
+        self.stats = {'requests': 0, 'connections': 0}
+        self._loop = None
+        self._server = None
+        self._task = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/api/"
+
+    def respond(self, expression):
+        """
+        Build the simplify response body for an expression.
+        """
+        fixture = self.fixtures.get(expression)
+        if isinstance(fixture, dict):
+            return fixture
+        if fixture is not None:
+            result = fixture
+        else:
+            result = self.local_engine.simplify_to_string(expression)
+            if result is None:
+                result = expression
+        return {'operation': 'simplify', 'expression': expression, 'result': result}
+
+    def _count(self, key):
+        self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _route(self, method, path):
+        """
+        Decide status, extra headers and body for a request, applying injected faults.
+        """
+        if method != 'GET':
+            return 405, {}, {'error': 'Method not allowed'}
+        if not path.startswith(SIMPLIFY_PREFIX):
+            return 404, {}, {'error': 'Not found'}
+
+        roll = self.rng.random()
+        if roll < self.faults.throttle_rate:
+            return 429, {'Retry-After': str(self.faults.retry_after)}, {'error': 'Too many requests'}
+        if roll < self.faults.throttle_rate + self.faults.error_rate:
+            return self.faults.error_status, {}, {'error': 'Injected failure'}
+
+        expression = unquote(path[len(SIMPLIFY_PREFIX):].split('?', 1)[0])
+        return 200, {}, self.respond(expression)
+
+    async def _handle_connection(self, reader, writer):
+        self._count('connections')
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, path, version = lines[0].split(' ', 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                # Discard any request body so the next request on this connection parses cleanly
+                length = int(headers.get('content-length', 0) or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                self._count('requests')
+                delay = self.faults.latency.sample(self.rng)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                status, extra_headers, body = self._route(method, path)
+                self._count(f"status_{status}")
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                payload = self._render(status, extra_headers, body, keep_alive)
+
+                if self.faults.slow_rate and self.rng.random() < self.faults.slow_rate:
+                    self._count('slow_responses')
+                    for index in range(len(payload)):
+                        writer.write(payload[index:index + 1])
+                        await writer.drain()
+                        await asyncio.sleep(self.faults.slow_chunk_delay)
+                else:
+                    writer.write(payload)
+                    await writer.drain()
+
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _render(status, extra_headers, body, keep_alive):
+        content = json.dumps(body, separators=(',', ':')).encode('utf-8')
+        header_lines = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(content)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        header_lines.extend(f"{name}: {value}" for name, value in extra_headers.items())
+        return ('\r\n'.join(header_lines) + '\r\n\r\n').encode('latin-1') + content
+
+    async def serve(self):
+        """
+        Serve until cancelled; use this directly when already inside an event loop.
+        """
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=_MAX_HEAD_BYTES, backlog=1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self):
+        """
+        Start serving on a background thread and wait until the port is bound.
+        """
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._task = self._loop.create_task(self.serve())
+            try:
+                self._loop.run_until_complete(self._task)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                # Close connections that are still open (keep-alive clients, slow responses)
+                pending = asyncio.all_tasks(self._loop)
+                for task in pending:
+                    task.cancel()
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='newton-stub-server', daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10):
+            raise RuntimeError("Newton stub server did not start")
+        logger.info("Newton stub server listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+def load_fixtures(path):
+    """
+    Load a fixture table from JSON: {expression: response dict or result string}.
+    """
+    with open(path, encoding='utf-8') as handle:
+        fixtures = json.load(handle)
+    if not isinstance(fixtures, dict):
+        raise ValueError(f"Fixture file {path} must contain a JSON object")
+    return fixtures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Newton simplify API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--fixtures', help="JSON file mapping expressions to responses or results")
+    parser.add_argument('--latency', default='none', help="none | fixed:S | uniform:LO:HI | exponential:MEAN | lognormal:MEDIAN:SIGMA")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="probability of a 429 response")
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--slow-rate', type=float, default=0.0, help="probability of a slow-loris response")
+    parser.add_argument('--slow-chunk-delay', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    faults = FaultConfig(
+        latency=args.latency, error_rate=args.error_rate, error_status=args.error_status,
+        throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+        slow_rate=args.slow_rate, slow_chunk_delay=args.slow_chunk_delay
+    )
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else None
+    server = NewtonStubServer(args.host, args.port, fixtures=fixtures, faults=faults, seed=args.seed)
+    print(f"Serving Newton stub on http://{args.host}:{args.port}/api/ (latency={faults.latency})")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+from support.helpers.api_helper import ApiHelper
+from support.helpers.data_generator import ArithmeticExpressionGenerator
+from support.helpers.result_cache import normalize_expression
+from support.constants.api_constants import ApiConstants
+from support.page_objects.api.simplification_api import (
+    validate_generation_params,
+    clean_expression,
+    map_request_error,
+    build_shared_result
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+class AsyncSimplificationAPI:
+    """
+    asyncio counterpart of SimplificationAPI built on aiohttp.
+
+    Results have the same shape as the blocking client and transport errors are
+    raised as requests.RequestException with the same messages.
+
+    Example:
+        async with AsyncSimplificationAPI() as api:
+            async for result in api.simplify_many(expressions, concurrency=200):
+                print(result['response']['result'])
+    """
+
+    def __init__(self, base_url=None, pool_size=ApiConstants.ASYNC_POOL_SIZE, session=None, single_flight=None,
+                 local_engine=None):
+        """
+        Args:
+            base_url: Override for ApiConstants.BASE_URL (default: None)
+            pool_size: Maximum number of open connections (default: ApiConstants.ASYNC_POOL_SIZE)
+            session: Existing aiohttp.ClientSession to use; it is not closed by close()
+            single_flight: Optional AsyncSingleFlight that collapses concurrent requests for the same expression
+            local_engine: Optional LocalSimplifier tried before the network
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncSimplificationAPI requires aiohttp (pip install aiohttp)")
+        if pool_size <= 0:
+            raise ValueError("pool_size must be greater than 0")
+
+        self.api_helper = ApiHelper(base_url)
+        self.expression_generator = ArithmeticExpressionGenerator()
+        self.pool_size = pool_size
+        self.single_flight = single_flight
+        self.local_engine = local_engine
+        self._owns_session = session is None
+        # aiohttp sessions must be created inside a running event loop
+        self.session = session
+        logger.info("AsyncSimplificationAPI initialized successfully")
+
+    def _get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=ApiConstants.TIMEOUT/1000)
+            )
+        return self.session
+
+    async def close(self):
+        """
+        Close pooled connections. Sessions passed in by the caller are left open.
+        """
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+            logger.info("AsyncSimplificationAPI session closed")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
+
+    async def simplify_generated_expression(self, num_terms=3, min_value=1, max_value=20):
+        """
+        Generate a random algebraic expression and send it to the simplify endpoint.
+
+        Args:
+            num_terms: Number of terms in the expression (default: 3)
+            min_value: Minimum value for coefficients (default: 1)
+            max_value: Maximum value for coefficients (default: 20)
+
+        Returns:
+            dict: API response containing the simplified expression
+
+        Raises:
+            ValueError: If invalid parameters are provided
+            requests.RequestException: If API request fails
+        """
+        validate_generation_params(num_terms, min_value, max_value)
+        expression = self.expression_generator.generate_expression(num_terms, min_value, max_value)
+        logger.info("Generated expression: %s", expression)
+        return await self._simplify(expression)
+
+    async def simplify_custom_expression(self, expression):
+        """
+        Send a custom expression to the simplify endpoint.
+
+        Args:
+            expression: The algebraic expression to simplify
+
+        Returns:
+            dict: API response containing the simplified expression
+
+        Raises:
+            ValueError: If expression is None or empty
+            requests.RequestException: If API request fails
+        """
+        expression = clean_expression(expression)
+        return await self._simplify(expression)
+
+    async def simplify_many(self, expressions, concurrency=ApiConstants.ASYNC_CONCURRENCY, return_exceptions=False):
+        """
+        Simplify many expressions concurrently, yielding results as they complete.
+
+        The input is consumed lazily, so at most `concurrency` requests are in
+        flight and only that many expressions are held in memory at once.
+
+        Args:
+            expressions: Iterable of expressions to simplify
+            concurrency: Maximum number of requests in flight (default: ApiConstants.ASYNC_CONCURRENCY)
+            return_exceptions: Yield {'original_expression', 'error'} for failed items
+                instead of raising (default: False)
+
+        Yields:
+            dict: Result for each expression, in completion order
+
+        Raises:
+            ValueError: If concurrency is not positive, or an expression is invalid
+                and return_exceptions is False
+            requests.RequestException: If a request fails and return_exceptions is False
+        """
+        import requests
+
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than 0")
+
+        expressions = iter(expressions)
+        pending = {}
+
+        def schedule_next():
+            for expression in expressions:
+                task = asyncio.ensure_future(self.simplify_custom_expression(expression))
+                pending[task] = expression
+                return True
+            return False
+
+        try:
+            while len(pending) < concurrency and schedule_next():
+                pass
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    expression = pending.pop(task)
+                    schedule_next()
+                    error = task.exception()
+                    if error is None:
+                        yield task.result()
+                    elif return_exceptions and isinstance(error, (ValueError, requests.RequestException)):
+                        yield {'original_expression': expression, 'error': error}
+                    else:
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _simplify(self, expression):
+        if self.local_engine is not None:
+            local_response = self.local_engine.simplify(expression)
+            if local_response is not None:
+                return {
+                    'original_expression': expression,
+                    'response': local_response
+                }
+
+        if self.single_flight is None:
+            return await self._send_simplify_request(expression)
+
+        result, shared = await self.single_flight.do(
+            normalize_expression(expression),
+            lambda: self._send_simplify_request(expression)
+        )
+        return build_shared_result(expression, result['response']) if shared else result
+
+    async def _send_simplify_request(self, expression):
+        """
+        Send a validated expression to the simplify endpoint.
+
+        aiohttp failures are translated to their requests equivalents and then
+        mapped exactly as in the blocking client.
+        """
+        import requests
+
+        endpoint = f"{ApiConstants.SIMPLIFY_URL}/{expression}"
+        url = self.api_helper.build_url(endpoint)
+        headers = self.api_helper.build_headers()
+        logger.debug("Sending GET request to %s", url)
+
+        status_code = None
+        try:
+            async with self._get_session().get(url, headers=headers) as response:
+                status_code = response.status
+                response.raise_for_status()
+                response_data = await response.json(content_type=None)
+        except asyncio.TimeoutError as e:
+            raise map_request_error(requests.exceptions.Timeout(str(e)), expression) from e
+        except aiohttp.ClientResponseError as e:
+            error = requests.exceptions.HTTPError(str(e))
+            raise map_request_error(error, expression, status_code) from e
+        except aiohttp.ClientConnectionError as e:
+            error = requests.exceptions.ConnectionError(str(e))
+            raise map_request_error(error, expression) from e
+        except (aiohttp.ClientError, ValueError) as e:
+            raise map_request_error(requests.RequestException(str(e)), expression) from e
+
+        logger.debug("Successfully received response for expression: %s", expression)
+
+        return {
+            'original_expression': expression,
+            'response': response_data
+        }
@@ -0,0 +1,452 @@
+import logging
+import time
+from support.helpers.api_helper import ApiHelper
+from support.helpers.json_codec import get_decoder
+from support.constants.api_constants import ApiConstants
+from support.constants.http_methods import HttpMethod
+
+logger = logging.getLogger(__name__)
+
+# requests is imported in the functions that use it, see simplification_api
+
+# Methods that may be repeated without changing the result (RFC 9110, section 9.2.2);
+# other methods are only retried when the caller marks the request idempotent
+IDEMPOTENT_METHODS = frozenset({HttpMethod.GET, HttpMethod.HEAD, HttpMethod.OPTIONS,
+                                HttpMethod.PUT, HttpMethod.DELETE})
+
+
+def create_session(pool_size=ApiConstants.POOL_SIZE, pool_block=ApiConstants.POOL_BLOCK, keep_alive=True,
+                   transport=None, instrumented=False):
+    """
+    Create a requests.Session backed by a bounded keep-alive connection pool,
+    or by the given transport adapter.
+
+    Raises:
+        ValueError: If pool_size is not positive
+    """
+    if pool_size <= 0:
+        raise ValueError("pool_size must be greater than 0")
+
+    import requests
+
+    session = requests.Session()
+    if instrumented:
+        from support.helpers.instrumented_transport import InstrumentedHTTPAdapter as adapter_class
+    else:
+        adapter_class = requests.adapters.HTTPAdapter
+    adapter = transport or adapter_class(
+        pool_connections=ApiConstants.POOL_CONNECTIONS,
+        pool_maxsize=pool_size,
+        pool_block=pool_block
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        # Ask the server to drop the connection after every response
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def timing_record(started_at, queued_at=None, **fields):
+    """
+    Start the per-call timing record reported to ClientMetrics.observe.
+    """
+    record = {
+        'source': 'remote',
+        'outcome': 'ok',
+        'status': None,
+        'attempts': 0,
+        'reused_connection': None,
+        'queue_wait': started_at - queued_at if queued_at is not None else 0.0,
+        'connect': None,
+        'ttfb': None,
+        'decode': None,
+        'total': None,
+    }
+    record.update(fields)
+    return record
+
+
+def map_request_error(error, subject, status_code=None):
+    """
+    Translate a transport error into the exception raised by the clients.
+
+    Args:
+        error: requests.RequestException raised while sending the request
+        subject: What was requested, for logging (e.g. "GET v2/simplify/x")
+        status_code: HTTP status code of the response, if one was received
+
+    Returns:
+        requests.RequestException: The exception the caller should raise
+    """
+    import requests
+
+    if isinstance(error, requests.exceptions.Timeout):
+        logger.error("Request timeout for %s: %s", subject, error)
+        return requests.RequestException(f"Request timed out: {str(error)}")
+    if isinstance(error, requests.exceptions.ConnectionError):
+        logger.error("Connection error for %s: %s", subject, error)
+        return requests.RequestException(f"Connection failed: {str(error)}")
+    if isinstance(error, requests.exceptions.HTTPError):
+        logger.error("HTTP error %s for %s: %s", status_code, subject, error)
+        return requests.RequestException(f"HTTP error {status_code}: {str(error)}")
+    logger.error("Request failed for %s: %s", subject, error)
+    return error
+
+
+def register_collectors(metrics, components):
+    """
+    Export the stats() of every configured component alongside the request metrics.
+
+    Args:
+        metrics: ClientMetrics to add the collectors to
+        components: Mapping of collector name to component; None entries and
+            components without stats() are skipped
+    """
+    for name, component in components.items():
+        if component is not None and hasattr(component, 'stats'):
+            metrics.add_collector(name, component.stats)
+
+
+def error_category(error):
+    """
+    Classify a failed call for the metrics 'outcome': 'timeout', 'connection', 'http_<status>',
+    'decode', 'circuit_open' or 'error'. Errors mapped by map_request_error are classified
+    by the transport error they were raised from.
+    """
+    import requests
+    from support.helpers.circuit_breaker import CircuitOpenError
+
+    if isinstance(error.__cause__, requests.exceptions.RequestException):
+        error = error.__cause__
+    if isinstance(error, CircuitOpenError):
+        return 'circuit_open'
+    if isinstance(error, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return 'connection'
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return f"http_{response.status_code}" if response is not None else 'http'
+    if isinstance(error, requests.exceptions.InvalidJSONError):
+        return 'decode'
+    return 'error'
+
+
+class RestClient:
+    """
+    Generic JSON client over a pooled requests.Session, dispatching on HttpMethod.
+
+    Every request shares the pool, timeout, retry policy, circuit breaker, limiters and
+    metrics of the client. SimplificationAPI sends its requests through one of these,
+    so other Newton operations or internal services can reuse its setup:
+
+    Example:
+        api = SimplificationAPI(retry_policy=RetryPolicy(), metrics=ClientMetrics())
+        api.rest_client.request(HttpMethod.GET, 'factor/x^2-1')
+
+        with RestClient(base_url="http://localhost:8080/", retry_policy=RetryPolicy()) as client:
+            client.post('jobs', body={'expression': "x + x"}, idempotent=True)
+    """
+
+    def __init__(self, base_url=None, pool_size=ApiConstants.POOL_SIZE, pool_block=ApiConstants.POOL_BLOCK,
+                 keep_alive=True, session=None, transport=None, timeout=ApiConstants.TIMEOUT / 1000,
+                 retry_policy=None, circuit_breaker=None, rate_limiter=None, concurrency_limiter=None,
+                 metrics=None, decoder=None):
+        """
+        Args:
+            base_url: Override for ApiConstants.BASE_URL (default: None)
+            pool_size: Maximum number of pooled connections per host (default: ApiConstants.POOL_SIZE)
+            pool_block: Block when the pool is exhausted instead of opening extra connections
+            keep_alive: Reuse connections between requests (default: True)
+            session: Existing requests.Session to use; it is not closed by close()
+            transport: Optional requests adapter mounted instead of the pooled HTTPAdapter
+            timeout: Per-attempt timeout in seconds (default: ApiConstants.TIMEOUT / 1000)
+            retry_policy: Optional RetryPolicy for transient failures; without it nothing is retried
+            circuit_breaker: Optional CircuitBreaker that fails fast while the service is unhealthy
+            rate_limiter: Optional TokenBucket pacing every request attempt
+            concurrency_limiter: Optional AdaptiveConcurrencyLimiter bounding in-flight requests
+            metrics: Optional ClientMetrics receiving a timing record per request; connections
+                are instrumented for connect time, time to first byte and reuse
+            decoder: Decoder name for json_codec.get_decoder (e.g. 'auto' or 'raw') or a function
+                of the body bytes; default: response.json()
+        """
+        self.api_helper = ApiHelper(base_url)
+        self._owns_session = session is None
+        self.pool_size = pool_size if session is None else None
+        self.session = session if session is not None else create_session(
+            pool_size, pool_block, keep_alive, transport, instrumented=metrics is not None)
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.metrics = metrics
+        self.decoder = get_decoder(decoder) if isinstance(decoder, str) else decoder
+        if metrics is not None:
+            register_collectors(metrics, {
+                'retry': retry_policy,
+                'circuit': circuit_breaker,
+                'rate_limiter': rate_limiter,
+                'concurrency': concurrency_limiter,
+            })
+
+    def close(self):
+        """
+        Close the underlying session and release pooled connections.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, endpoint, params=None, **kwargs):
+        return self.request(HttpMethod.GET, endpoint, params=params, **kwargs)
+
+    def post(self, endpoint, body=None, **kwargs):
+        return self.request(HttpMethod.POST, endpoint, body=body, **kwargs)
+
+    def put(self, endpoint, body=None, **kwargs):
+        return self.request(HttpMethod.PUT, endpoint, body=body, **kwargs)
+
+    def patch(self, endpoint, body=None, **kwargs):
+        return self.request(HttpMethod.PATCH, endpoint, body=body, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self.request(HttpMethod.DELETE, endpoint, **kwargs)
+
+    def request(self, method, endpoint, params=None, body=None, headers=None, token=None, idempotent=None):
+        """
+        Send a request to an endpoint under the API version and decode the JSON response.
+
+        Args:
+            method: HttpMethod (or its name, e.g. 'GET')
+            endpoint: Path relative to the versioned base URL, e.g. 'simplify/x', or an absolute URL
+            params: Optional query parameters
+            body: Optional JSON-serializable request body
+            headers: Extra headers, added to ApiHelper.build_headers(token)
+            token: Optional bearer token
+            idempotent: Allow retries for this request; defaults to IDEMPOTENT_METHODS
+
+        Returns:
+            Decoded JSON body, or None for a 204 response or a HEAD request
+
+        Raises:
+            ValueError: If method is not an HttpMethod
+            CircuitOpenError: If the circuit breaker is open
+            requests.RequestException: If the request fails after any retries
+        """
+        method = HttpMethod(method)
+        url = self.api_helper.build_url(endpoint, params)
+        request_headers = self.api_helper.build_headers(token)
+        if headers:
+            request_headers.update(headers)
+        subject = f"{method.value} {endpoint}"
+
+        if self.metrics is None:
+            return self._request(method, url, request_headers, body, idempotent, subject, None)
+
+        started_at = time.perf_counter()
+        record = timing_record(started_at, method=method.value, endpoint=endpoint)
+        try:
+            return self._request(method, url, request_headers, body, idempotent, subject, record)
+        except Exception as e:
+            record['outcome'] = error_category(e)
+            record['error'] = str(e)
+            raise
+        finally:
+            record['total'] = time.perf_counter() - started_at
+            self.metrics.observe(record)
+
+    def _request(self, method, url, headers, body, idempotent, subject, record):
+        return self.guarded(lambda: self._exchange(method, url, headers, body, idempotent, subject, record),
+                            subject)
+
+    def _exchange(self, method, url, headers, body, idempotent, subject, record):
+        import requests
+
+        try:
+            response = self.send(method, url, headers, body, record=record, subject=subject,
+                                 idempotent=idempotent)
+            return None if method is HttpMethod.HEAD else self.decode(response, record)
+        except requests.exceptions.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            raise map_request_error(e, subject, status_code) from e
+
+    def guarded(self, call, subject, on_open=None):
+        """
+        Run call() through the circuit breaker when one is configured: fail fast while
+        the circuit is open, otherwise record whether the call found the upstream healthy.
+
+        This is the circuit breaker step of request(), for callers that send and
+        decode their requests themselves.
+
+        Args:
+            call: Function performing the request; it raises requests.RequestException on failure
+            subject: What is being requested, for logging
+            on_open: Optional function whose result is returned instead of raising
+                CircuitOpenError while the circuit is open, e.g. to serve a cached result
+
+        Returns:
+            The result of call(), or of on_open() while the circuit is open
+
+        Raises:
+            CircuitOpenError: If the circuit is open and on_open is not set
+            requests.RequestException: If call() fails
+        """
+        import requests
+
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return call()
+        from support.helpers.circuit_breaker import CircuitOpenError, is_upstream_failure
+        if not breaker.allow_request():
+            if on_open is not None:
+                return on_open()
+            logger.error("Circuit open, rejected %s", subject)
+            raise CircuitOpenError("Circuit open: API calls are suspended after repeated failures")
+        started_at = time.perf_counter()
+        try:
+            result = call()
+        except requests.exceptions.RequestException as e:
+            if is_upstream_failure(e):
+                breaker.record_failure(time.perf_counter() - started_at)
+            else:
+                breaker.record_success(time.perf_counter() - started_at)
+            raise
+        breaker.record_success(time.perf_counter() - started_at)
+        return result
+
+    def decode(self, response, record=None):
+        """
+        Decode a JSON response body with the configured decoder, timing it into
+        record when given. A 204 No Content response decodes to None.
+
+        Raises:
+            requests.exceptions.InvalidJSONError: If the body is empty or not valid JSON
+        """
+        import requests
+
+        if response.status_code == 204:
+            return None
+        if not response.content:
+            raise requests.exceptions.InvalidJSONError("Empty response body, expected JSON",
+                                                       response=response)
+        decode_started_at = time.perf_counter()
+        try:
+            data = response.json() if self.decoder is None else self.decoder(response.content)
+        except ValueError as e:
+            raise requests.exceptions.InvalidJSONError(f"Invalid JSON response: {e}",
+                                                       response=response) from e
+        if record is not None:
+            record['decode'] = time.perf_counter() - decode_started_at
+        return data
+
+    def send(self, method, url, headers=None, body=None, record=None, subject=None, idempotent=None):
+        """
+        Send a request over the pooled session, retrying transient failures when a
+        retry_policy is configured and the request is idempotent.
+
+        This is the transport step of request(): no circuit breaker and no decoding,
+        for callers that handle those themselves.
+
+        Args:
+            method: HttpMethod
+            url: Absolute URL
+            headers: Request headers
+            body: Optional JSON-serializable request body
+            record: Timing record to add attempts, status and connection timings to
+            subject: What is being requested, for logging (default: method and URL)
+            idempotent: Allow retries; defaults to IDEMPOTENT_METHODS
+
+        Returns:
+            requests.Response: A successful (2xx/3xx) response
+
+        Raises:
+            requests.RequestException: The last error, not yet mapped by map_request_error;
+                HTTP errors carry the response
+        """
+        import requests
+
+        subject = subject or f"{method.value} {url}"
+        policy = self.retry_policy if (method in IDEMPOTENT_METHODS if idempotent is None else idempotent) else None
+        attempt = 0
+        while True:
+            attempt += 1
+            response = None
+            try:
+                logger.info("Sending %s request for %s", method.value, subject)
+                response = self._send_once(method, url, headers, body, record)
+                response.raise_for_status()
+                break
+            except requests.exceptions.RequestException as e:
+                delay = None
+                if policy is not None:
+                    status_code = response.status_code if response is not None else None
+                    retry_after = response.headers.get('Retry-After') if response is not None else None
+                    delay = policy.retry_delay(attempt, e, status_code, retry_after)
+                if delay is None:
+                    if policy is not None:
+                        policy.record_attempts(attempt)
+                    if e.response is None:
+                        e.response = response
+                    raise
+                logger.warning("Attempt %s failed for %s (%s); retrying in %.2fs", attempt, subject, e, delay)
+                policy.sleep(delay)
+
+        if policy is not None:
+            policy.record_attempts(attempt)
+        return response
+
+    def _send_once(self, method, url, headers, body, record):
+        """
+        Send one attempt, waiting for the rate limiter and then a concurrency slot
+        when they are configured.
+        """
+        import requests
+
+        waiting_since = time.perf_counter()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        limiter = self.concurrency_limiter
+        started_at = limiter.acquire() if limiter is not None else None
+        if record is not None:
+            from support.helpers.instrumented_transport import take_connection_timing
+            record['queue_wait'] += time.perf_counter() - waiting_since
+            take_connection_timing()
+
+        # Dispatch to the session's method (session.get, session.post, ...)
+        send = getattr(self.session, method.value.lower())
+        kwargs = {'headers': headers, 'timeout': self.timeout}
+        if body is not None:
+            kwargs['json'] = body
+        response = None
+        dropped = False
+        try:
+            response = send(url, **kwargs)
+            dropped = response.status_code in ApiConstants.OVERLOAD_STATUSES
+            return response
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            dropped = True
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release(started_at, dropped)
+            if record is not None:
+                self._record_attempt(record, response)
+
+    @staticmethod
+    def _record_attempt(record, response):
+        from support.helpers.instrumented_transport import take_connection_timing
+        timing = take_connection_timing()
+        record['attempts'] += 1
+        record['status'] = response.status_code if response is not None else None
+        # Connection timings only exist when the instrumented adapter served the request
+        if timing['reused'] is not None:
+            record['connect'] = (record['connect'] or 0.0) + timing['connect']
+            record['ttfb'] = timing['ttfb']
+            record['reused_connection'] = timing['reused']
@@ -1,161 +1,492 @@
-import requests
-import logging
-from support.helpers.api_helper import ApiHelper
-from support.helpers.data_generator import ArithmeticExpressionGenerator
-from support.constants.api_constants import ApiConstants
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-class SimplificationAPI:
-    
-    def __init__(self):
-        try:
-            self.api_helper = ApiHelper()
-            self.expression_generator = ArithmeticExpressionGenerator()
-            logger.info("SimplificationAPI initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize SimplificationAPI: {str(e)}")
-            raise
-    
-    def simplify_generated_expression(self, num_terms=3, min_value=1, max_value=20):
-        """
-        Generate a random algebraic expression and send it to the simplify endpoint.
-        
-        Args:
-            num_terms: Number of terms in the expression (default: 3)
-            min_value: Minimum value for coefficients (default: 1)
-            max_value: Maximum value for coefficients (default: 20)
-            
-        Returns:
-            dict: API response containing the simplified expression
-            
-        Raises:
-            ValueError: If invalid parameters are provided
-            requests.RequestException: If API request fails
-            Exception: For any other unexpected errors
-        """
-        try:
-            logger.info(f"Generating expression with {num_terms} terms, values {min_value}-{max_value}")
-            
-            # Validate input parameters
-            if num_terms <= 0:
-                raise ValueError("num_terms must be greater than 0")
-            if min_value >= max_value:
-                raise ValueError("min_value must be less than max_value")
-            if min_value < 0 or max_value < 0:
-                raise ValueError("min_value and max_value must be non-negative")
-            
-            # Generate a random algebraic expression
-            expression = self.expression_generator.generate_expression(num_terms, min_value, max_value)
-            logger.info(f"Generated expression: {expression}")
-            
-            # Build the URL with the expression as part of the path
-            endpoint = f"{ApiConstants.SIMPLIFY_URL}/{expression}"
-            url = self.api_helper.build_url(endpoint)
-            logger.info(f"Built API URL: {url}")
-            
-            # Build headers
-            headers = self.api_helper.build_headers()
-            logger.debug(f"Request headers: {headers}")
-            
-            # Send GET request
-            logger.info(f"Sending GET request to simplify endpoint")
-            response = requests.get(url, headers=headers, timeout=ApiConstants.TIMEOUT/1000)
-            response.raise_for_status()
-            
-            response_data = response.json()
-            logger.info(f"Successfully received response for expression: {expression}")
-            logger.debug(f"Response data: {response_data}")
-            
-            return {
-                'original_expression': expression,
-                'response': response_data
-            }
-            
-        except ValueError as e:
-            logger.error(f"Invalid parameters provided: {str(e)}")
-            raise
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Request timeout for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"Request timed out: {str(e)}")
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"Connection failed: {str(e)}")
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error {response.status_code} for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"HTTP error {response.status_code}: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for expression '{expression}': {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in simplify_generated_expression: {str(e)}")
-            raise Exception(f"Unexpected error occurred: {str(e)}")
-    
-    def simplify_custom_expression(self, expression):
-        """
-        Send a custom expression to the simplify endpoint.
-        
-        Args:
-            expression: The algebraic expression to simplify
-            
-        Returns:
-            dict: API response containing the simplified expression
-            
-        Raises:
-            ValueError: If expression is None or empty
-            requests.RequestException: If API request fails
-            Exception: For any other unexpected errors
-        """
-        try:
-            logger.info(f"Simplifying custom expression: {expression}")
-            
-            # Validate input
-            if not expression or not expression.strip():
-                raise ValueError("Expression cannot be None or empty")
-            
-            expression = expression.strip()
-            logger.debug(f"Cleaned expression: {expression}")
-            
-            # Build the URL with the expression as part of the path
-            endpoint = f"{ApiConstants.SIMPLIFY_URL}/{expression}"
-            url = self.api_helper.build_url(endpoint)
-            logger.info(f"Built API URL: {url}")
-            
-            # Build headers
-            headers = self.api_helper.build_headers()
-            logger.debug(f"Request headers: {headers}")
-            
-            # Send GET request
-            logger.info(f"Sending GET request to simplify endpoint")
-            response = requests.get(url, headers=headers, timeout=ApiConstants.TIMEOUT/1000)
-            response.raise_for_status()
-            
-            response_data = response.json()
-            logger.info(f"Successfully received response for expression: {expression}")
-            logger.debug(f"Response data: {response_data}")
-            
-            return {
-                'original_expression': expression,
-                'response': response_data
-            }
-            
-        except ValueError as e:
-            logger.error(f"Invalid expression provided: {str(e)}")
-            raise
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Request timeout for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"Request timed out: {str(e)}")
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"Connection failed: {str(e)}")
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error {response.status_code} for expression '{expression}': {str(e)}")
-            raise requests.RequestException(f"HTTP error {response.status_code}: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for expression '{expression}': {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in simplify_custom_expression: {str(e)}")
-            raise Exception(f"Unexpected error occurred: {str(e)}")
\ No newline at end of file
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from support.helpers.compact_result import SimplifyResult
+from support.helpers.data_generator import ArithmeticExpressionGenerator
+from support.helpers.result_cache import normalize_expression
+from support.constants.api_constants import ApiConstants
+from support.constants.http_methods import HttpMethod
+from support.page_objects.api import rest_client
+from support.page_objects.api.rest_client import RestClient, error_category, register_collectors, timing_record
+
+# requests and optional components (batching, circuit breaker, instrumentation) are imported
+# in the functions that use them so importing the client (e.g. for --help) stays fast
+
+# Logging is configured by the application (see support.helpers.logging_config).
+# Log calls pass %-style arguments so nothing is formatted for records that are filtered out.
+logger = logging.getLogger(__name__)
+
+
+def validate_generation_params(num_terms, min_value, max_value):
+    """
+    Validate expression generator parameters.
+    
+    Raises:
+        ValueError: If invalid parameters are provided
+    """
+    if num_terms <= 0:
+        raise ValueError("num_terms must be greater than 0")
+    if min_value >= max_value:
+        raise ValueError("min_value must be less than max_value")
+    if min_value < 0 or max_value < 0:
+        raise ValueError("min_value and max_value must be non-negative")
+
+
+def clean_expression(expression):
+    """
+    Validate a custom expression and strip surrounding whitespace.
+    
+    Raises:
+        ValueError: If expression is None or empty
+    """
+    if not expression or not expression.strip():
+        raise ValueError("Expression cannot be None or empty")
+    return expression.strip()
+
+
+def map_request_error(error, expression, status_code=None):
+    """
+    Translate a transport error into the exception raised by the simplification clients.
+    
+    Args:
+        error: requests.RequestException raised while sending the request
+        expression: The expression being simplified (used for logging)
+        status_code: HTTP status code of the response, if one was received
+        
+    Returns:
+        requests.RequestException: The exception the caller should raise
+    """
+    return rest_client.map_request_error(error, f"expression '{expression}'", status_code)
+
+
+def build_shared_result(expression, shared_response):
+    """
+    Build a result from a response obtained for another call (cache hit or coalesced request).
+    The response is copied so callers cannot mutate each other's data, and its
+    'expression' echoes the caller's spelling as the API would.
+    """
+    response = dict(shared_response)
+    if 'expression' in response:
+        response['expression'] = expression
+    return {
+        'original_expression': expression,
+        'response': response
+    }
+
+
+class SimplificationAPI:
+    
+    def __init__(self, base_url=None, pool_size=ApiConstants.POOL_SIZE,
+                 pool_block=ApiConstants.POOL_BLOCK, keep_alive=True, session=None, cache=None,
+                 single_flight=None, local_engine=None, transport=None,
+                 retry_policy=None, circuit_breaker=None, rate_limiter=None, concurrency_limiter=None,
+                 metrics=None, decoder=None, compact_results=False):
+        """
+        Args:
+            base_url: Override for ApiConstants.BASE_URL (default: None)
+            pool_size: Maximum number of pooled connections per host (default: ApiConstants.POOL_SIZE)
+            pool_block: Block when the pool is exhausted instead of opening extra connections
+            keep_alive: Reuse connections between requests (default: True)
+            session: Existing requests.Session to use; it is not closed by close()
+            cache: Optional ResultCache used to answer repeated expressions locally
+            single_flight: Optional SingleFlight that collapses concurrent requests for the same expression
+            local_engine: Optional LocalSimplifier tried before the cache and the network
+            transport: Optional requests adapter mounted instead of the pooled HTTPAdapter,
+                e.g. a CassetteAdapter to record or replay responses
+            retry_policy: Optional RetryPolicy for transient failures; without it nothing is retried
+            circuit_breaker: Optional CircuitBreaker that fails fast while the API is unhealthy
+            rate_limiter: Optional TokenBucket pacing every request attempt
+            concurrency_limiter: Optional AdaptiveConcurrencyLimiter bounding in-flight requests
+            metrics: Optional ClientMetrics receiving a timing record per call; connections are
+                instrumented for connect time, time to first byte and reuse
+            decoder: JSON decoder for responses, see RestClient; 'raw' leaves each response as
+                the RawJSON body received, for results that are only forwarded. Raw responses
+                cannot be combined with cache, single_flight or local_engine
+            compact_results: Return SimplifyResult objects instead of nested dicts; they support
+                the same read access in a fraction of the memory (default: False)
+        """
+        try:
+            if decoder == 'raw' and (cache is not None or single_flight is not None or local_engine is not None):
+                raise ValueError("decoder='raw' cannot be combined with cache, single_flight or local_engine")
+            if decoder == 'raw' and compact_results:
+                raise ValueError("decoder='raw' cannot be combined with compact_results")
+            self.rest_client = RestClient(
+                base_url, pool_size, pool_block, keep_alive, session, transport,
+                retry_policy=retry_policy, circuit_breaker=circuit_breaker, rate_limiter=rate_limiter,
+                concurrency_limiter=concurrency_limiter, metrics=metrics, decoder=decoder)
+            self.api_helper = self.rest_client.api_helper
+            self.expression_generator = ArithmeticExpressionGenerator()
+            self.pool_size = self.rest_client.pool_size
+            self.session = self.rest_client.session
+            self._owns_session = session is None
+            self.cache = cache
+            self.single_flight = single_flight
+            self.local_engine = local_engine
+            self.retry_policy = retry_policy
+            self.circuit_breaker = circuit_breaker
+            self.rate_limiter = rate_limiter
+            self.concurrency_limiter = concurrency_limiter
+            self.metrics = metrics
+            self.compact_results = compact_results
+            self._local = threading.local()
+            if metrics is not None:
+                register_collectors(metrics, {
+                    'cache': cache,
+                    'single_flight': single_flight,
+                    'local_engine': local_engine,
+                })
+            logger.info("SimplificationAPI initialized successfully")
+        except Exception as e:
+            logger.error("Failed to initialize SimplificationAPI: %s", e)
+            raise
+
+    def close(self):
+        """
+        Close pooled connections. Sessions passed in by the caller are left open.
+        """
+        if self._owns_session:
+            self.rest_client.close()
+            logger.info("SimplificationAPI session closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def simplify_generated_expression(self, num_terms=3, min_value=1, max_value=20, use_cache=True):
+        """
+        Generate a random algebraic expression and send it to the simplify endpoint.
+        
+        Args:
+            num_terms: Number of terms in the expression (default: 3)
+            min_value: Minimum value for coefficients (default: 1)
+            max_value: Maximum value for coefficients (default: 20)
+            use_cache: Set to False to bypass the configured cache for this call
+            
+        Returns:
+            dict: API response containing the simplified expression
+            
+        Raises:
+            ValueError: If invalid parameters are provided
+            requests.RequestException: If API request fails
+            Exception: For any other unexpected errors
+        """
+        import requests
+
+        try:
+            logger.info("Generating expression with %s terms, values %s-%s", num_terms, min_value, max_value)
+            
+            # Validate input parameters
+            validate_generation_params(num_terms, min_value, max_value)
+            
+            # Generate a random algebraic expression
+            expression = self.expression_generator.generate_expression(num_terms, min_value, max_value)
+            logger.info("Generated expression: %s", expression)
+            
+            return self._simplify(expression, use_cache)
+            
+        except ValueError as e:
+            logger.error("Invalid parameters provided: %s", e)
+            raise
+        except requests.exceptions.RequestException:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error in simplify_generated_expression: %s", e)
+            raise Exception(f"Unexpected error occurred: {str(e)}")
+    
+    def simplify_custom_expression(self, expression, use_cache=True):
+        """
+        Send a custom expression to the simplify endpoint.
+        
+        Args:
+            expression: The algebraic expression to simplify
+            use_cache: Set to False to bypass the configured cache for this call
+            
+        Returns:
+            dict: API response containing the simplified expression
+            
+        Raises:
+            ValueError: If expression is None or empty
+            requests.RequestException: If API request fails
+            Exception: For any other unexpected errors
+        """
+        import requests
+
+        try:
+            logger.info("Simplifying custom expression: %s", expression)
+            
+            # Validate input
+            expression = clean_expression(expression)
+            logger.debug("Cleaned expression: %s", expression)
+            
+            return self._simplify(expression, use_cache)
+            
+        except ValueError as e:
+            logger.error("Invalid expression provided: %s", e)
+            raise
+        except requests.exceptions.RequestException:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error in simplify_custom_expression: %s", e)
+            raise Exception(f"Unexpected error occurred: {str(e)}")
+    
+    def simplify_batch(self, expressions, max_workers=ApiConstants.BATCH_MAX_WORKERS):
+        """
+        Simplify many expressions over a bounded thread pool sharing the pooled session.
+        
+        Failures do not abort the batch: a failed item is returned as
+        {'original_expression': ..., 'error': exception} in its position.
+        
+        Args:
+            expressions: Iterable of expressions to simplify
+            max_workers: Number of worker threads (default: ApiConstants.BATCH_MAX_WORKERS)
+            
+        Returns:
+            list: One result per expression, in input order
+            
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        return list(self._run_batch(expressions, max_workers, ordered=True))
+    
+    def simplify_batch_unordered(self, expressions, max_workers=ApiConstants.BATCH_MAX_WORKERS):
+        """
+        Streaming variant of simplify_batch that yields results as they complete.
+        
+        The input is consumed lazily, so memory stays bounded for large or
+        unbounded iterables.
+        
+        Args:
+            expressions: Iterable of expressions to simplify
+            max_workers: Number of worker threads (default: ApiConstants.BATCH_MAX_WORKERS)
+            
+        Yields:
+            dict: Result or {'original_expression', 'error'} for each expression
+            
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        return self._run_batch(expressions, max_workers, ordered=False)
+    
+    def simplify_stream(self, expressions, max_workers=ApiConstants.BATCH_MAX_WORKERS):
+        """
+        Streaming variant of simplify_batch that yields results in input order.
+        
+        The input is consumed lazily and at most 2 * max_workers items are in
+        flight, so memory stays bounded for large or unbounded iterables.
+        
+        Args:
+            expressions: Iterable of expressions to simplify
+            max_workers: Number of worker threads (default: ApiConstants.BATCH_MAX_WORKERS)
+            
+        Yields:
+            dict: Result or {'original_expression', 'error'} for each expression
+            
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        return self._run_batch(expressions, max_workers, ordered=True)
+    
+    def _run_batch(self, expressions, max_workers, ordered):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if self.pool_size is not None and max_workers > self.pool_size:
+            logger.warning("max_workers (%s) exceeds pool_size (%s); extra connections will not be reused",
+                           max_workers, self.pool_size)
+        return self._iter_batch(iter(expressions), max_workers, ordered)
+    
+    def _iter_batch(self, expressions, max_workers, ordered):
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        
+        # Keep a small backlog queued so workers never wait on the producer
+        window = max_workers * 2
+        pending = deque() if ordered else set()
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='simplify') as executor:
+            def submit_next():
+                for expression in expressions:
+                    future = executor.submit(self._simplify_batch_item, expression, time.perf_counter())
+                    if ordered:
+                        pending.append(future)
+                    else:
+                        pending.add(future)
+                    return True
+                return False
+            
+            try:
+                while len(pending) < window and submit_next():
+                    pass
+                
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        pending.difference_update(done)
+                    for future in done:
+                        submit_next()
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    def _simplify_batch_item(self, expression, submitted_at=None):
+        # Lets the metrics record how long the item waited for a worker
+        self._local.queued_at = submitted_at
+        try:
+            return self.simplify_custom_expression(expression)
+        except Exception as e:
+            return {'original_expression': expression, 'error': e}
+        finally:
+            self._local.queued_at = None
+    
+    def _simplify(self, expression, use_cache=True):
+        """
+        Resolve an expression, reporting a timing record to the metrics when configured.
+        """
+        if self.metrics is None:
+            return self._resolve(expression, use_cache)
+        
+        started_at = time.perf_counter()
+        queued_at = getattr(self._local, 'queued_at', None)
+        record = timing_record(started_at, queued_at, expression=expression)
+        self._local.record = record
+        try:
+            result = self._resolve(expression, use_cache)
+            # Raw responses are not decoded, so their result is not recorded
+            response = result.get('response')
+            if isinstance(response, Mapping):
+                record['result'] = response.get('result')
+            return result
+        except Exception as e:
+            record['outcome'] = error_category(e)
+            record['error'] = str(e)
+            raise
+        finally:
+            self._local.record = None
+            record['total'] = time.perf_counter() - started_at
+            self.metrics.observe(record)
+    
+    def _result(self, expression, response):
+        """
+        Wrap a response for the caller: a result dict, or a SimplifyResult with compact_results.
+        """
+        if self.compact_results:
+            return SimplifyResult.from_response(expression, response)
+        return {
+            'original_expression': expression,
+            'response': response
+        }
+    
+    def _shared_result(self, expression, shared_response):
+        """
+        Like _result for a response obtained for another call (cache hit or coalesced request).
+        """
+        if self.compact_results:
+            return SimplifyResult.from_response(expression, shared_response, shared=True)
+        return build_shared_result(expression, shared_response)
+    
+    def _note(self, **fields):
+        """
+        Add fields to the current call's timing record, if one is being collected.
+        """
+        record = getattr(self._local, 'record', None)
+        if record is not None:
+            record.update(fields)
+    
+    def _resolve(self, expression, use_cache=True):
+        """
+        Resolve an expression locally or from the cache when possible, otherwise call
+        the API and cache the response. Concurrent misses for the same expression
+        share one request when single_flight is set.
+        """
+        if self.local_engine is not None:
+            local_response = self.local_engine.simplify(expression)
+            if local_response is not None:
+                logger.info("Resolved expression locally: %s", expression)
+                self._note(source='local')
+                return self._result(expression, local_response)
+        
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached_response = self.cache.get(expression)
+            if cached_response is not None:
+                logger.info("Cache hit for expression: %s", expression)
+                self._note(source='cache')
+                return self._shared_result(expression, cached_response)
+        
+        if self.single_flight is None:
+            return self._fetch(expression, use_cache)
+        
+        result, shared = self.single_flight.do(
+            normalize_expression(expression),
+            lambda: self._fetch(expression, use_cache)
+        )
+        if shared:
+            logger.info("Coalesced request for expression: %s", expression)
+            self._note(source='coalesced')
+            return self._shared_result(expression, result['response'])
+        return result
+    
+    def _fetch(self, expression, use_cache):
+        def fetch():
+            result = self._send_simplify_request(expression)
+            if use_cache:
+                self.cache.set(expression, dict(result['response']))
+            return result
+        
+        return self.rest_client.guarded(fetch, expression, on_open=lambda: self._serve_while_open(expression))
+    
+    def _serve_while_open(self, expression):
+        """
+        Answer without calling the API while the circuit is open: from the cache
+        (expired entries included) when serve_stale is set, otherwise fail fast.
+        """
+        if self.circuit_breaker.serve_stale and self.cache is not None:
+            cached_response = self.cache.get(expression, allow_expired=True)
+            if cached_response is not None:
+                logger.info("Circuit open, served cached result for expression: %s", expression)
+                self._note(source='stale')
+                return self._shared_result(expression, cached_response)
+        from support.helpers.circuit_breaker import CircuitOpenError
+        logger.error("Circuit open, rejected expression '%s'", expression)
+        raise CircuitOpenError("Circuit open: API calls are suspended after repeated failures")
+    
+    def _send_simplify_request(self, expression):
+        """
+        Send a validated expression to the simplify endpoint over the pooled session,
+        retrying transient failures when a retry_policy is configured.
+        
+        Returns:
+            dict: Original expression and the decoded API response
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        import requests
+
+        # Build the URL with the expression as part of the path
+        endpoint = f"{ApiConstants.SIMPLIFY_URL}/{expression}"
+        url = self.api_helper.build_url(endpoint)
+        logger.info("Built API URL: %s", url)
+        
+        # Build headers
+        headers = self.api_helper.build_headers()
+        logger.debug("Request headers: %s", headers)
+        
+        record = getattr(self._local, 'record', None)
+        try:
+            response = self.rest_client.send(HttpMethod.GET, url, headers, record=record, subject=expression)
+            response_data = self.rest_client.decode(response, record)
+        except requests.exceptions.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            raise map_request_error(e, expression, status_code) from e
+        
+        logger.info("Successfully received response for expression: %s", expression)
+        logger.debug("Response data: %s", response_data)
+        
+        return self._result(expression, response_data)
\ No newline at end of file
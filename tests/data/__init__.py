@@ -1,27 +1,27 @@
-"""
-Test data module initialization.
-Provides easy imports for test data and utilities.
-"""
-
-from .test_constants import (
-    TestExpressions,
-    TestScenarios, 
-    ExpectedResponses,
-    ErrorScenarios,
-    GeneratorParams
-)
-
-from .test_data_loader import (
-    TestDataLoader,
-    TestDataValidator
-)
-
-__all__ = [
-    'TestExpressions',
-    'TestScenarios',
-    'ExpectedResponses', 
-    'ErrorScenarios',
-    'GeneratorParams',
-    'TestDataLoader',
-    'TestDataValidator'
-]
+"""
+Test data module initialization.
+Provides easy imports for test data and utilities.
+"""
+
+from .test_constants import (
+    TestExpressions,
+    TestScenarios, 
+    ExpectedResponses,
+    ErrorScenarios,
+    GeneratorParams
+)
+
+from .test_data_loader import (
+    TestDataLoader,
+    TestDataValidator
+)
+
+__all__ = [
+    'TestExpressions',
+    'TestScenarios',
+    'ExpectedResponses', 
+    'ErrorScenarios',
+    'GeneratorParams',
+    'TestDataLoader',
+    'TestDataValidator'
+]
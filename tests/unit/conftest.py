@@ -0,0 +1,58 @@
+"""
+Shared pytest fixtures for the unit tests.
+"""
+
+import pytest
+from unittest.mock import Mock
+from urllib.parse import unquote
+from support.mocks.newton_stub_server import NewtonStubServer
+from tests.data import ExpectedResponses
+
+
+class FakeClock:
+    """Manually advanced time source; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_echo_response(url, transform=None, **kwargs):
+    """
+    Build a successful mock simplify response for the expression in the request URL.
+
+    The result is the expression itself, or transform(expression) when given. Extra
+    keyword arguments (headers, timeout, ...) are accepted so this can be used as the
+    side_effect of a patched Session.get.
+    """
+    expression = unquote(url.rsplit('/', 1)[-1])
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {'operation': 'simplify', 'expression': expression,
+                                       'result': transform(expression) if transform else expression}
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+
+@pytest.fixture
+def clock():
+    """Fixture for a FakeClock starting at 0."""
+    return FakeClock()
+
+
+@pytest.fixture
+def echo_response():
+    """Fixture for make_echo_response, e.g. mock_get.side_effect = echo_response."""
+    return make_echo_response
+
+
+@pytest.fixture
+def stub_server():
+    """Fixture for a NewtonStubServer answering the sample responses, fresh for each test."""
+    with NewtonStubServer(fixtures=ExpectedResponses.SAMPLE_RESPONSES) as server:
+        yield server
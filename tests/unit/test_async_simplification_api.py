@@ -0,0 +1,187 @@
+"""
+Unit tests for AsyncSimplificationAPI class.
+Requests are served by an in-process aiohttp server instead of the real API.
+"""
+
+import asyncio
+import pytest
+import requests
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from support.page_objects.api.async_simplification_api import AsyncSimplificationAPI
+from support.helpers.single_flight import AsyncSingleFlight
+
+
+def run_with_server(handler, scenario):
+    """Start a local simplify server with the given handler and run scenario(base_url)."""
+    async def runner():
+        app = web.Application()
+        app.router.add_get('/api/v2/simplify/{expression:.*}', handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url('/api/')))
+        finally:
+            await server.close()
+    return asyncio.run(runner())
+
+
+async def echo_handler(request):
+    expression = request.match_info['expression']
+    return web.json_response({'operation': 'simplify', 'expression': expression, 'result': expression})
+
+
+class TestAsyncSimplificationAPI:
+
+    def test_simplify_custom_expression_success(self):
+        """Test that results have the same shape as the blocking client."""
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                return await api.simplify_custom_expression("  x^2 + 2x + 1 ")
+
+        result = run_with_server(echo_handler, scenario)
+
+        assert result['original_expression'] == "x^2 + 2x + 1"
+        assert result['response']['operation'] == 'simplify'
+        assert result['response']['expression'] == "x^2 + 2x + 1"
+
+    def test_simplify_generated_expression_success(self):
+        """Test simplification of a generated expression."""
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                return await api.simplify_generated_expression(num_terms=2, min_value=1, max_value=5)
+
+        result = run_with_server(echo_handler, scenario)
+
+        assert result['response']['expression'] == result['original_expression']
+
+    def test_validation_matches_blocking_client(self):
+        """Test that the shared validation rules are applied."""
+        async def scenario():
+            api = AsyncSimplificationAPI()
+            with pytest.raises(ValueError, match="Expression cannot be None or empty"):
+                await api.simplify_custom_expression("   ")
+            with pytest.raises(ValueError, match="min_value must be less than max_value"):
+                await api.simplify_generated_expression(min_value=10, max_value=5)
+
+        asyncio.run(scenario())
+
+    def test_http_error_mapping(self):
+        """Test that HTTP errors are raised as requests.RequestException."""
+        async def failing_handler(request):
+            return web.Response(status=503)
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                with pytest.raises(requests.RequestException, match="HTTP error 503"):
+                    await api.simplify_custom_expression("x + 1")
+
+        run_with_server(failing_handler, scenario)
+
+    def test_connection_error_mapping(self):
+        """Test that connection failures are raised as requests.RequestException."""
+        async def scenario():
+            async with AsyncSimplificationAPI(base_url="http://127.0.0.1:1/api/") as api:
+                with pytest.raises(requests.RequestException, match="Connection failed"):
+                    await api.simplify_custom_expression("x + 1")
+
+        asyncio.run(scenario())
+
+    def test_simplify_many_bounds_concurrency(self):
+        """Test that simplify_many keeps at most `concurrency` requests in flight."""
+        state = {'in_flight': 0, 'peak': 0}
+
+        async def slow_handler(request):
+            state['in_flight'] += 1
+            state['peak'] = max(state['peak'], state['in_flight'])
+            await asyncio.sleep(0.02)
+            state['in_flight'] -= 1
+            return await echo_handler(request)
+
+        expressions = [f"{i}x + {i}" for i in range(1, 41)]
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                return [result async for result in api.simplify_many(expressions, concurrency=8)]
+
+        results = run_with_server(slow_handler, scenario)
+
+        assert sorted(r['original_expression'] for r in results) == sorted(expressions)
+        assert state['peak'] == 8
+
+    def test_simplify_many_yields_in_completion_order(self):
+        """Test that fast responses are yielded before slow ones."""
+        async def handler(request):
+            if request.match_info['expression'] == 'slow':
+                await asyncio.sleep(0.1)
+            return await echo_handler(request)
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                return [r['original_expression'] async for r in api.simplify_many(['slow', 'fast'], concurrency=2)]
+
+        assert run_with_server(handler, scenario) == ['fast', 'slow']
+
+    def test_simplify_many_return_exceptions(self):
+        """Test that failed items are yielded as errors when return_exceptions is set."""
+        async def handler(request):
+            if request.match_info['expression'] == 'bad':
+                return web.Response(status=400)
+            return await echo_handler(request)
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                return [r async for r in api.simplify_many(['x', 'bad', ''], return_exceptions=True)]
+
+        results = {r['original_expression']: r for r in run_with_server(handler, scenario)}
+
+        assert results['x']['response']['result'] == 'x'
+        assert isinstance(results['bad']['error'], requests.RequestException)
+        assert isinstance(results['']['error'], ValueError)
+
+    def test_simplify_many_raises_by_default(self):
+        """Test that the first failure is raised when return_exceptions is not set."""
+        async def failing_handler(request):
+            return web.Response(status=500)
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url) as api:
+                with pytest.raises(requests.RequestException, match="HTTP error 500"):
+                    async for _ in api.simplify_many(['x', 'y']):
+                        pass
+
+        run_with_server(failing_handler, scenario)
+
+    def test_simplify_many_invalid_concurrency(self):
+        """Test that a non-positive concurrency is rejected."""
+        async def scenario():
+            api = AsyncSimplificationAPI()
+            with pytest.raises(ValueError, match="concurrency must be greater than 0"):
+                async for _ in api.simplify_many(['x'], concurrency=0):
+                    pass
+
+        asyncio.run(scenario())
+
+    def test_simplify_many_coalesces_duplicates(self):
+        """Test that duplicate in-flight expressions share one request."""
+        hits = []
+
+        async def counting_handler(request):
+            hits.append(request.match_info['expression'])
+            await asyncio.sleep(0.02)
+            return await echo_handler(request)
+
+        flight = AsyncSingleFlight()
+
+        async def scenario(base_url):
+            async with AsyncSimplificationAPI(base_url=base_url, single_flight=flight) as api:
+                return [r async for r in api.simplify_many(['x + x', 'x+x', 'x + x', 'y'], concurrency=4)]
+
+        results = run_with_server(counting_handler, scenario)
+
+        assert len(hits) == 2
+        assert flight.coalesced == 2
+        assert sorted(r['original_expression'] for r in results) == ['x + x', 'x + x', 'x+x', 'y']
@@ -0,0 +1,197 @@
+"""
+Unit tests for the bulk JSONL simplification command.
+"""
+
+import io
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from support.commands.bulk_simplify import Progress, parse_line, read_lines, simplify_lines, main
+from support.helpers.json_codec import available_decoders
+from support.helpers.result_store import ResultStore
+from support.page_objects.api.simplification_api import SimplificationAPI
+from support.mocks.newton_stub_server import NewtonStubServer, FaultConfig
+
+
+class FakeStreamAPI:
+    """Client double answering simplify_stream in input order and tracking how far the input was read."""
+
+    def __init__(self, failures=()):
+        self.failures = set(failures)
+        self.consumed = 0
+
+    def simplify_stream(self, expressions, max_workers):
+        for expression in expressions:
+            self.consumed += 1
+            if expression in self.failures:
+                yield {'original_expression': expression,
+                       'error': requests.RequestException("HTTP error 400: bad expression")}
+            else:
+                yield {'original_expression': expression, 'response': {'result': expression.upper()}}
+
+
+def run_lines(text, api, **kwargs):
+    out = io.BytesIO()
+    written, failed = simplify_lines(api, read_lines(io.BytesIO(text.encode()), **kwargs), out)
+    return [json.loads(line) for line in out.getvalue().splitlines()], written, failed
+
+
+class TestParseLine:
+
+    def test_plain_and_json_lines(self):
+        """Test that plain lines and JSON objects are both accepted."""
+        plain = parse_line(b"  x + x \n", 1, 9)
+        keyed = parse_line(b'{"title": "2x + 4", "request_id": "r-1"}\n', 2, 50,
+                           field='title', id_field='request_id')
+
+        assert (plain.expression, plain.id, plain.error) == ("x + x", None, None)
+        assert (keyed.expression, keyed.id, keyed.offset) == ("2x + 4", "r-1", 50)
+
+    def test_blank_and_invalid_lines(self):
+        """Test that blank lines are skipped and bad JSON lines carry an error."""
+        assert parse_line(b"\r\n", 1, 2) is None
+        assert parse_line(b"{bad\n", 1, 5).error.startswith("Invalid JSON")
+        assert parse_line(b'{"expression": ""}\n', 1, 20).error == "Missing or empty field 'expression'"
+
+
+class TestSimplifyLines:
+
+    def test_writes_results_in_input_order(self):
+        """Test output records for successes, API errors and unparseable lines."""
+        text = "x + x\n\n{bad\n2x\n{\"expression\": \"y\", \"id\": 7}\n{}\n"
+
+        records, written, failed = run_lines(text, FakeStreamAPI(failures={"2x"}), id_field='id')
+
+        assert records == [
+            {'line': 1, 'expression': "x + x", 'result': "X + X"},
+            {'line': 3, 'error': "Invalid JSON: Expecting property name enclosed in double quotes: "
+                                 "line 1 column 2 (char 1)"},
+            {'line': 4, 'expression': "2x", 'error': "HTTP error 400: bad expression"},
+            {'line': 5, 'id': 7, 'expression': "y", 'result': "Y"},
+            {'line': 6, 'error': "Missing or empty field 'expression'"},
+        ]
+        assert (written, failed) == (5, 3)
+
+    def test_input_is_consumed_lazily(self):
+        """Test that results are written before the whole input has been read."""
+        api = FakeStreamAPI()
+        consumed_at_first_write = []
+
+        class Output(io.BytesIO):
+            def write(self, text):
+                if not consumed_at_first_write:
+                    consumed_at_first_write.append(api.consumed)
+                return super().write(text)
+
+        lines = read_lines(io.BytesIO(b"x\n" * 1000))
+        simplify_lines(api, lines, Output())
+
+        assert consumed_at_first_write == [1]
+
+
+class TestProgress:
+
+    def test_reports_rate_and_eta(self, clock):
+        """Test the throughput and ETA estimate from input bytes."""
+        stream = io.StringIO()
+        progress = Progress(stream, total_bytes=1000, interval=1.0, clock=clock)
+
+        clock.now = 0.5
+        assert progress.update(False, 100) is False
+        clock.now = 2.0
+        assert progress.update(True, 250) is True
+
+        assert stream.getvalue() == "2 done (1 errors), 1.0/s, 25%, ETA 0:00:06\n"
+
+    def test_no_eta_without_total(self, clock):
+        """Test that piped input reports throughput only."""
+        progress = Progress(io.StringIO(), clock=clock)
+        clock.now = 4.0
+        progress.update(False, 10)
+
+        assert progress.line() == "1 done (0 errors), 0.2/s"
+
+
+class TestMain:
+
+    def test_end_to_end_against_stub_server(self, tmp_path, capsys):
+        """Test file input, JSONL output, progress on stderr and a zero exit status."""
+        # Setup
+        source = tmp_path / "input.jsonl"
+        output = tmp_path / "results.jsonl"
+        source.write_text('{"request_id": "a", "title": "x + x"}\n{"request_id": "b", "title": "y"}\n',
+                          encoding='utf-8')
+
+        # Execute
+        with NewtonStubServer(fixtures={"x + x": "2 x"}) as server:
+            status = main([str(source), '-o', str(output), '--field', 'title', '--id-field', 'request_id',
+                           '--base-url', server.base_url, '--workers', '2'])
+
+        # Verify
+        records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert status == 0
+        assert records == [{'line': 1, 'id': 'a', 'expression': "x + x", 'result': "2 x"},
+                           {'line': 2, 'id': 'b', 'expression': "y", 'result': "y"}]
+        assert "2 done (0 errors)" in capsys.readouterr().err
+
+    def test_raw_passthrough(self, tmp_path, capsys):
+        """Test that --raw copies each response body into the output."""
+        source = tmp_path / "input.txt"
+        source.write_text("x + x\n", encoding='utf-8')
+
+        with NewtonStubServer() as server:
+            status = main([str(source), '--base-url', server.base_url, '--raw', '--quiet'])
+
+        record = json.loads(capsys.readouterr().out)
+        assert status == 0
+        assert record == {'line': 1, 'expression': "x + x",
+                          'response': {'operation': 'simplify', 'expression': "x + x", 'result': "2 x"}}
+
+    @pytest.mark.parametrize("library", ['json', 'auto'])
+    def test_raw_only_copies_bodies_with_stdlib_json(self, tmp_path, capsys, library):
+        """Test that --raw copies bodies undecoded with stdlib json and decodes them otherwise."""
+        source = tmp_path / "input.txt"
+        source.write_text("x + x\n", encoding='utf-8')
+
+        with NewtonStubServer() as server, \
+                patch('support.commands.bulk_simplify.SimplificationAPI', wraps=SimplificationAPI) as api_class:
+            status = main([str(source), '--base-url', server.base_url, '--raw', '--quiet',
+                           '--json-library', library])
+
+        expected = 'raw' if library == 'json' or available_decoders()[0] == 'json' else available_decoders()[0]
+        assert api_class.call_args.kwargs['decoder'] == expected
+        assert status == 0
+        assert json.loads(capsys.readouterr().out)['response']['result'] == "2 x"
+
+    def test_store_records_every_request(self, tmp_path, capsys):
+        """Test that --store appends each request's result and status to a result store."""
+        source = tmp_path / "input.txt"
+        source.write_text("x + x\ny\n", encoding='utf-8')
+        store_path = tmp_path / "results.nrs"
+
+        with NewtonStubServer() as server:
+            status = main([str(source), '--base-url', server.base_url, '--store', str(store_path), '--quiet'])
+
+        with ResultStore(store_path) as store:
+            rows = sorted((row.expression, row.result, row.status) for row in store)
+        assert status == 0
+        assert rows == [("x + x", "2 x", 200), ("y", "y", 200)]
+
+    def test_exit_status_is_error_count(self, tmp_path, capsys):
+        """Test that every failed line counts towards the exit status."""
+        source = tmp_path / "input.txt"
+        source.write_text("x\ny\n{bad\n", encoding='utf-8')
+
+        with NewtonStubServer(faults=FaultConfig(error_rate=1.0)) as server:
+            status = main([str(source), '--base-url', server.base_url, '--quiet'])
+
+        captured = capsys.readouterr()
+        assert status == 3
+        assert 'done' not in captured.err
+        assert len(captured.out.splitlines()) == 3
+
+    def test_invalid_workers(self):
+        """Test argument validation."""
+        with pytest.raises(SystemExit):
+            main(['--workers', '0'])
@@ -0,0 +1,99 @@
+"""
+Unit tests for the record/replay CassetteAdapter.
+"""
+
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from support.helpers.cassette import CassetteAdapter, interaction_key
+from support.mocks.newton_stub_server import NewtonStubServer, FaultConfig
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return tmp_path / "newton.jsonl"
+
+
+class TestCassetteAdapter:
+
+    def test_interaction_key_ignores_host(self):
+        """Test that cassettes are keyed by path, so any base URL replays them."""
+        local = interaction_key('get', "http://127.0.0.1:8002/v2/simplify/x%2Bx")
+        remote = interaction_key('GET', "https://newton.vercel.app/api/v2/simplify/x%2Bx")
+
+        assert local == "GET /v2/simplify/x%2Bx"
+        assert remote == "GET /api/v2/simplify/x%2Bx"
+
+    def test_invalid_mode(self, cassette_path):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            CassetteAdapter(cassette_path, 'rewind')
+
+    def test_record_mode_pool_size(self, cassette_path):
+        """Test that the default recording adapter gets the requested connection pool."""
+        adapter = CassetteAdapter.record(cassette_path, pool_size=3, pool_block=True)
+
+        assert (adapter.inner._pool_maxsize, adapter.inner._pool_block) == (3, True)
+        adapter.close()
+
+    def test_record_then_replay_offline(self, cassette_path):
+        """Test that recorded responses are replayed without touching the network."""
+        # Setup
+        with NewtonStubServer() as server:
+            with SimplificationAPI(base_url=server.base_url,
+                                   transport=CassetteAdapter.record(cassette_path)) as api:
+                recorded = api.simplify_custom_expression("2x + 3x")
+
+        # Execute
+        with patch('socket.socket.connect', side_effect=AssertionError("replay opened a socket")):
+            with SimplificationAPI(base_url=server.base_url,
+                                   transport=CassetteAdapter.replay(cassette_path)) as api:
+                replayed = api.simplify_custom_expression("2x + 3x")
+
+        # Verify
+        assert replayed == recorded
+        lines = cassette_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['status'] == 200
+
+    def test_replays_http_errors(self, cassette_path):
+        """Test that recorded error statuses surface as the usual client errors."""
+        # Setup
+        with NewtonStubServer(faults=FaultConfig(throttle_rate=1.0, retry_after=3)) as server:
+            with SimplificationAPI(base_url=server.base_url,
+                                   transport=CassetteAdapter.record(cassette_path)) as api:
+                with pytest.raises(requests.RequestException):
+                    api.simplify_custom_expression("x + x")
+
+        # Execute
+        adapter = CassetteAdapter.replay(cassette_path)
+        with SimplificationAPI(base_url=server.base_url, transport=adapter) as api:
+            with pytest.raises(requests.RequestException, match="HTTP error 429"):
+                api.simplify_custom_expression("x + x")
+
+        # Verify
+        assert adapter.interactions["GET /api/v2/simplify/x%20+%20x"]['headers']['Retry-After'] == '3'
+
+    def test_replay_miss_is_connection_error(self, cassette_path):
+        """Test that an unrecorded request fails like an unreachable server."""
+        with SimplificationAPI(transport=CassetteAdapter.replay(cassette_path)) as api:
+            with pytest.raises(requests.RequestException, match="Connection failed: No recorded response"):
+                api.simplify_custom_expression("x + x")
+
+    def test_later_recordings_win(self, cassette_path):
+        """Test that re-recording an interaction overrides the earlier line."""
+        # Setup
+        cassette_path.write_text(
+            '{"key":"GET /api/v2/simplify/x","status":200,"headers":{},"body":"{\\"result\\":\\"old\\"}"}\n'
+            '{"key":"GET /api/v2/simplify/x","status":200,"headers":{},"body":"{\\"result\\":\\"new\\"}"}\n',
+            encoding='utf-8'
+        )
+
+        # Execute
+        with SimplificationAPI(transport=CassetteAdapter.replay(cassette_path)) as api:
+            result = api.simplify_custom_expression("x")
+
+        # Verify
+        assert result['response'] == {'result': "new"}
@@ -0,0 +1,133 @@
+"""
+Unit tests for CircuitBreaker.
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock
+from support.helpers.circuit_breaker import CircuitBreaker, CircuitOpenError, is_upstream_failure
+
+
+def make_breaker(clock, **kwargs):
+    settings = dict(window_size=10, minimum_calls=4, failure_rate_threshold=0.5, slow_call_seconds=1.0,
+                    slow_call_rate_threshold=0.5, open_seconds=30, half_open_calls=2, clock=clock)
+    settings.update(kwargs)
+    return CircuitBreaker(**settings)
+
+
+def trip(breaker, calls=4):
+    for _ in range(calls):
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+
+    def test_stays_closed_below_minimum_calls(self, clock):
+        """Test that a few failures in a quiet period do not open the circuit."""
+        breaker = make_breaker(clock)
+
+        trip(breaker, calls=3)
+
+        assert breaker.state == 'closed'
+
+    def test_opens_on_failure_rate(self, clock):
+        """Test that the circuit opens once the failure rate reaches the threshold."""
+        breaker = make_breaker(clock)
+        for _ in range(2):
+            breaker.allow_request()
+            breaker.record_success(0.1)
+
+        trip(breaker, calls=2)
+
+        assert breaker.state == 'open'
+        assert not breaker.allow_request()
+        assert breaker.stats()['rejected'] == 1
+
+    def test_opens_on_slow_call_rate(self, clock):
+        """Test that successful but slow calls also open the circuit."""
+        breaker = make_breaker(clock)
+
+        for duration in (2.0, 2.0, 0.1, 0.1):
+            breaker.allow_request()
+            breaker.record_success(duration)
+
+        assert breaker.state == 'open'
+
+    def test_half_open_then_close(self, clock):
+        """Test that successful trial calls close the circuit."""
+        breaker = make_breaker(clock)
+        trip(breaker)
+
+        clock.now = 30
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # trial calls are limited
+        assert breaker.state == 'half_open'
+
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+
+        assert breaker.state == 'closed'
+
+    def test_half_open_failure_reopens(self, clock):
+        """Test that a failed trial call reopens the circuit and restarts the timer."""
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.now = 30
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == 'open'
+        clock.now = 59
+        assert not breaker.allow_request()
+
+    def test_transition_events(self, clock):
+        """Test that listeners receive every transition, even if one of them fails."""
+        breaker = make_breaker(clock)
+        events = []
+        breaker.add_listener(Mock(side_effect=RuntimeError("broken listener")))
+        breaker.add_listener(events.append)
+
+        trip(breaker)
+        clock.now = 30
+        breaker.allow_request()
+        breaker.allow_request()
+        breaker.record_success()
+        breaker.record_success()
+
+        assert [(e['from_state'], e['to_state']) for e in events] == [
+            ('closed', 'open'), ('open', 'half_open'), ('half_open', 'closed')
+        ]
+        assert events[0]['reason'] == "failure rate 100%"
+        assert breaker.stats()['transitions'] == 3
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="minimum_calls"):
+            CircuitBreaker(window_size=5, minimum_calls=6)
+        with pytest.raises(ValueError, match="rate thresholds"):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError, match="open_seconds"):
+            CircuitBreaker(open_seconds=0)
+
+
+class TestIsUpstreamFailure:
+
+    def http_error(self, status_code):
+        cause = requests.exceptions.HTTPError("error", response=Mock(status_code=status_code))
+        error = requests.RequestException(f"HTTP error {status_code}")
+        error.__cause__ = cause
+        return error
+
+    def test_classification(self):
+        """Test that only server-side problems count against the upstream."""
+        assert is_upstream_failure(self.http_error(503))
+        assert is_upstream_failure(self.http_error(429))
+        assert not is_upstream_failure(self.http_error(404))
+        assert is_upstream_failure(requests.exceptions.Timeout("slow"))
+
+    def test_open_error_is_request_exception(self):
+        """Test that fail-fast errors are handled like other request failures."""
+        assert issubclass(CircuitOpenError, requests.RequestException)
@@ -0,0 +1,95 @@
+"""
+Unit tests for compact SimplifyResult objects.
+"""
+
+import sys
+import pytest
+from unittest.mock import patch
+from support.helpers.compact_result import SimplifyResult
+from support.helpers.result_cache import ResultCache
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+class TestSimplifyResult:
+
+    def test_dict_style_access(self):
+        """Test that a compact result reads like the result dict."""
+        result = SimplifyResult.from_response("x + x", {'operation': 'simplify', 'expression': "x + x",
+                                                        'result': "2 x"})
+
+        assert result['original_expression'] == "x + x"
+        assert result['response']['result'] == "2 x"
+        assert result['response']['expression'] == "x + x"
+        assert 'response' in result and 'error' not in result
+        assert result.get('error') is None
+        assert result == {'original_expression': "x + x",
+                          'response': {'operation': 'simplify', 'expression': "x + x", 'result': "2 x"}}
+        assert result.to_dict() == result
+
+    def test_shares_strings(self):
+        """Test that the operation is interned and the echoed expression is not stored."""
+        operation = ''.join(['simp', 'lify'])
+        result = SimplifyResult.from_response("x + x", {'operation': operation, 'expression': "x + x",
+                                                        'result': "2 x"})
+
+        assert result.operation is sys.intern('simplify')
+        assert result._echo is None
+        assert not hasattr(result, '__dict__')
+
+    def test_keeps_differing_echo_and_extra_fields(self):
+        """Test that nothing from the response is lost."""
+        response = {'operation': 'simplify', 'expression': "x+x", 'result': "2 x", 'steps': 3}
+
+        result = SimplifyResult.from_response("x + x", response)
+
+        assert dict(result['response']) == response
+        assert dict(SimplifyResult.from_response("x + x", {'result': "2 x"})['response']) == {'result': "2 x"}
+
+    def test_shared_response_echoes_caller(self):
+        """Test that a shared response echoes the caller's spelling like build_shared_result."""
+        result = SimplifyResult.from_response("2x+4", {'operation': 'simplify', 'expression': "2x + 4",
+                                                       'result': "2 (x + 2)"}, shared=True)
+
+        assert result['response']['expression'] == "2x+4"
+
+    def test_missing_key(self):
+        """Test that unknown keys raise KeyError like a dict."""
+        result = SimplifyResult("x", 'simplify', "x")
+
+        with pytest.raises(KeyError):
+            result['error']
+        with pytest.raises(KeyError):
+            result['response']['steps']
+
+
+class TestSimplificationAPICompactResults:
+
+    @patch('requests.Session.get')
+    def test_compact_results_with_cache(self, mock_get, echo_response):
+        """Test compact results for network responses and cache hits."""
+        mock_get.side_effect = echo_response
+        api = SimplificationAPI(compact_results=True, cache=ResultCache())
+
+        first = api.simplify_custom_expression("2x + 4")
+        second = api.simplify_custom_expression("2x+4")
+
+        assert isinstance(first, SimplifyResult) and isinstance(second, SimplifyResult)
+        assert second['response']['expression'] == "2x+4"
+        assert second['response']['result'] == first['response']['result']
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_batch_returns_compact_results(self, mock_get, echo_response):
+        """Test that batch results are compact too."""
+        mock_get.side_effect = echo_response
+        api = SimplificationAPI(compact_results=True)
+
+        results = api.simplify_batch([f"{i}x" for i in range(5)], max_workers=2)
+
+        assert [result['original_expression'] for result in results] == [f"{i}x" for i in range(5)]
+        assert all(isinstance(result, SimplifyResult) for result in results)
+
+    def test_raw_decoder_rejected(self):
+        """Test that compact results need decoded responses."""
+        with pytest.raises(ValueError, match="cannot be combined with compact_results"):
+            SimplificationAPI(compact_results=True, decoder='raw')
@@ -1,142 +1,394 @@
-"""
-Unit tests for ArithmeticExpressionGenerator class.
-"""
-
-import pytest
-import re
-from support.helpers.data_generator import ArithmeticExpressionGenerator
-
-
-class TestArithmeticExpressionGenerator:
-    
-    def test_initialization(self):
-        """Test that ArithmeticExpressionGenerator initializes correctly."""
-        generator = ArithmeticExpressionGenerator()
-        assert len(generator.OPERATORS) == 4
-        assert any(op[0] == '+' for op in generator.OPERATORS)
-        assert any(op[0] == '-' for op in generator.OPERATORS)
-    
-    def test_generate_expression_default_params(self):
-        """Test expression generation with default parameters."""
-        generator = ArithmeticExpressionGenerator()
-        expression = generator.generate_expression()
-        
-        # Should contain 3 terms (default)
-        terms = expression.split()
-        # With 3 terms and 2 operators: term + term + term = 5 elements
-        assert len(terms) == 5
-        
-        # Should contain valid operators
-        operators = [terms[1], terms[3]]
-        assert all(op in ['+', '-'] for op in operators)
-    
-    def test_generate_expression_custom_params(self):
-        """Test expression generation with custom parameters."""
-        generator = ArithmeticExpressionGenerator()
-        expression = generator.generate_expression(num_terms=2, min_value=5, max_value=10)
-        
-        # Should contain 2 terms and 1 operator
-        terms = expression.split()
-        assert len(terms) == 3  # term + term = 3 elements
-        
-        # Check that the expression contains valid algebraic components
-        assert any(char in expression for char in ['x', '^', '+', '-'])
-    
-    def test_expression_contains_variable_x(self):
-        """Test that generated expressions contain the variable x."""
-        generator = ArithmeticExpressionGenerator()
-        expression = generator.generate_expression(num_terms=3)
-        
-        # Should contain 'x' variable
-        assert 'x' in expression
-    
-    def test_expression_structure_patterns(self):
-        """Test that expressions follow expected algebraic patterns."""
-        generator = ArithmeticExpressionGenerator()
-        
-        # Generate multiple expressions to test patterns
-        for _ in range(10):
-            expression = generator.generate_expression(num_terms=2)
-            
-            # Should match algebraic expression patterns
-            # Examples: "2x^2 + 3", "x - 5", "4x^3 + x", etc.
-            pattern = r'^[0-9]*x(\^[0-9]+)?\s*[\+\-]\s*[0-9]*x?(\^[0-9]+)?$|^[0-9]+\s*[\+\-]\s*[0-9]*x(\^[0-9]+)?$|^[0-9]*x(\^[0-9]+)?\s*[\+\-]\s*[0-9]+$'
-            # This is a simplified pattern - the actual expressions are more complex
-            assert any(char in expression for char in ['x', '+', '-'])
-    
-    @pytest.mark.parametrize("num_terms", [1, 2, 3, 4, 5])
-    def test_different_term_counts(self, num_terms):
-        """Test expression generation with different numbers of terms."""
-        generator = ArithmeticExpressionGenerator()
-        expression = generator.generate_expression(num_terms=num_terms)
-        
-        terms = expression.split()
-        expected_length = num_terms * 2 - 1  # terms + operators
-        assert len(terms) == expected_length
-    
-    @pytest.mark.parametrize("min_val,max_val", [
-        (1, 5),
-        (0, 10),
-        (5, 15),
-        (10, 20),
-    ])
-    def test_different_value_ranges(self, min_val, max_val):
-        """Test expression generation with different coefficient ranges."""
-        generator = ArithmeticExpressionGenerator()
-        expression = generator.generate_expression(num_terms=2, min_value=min_val, max_value=max_val)
-        
-        # Expression should be valid and non-empty
-        assert len(expression) > 0
-        assert any(char.isdigit() for char in expression)
-    
-    def test_expression_operators_are_valid(self):
-        """Test that only valid operators are used in expressions."""
-        generator = ArithmeticExpressionGenerator()
-        
-        for _ in range(5):
-            expression = generator.generate_expression(num_terms=3)
-            terms = expression.split()
-            
-            # Check operators (every other element starting from index 1)
-            operators = [terms[i] for i in range(1, len(terms), 2)]
-            assert all(op in ['+', '-'] for op in operators)
-    
-    def test_coefficient_handling(self):
-        """Test that coefficients are handled correctly."""
-        generator = ArithmeticExpressionGenerator()
-        
-        # Generate multiple expressions to increase chance of getting x terms
-        expressions_with_x = []
-        for _ in range(20):
-            expression = generator.generate_expression(num_terms=3, min_value=1, max_value=5)
-            if 'x' in expression:
-                expressions_with_x.append(expression)
-        
-        # Should get at least some expressions with x
-        assert len(expressions_with_x) > 0, "No expressions with 'x' variable were generated"
-        
-        # For expressions with x, check they have numbers (coefficients)
-        for expression in expressions_with_x[:5]:  # Check first 5
-            assert any(char.isdigit() for char in expression), f"Expression '{expression}' has no digits"
-    
-    def test_power_notation(self):
-        """Test that power notation (^) is used correctly."""
-        generator = ArithmeticExpressionGenerator()
-        
-        # Generate many expressions to increase chance of getting powers
-        expressions = [generator.generate_expression(num_terms=3) for _ in range(20)]
-        
-        # At least some should contain power notation
-        has_power = any('^' in expr for expr in expressions)
-        assert has_power, "No expressions with power notation were generated"
-    
-    def test_constant_terms(self):
-        """Test that constant terms (no x) can be generated."""
-        generator = ArithmeticExpressionGenerator()
-        
-        # Generate many expressions to increase chance of getting constants
-        expressions = [generator.generate_expression(num_terms=3) for _ in range(20)]
-        
-        # Check that we get various term types
-        has_constants = any(re.search(r'\b\d+\b(?!\s*x)', expr) for expr in expressions)
-        # Note: This regex looks for digits not followed by 'x'
+"""
+Unit tests for ArithmeticExpressionGenerator class.
+"""
+
+import time
+import pytest
+import re
+from itertools import islice
+from support.helpers.data_generator import ArithmeticExpressionGenerator, ExpressionSpace, ExpressionStream
+
+
+class TestArithmeticExpressionGenerator:
+    
+    def test_initialization(self):
+        """Test that ArithmeticExpressionGenerator initializes correctly."""
+        generator = ArithmeticExpressionGenerator()
+        assert len(generator.OPERATORS) == 4
+        assert any(op[0] == '+' for op in generator.OPERATORS)
+        assert any(op[0] == '-' for op in generator.OPERATORS)
+    
+    def test_generate_expression_default_params(self):
+        """Test expression generation with default parameters."""
+        generator = ArithmeticExpressionGenerator()
+        expression = generator.generate_expression()
+        
+        # Should contain 3 terms (default)
+        terms = expression.split()
+        # With 3 terms and 2 operators: term + term + term = 5 elements
+        assert len(terms) == 5
+        
+        # Should contain valid operators
+        operators = [terms[1], terms[3]]
+        assert all(op in ['+', '-'] for op in operators)
+    
+    def test_generate_expression_custom_params(self):
+        """Test expression generation with custom parameters."""
+        generator = ArithmeticExpressionGenerator()
+        expression = generator.generate_expression(num_terms=2, min_value=5, max_value=10)
+        
+        # Should contain 2 terms and 1 operator
+        terms = expression.split()
+        assert len(terms) == 3  # term + term = 3 elements
+        
+        # Check that the expression contains valid algebraic components
+        assert any(char in expression for char in ['x', '^', '+', '-'])
+    
+    def test_expression_contains_variable_x(self):
+        """Test that generated expressions contain the variable x."""
+        generator = ArithmeticExpressionGenerator()
+        expression = generator.generate_expression(num_terms=3)
+        
+        # Should contain 'x' variable
+        assert 'x' in expression
+    
+    def test_expression_structure_patterns(self):
+        """Test that expressions follow expected algebraic patterns."""
+        generator = ArithmeticExpressionGenerator()
+        
+        # Generate multiple expressions to test patterns
+        for _ in range(10):
+            expression = generator.generate_expression(num_terms=2)
+            
+            # Should match algebraic expression patterns
+            # Examples: "2x^2 + 3", "x - 5", "4x^3 + x", etc.
+            pattern = r'^[0-9]*x(\^[0-9]+)?\s*[\+\-]\s*[0-9]*x?(\^[0-9]+)?$|^[0-9]+\s*[\+\-]\s*[0-9]*x(\^[0-9]+)?$|^[0-9]*x(\^[0-9]+)?\s*[\+\-]\s*[0-9]+$'
+            # This is a simplified pattern - the actual expressions are more complex
+            assert any(char in expression for char in ['x', '+', '-'])
+    
+    @pytest.mark.parametrize("num_terms", [1, 2, 3, 4, 5])
+    def test_different_term_counts(self, num_terms):
+        """Test expression generation with different numbers of terms."""
+        generator = ArithmeticExpressionGenerator()
+        expression = generator.generate_expression(num_terms=num_terms)
+        
+        terms = expression.split()
+        expected_length = num_terms * 2 - 1  # terms + operators
+        assert len(terms) == expected_length
+    
+    @pytest.mark.parametrize("min_val,max_val", [
+        (1, 5),
+        (0, 10),
+        (5, 15),
+        (10, 20),
+    ])
+    def test_different_value_ranges(self, min_val, max_val):
+        """Test expression generation with different coefficient ranges."""
+        generator = ArithmeticExpressionGenerator()
+        expression = generator.generate_expression(num_terms=2, min_value=min_val, max_value=max_val)
+        
+        # Expression should be valid and non-empty
+        assert len(expression) > 0
+        assert any(char.isdigit() for char in expression)
+    
+    def test_expression_operators_are_valid(self):
+        """Test that only valid operators are used in expressions."""
+        generator = ArithmeticExpressionGenerator()
+        
+        for _ in range(5):
+            expression = generator.generate_expression(num_terms=3)
+            terms = expression.split()
+            
+            # Check operators (every other element starting from index 1)
+            operators = [terms[i] for i in range(1, len(terms), 2)]
+            assert all(op in ['+', '-'] for op in operators)
+    
+    def test_coefficient_handling(self):
+        """Test that coefficients are handled correctly."""
+        generator = ArithmeticExpressionGenerator()
+        
+        # Generate multiple expressions to increase chance of getting x terms
+        expressions_with_x = []
+        for _ in range(20):
+            expression = generator.generate_expression(num_terms=3, min_value=1, max_value=5)
+            if 'x' in expression:
+                expressions_with_x.append(expression)
+        
+        # Should get at least some expressions with x
+        assert len(expressions_with_x) > 0, "No expressions with 'x' variable were generated"
+        
+        # For expressions with x, check they have numbers (coefficients)
+        for expression in expressions_with_x[:5]:  # Check first 5
+            assert any(char.isdigit() for char in expression), f"Expression '{expression}' has no digits"
+    
+    def test_power_notation(self):
+        """Test that power notation (^) is used correctly."""
+        generator = ArithmeticExpressionGenerator()
+        
+        # Generate many expressions to increase chance of getting powers
+        expressions = [generator.generate_expression(num_terms=3) for _ in range(20)]
+        
+        # At least some should contain power notation
+        has_power = any('^' in expr for expr in expressions)
+        assert has_power, "No expressions with power notation were generated"
+    
+    def test_constant_terms(self):
+        """Test that constant terms (no x) can be generated."""
+        generator = ArithmeticExpressionGenerator()
+        
+        # Generate many expressions to increase chance of getting constants
+        expressions = [generator.generate_expression(num_terms=3) for _ in range(20)]
+        
+        # Check that we get various term types
+        has_constants = any(re.search(r'\b\d+\b(?!\s*x)', expr) for expr in expressions)
+        # Note: This regex looks for digits not followed by 'x'
+
+
+class TestGenerateBatch:
+    
+    TERM_PATTERN = re.compile(r'^(\d+|\d*x(\^[23])?)$')
+    
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+    
+    def test_batch_size_and_structure(self):
+        """Test that the batch has n expressions with num_terms terms each."""
+        generator = ArithmeticExpressionGenerator()
+        
+        expressions = generator.generate_batch(100, num_terms=4)
+        
+        assert len(expressions) == 100
+        for expression in expressions:
+            tokens = expression.split()
+            assert len(tokens) == 7
+            assert all(op in ['+', '-'] for op in tokens[1::2])
+            assert all(self.TERM_PATTERN.match(term) for term in tokens[::2])
+    
+    def test_batch_matches_single_expression_format(self):
+        """Test that every term a batch produces is formatted like generate_expression."""
+        generator = ArithmeticExpressionGenerator()
+        
+        expressions = generator.generate_batch(2000, num_terms=3, min_value=1, max_value=3)
+        terms = {term for expression in expressions for term in expression.split()[::2]}
+        
+        expected = {generator.format_term(c, p) for c in range(1, 4) for p in range(4)}
+        assert terms == expected
+    
+    def test_coefficients_stay_in_range(self):
+        """Test that coefficients respect min_value and max_value."""
+        generator = ArithmeticExpressionGenerator()
+        
+        for expression in generator.generate_batch(500, num_terms=2, min_value=5, max_value=7):
+            for term in expression.split()[::2]:
+                coeff = term.split('x')[0]
+                assert 5 <= int(coeff) <= 7
+    
+    def test_wide_coefficient_range(self):
+        """Test that a small batch over a huge coefficient range costs time in the batch size only."""
+        generator = ArithmeticExpressionGenerator()
+        generator.generate_batch(1)  # import numpy outside the timed call
+        
+        started_at = time.perf_counter()
+        expressions = generator.generate_batch(10, num_terms=3, min_value=1, max_value=10 ** 12)
+        
+        assert time.perf_counter() - started_at < 0.5
+        assert len(expressions) == 10
+        for expression in expressions:
+            for term in expression.split()[::2]:
+                assert self.TERM_PATTERN.match(term)
+                assert 1 <= int(term.split('x')[0] or 1) <= 10 ** 12
+    
+    def test_seed_is_reproducible(self):
+        """Test that the same seed produces the same batch."""
+        generator = ArithmeticExpressionGenerator()
+        
+        assert generator.generate_batch(50, seed=42) == generator.generate_batch(50, seed=42)
+        assert generator.generate_batch(50, seed=42) != generator.generate_batch(50, seed=43)
+    
+    def test_single_term_and_empty_batch(self):
+        """Test edge cases for num_terms and n."""
+        generator = ArithmeticExpressionGenerator()
+        
+        assert generator.generate_batch(0) == []
+        assert all(len(e.split()) == 1 for e in generator.generate_batch(10, num_terms=1))
+    
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'n': -1}, "n must be non-negative"),
+        ({'n': 1, 'num_terms': 0}, "num_terms must be greater than 0"),
+        ({'n': 1, 'min_value': 5, 'max_value': 1}, "min_value must not be greater than max_value"),
+    ])
+    def test_invalid_parameters(self, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            ArithmeticExpressionGenerator().generate_batch(**kwargs)
+
+
+class TestSeededGeneration:
+    
+    def test_seeded_generators_are_reproducible(self):
+        """Test that generators with the same seed produce the same expressions."""
+        first = ArithmeticExpressionGenerator(seed=7)
+        second = ArithmeticExpressionGenerator(seed=7)
+        
+        assert [first.generate_expression() for _ in range(20)] == [second.generate_expression() for _ in range(20)]
+    
+    def test_generators_do_not_share_global_state(self):
+        """Test that reseeding the global random module does not affect a seeded generator."""
+        import random
+        generator = ArithmeticExpressionGenerator(seed=7)
+        expected = ArithmeticExpressionGenerator(seed=7).generate_expression()
+        
+        random.seed(0)
+        
+        assert generator.generate_expression() == expected
+
+
+class TestExpressionStream:
+    
+    def test_stream_is_lazy_and_unbounded(self):
+        """Test that a stream can be consumed incrementally without an end."""
+        stream = ExpressionStream(seed=1, num_terms=2)
+        
+        expressions = list(islice(stream, 1000))
+        
+        assert len(expressions) == 1000
+        assert all(len(e.split()) == 3 for e in expressions)
+    
+    def test_stream_is_reproducible(self):
+        """Test that the same seed yields the same sequence, also when iterated again."""
+        stream = ExpressionStream(seed="nightly-run")
+        
+        assert stream.take(50) == stream.take(50)
+        assert stream.take(50) == ExpressionStream(seed="nightly-run").take(50)
+        assert stream.take(50) != ExpressionStream(seed="other-run").take(50)
+    
+    def test_root_stream_matches_seeded_generator(self):
+        """Test that the root stream is the seeded generator's output."""
+        generator = ArithmeticExpressionGenerator(seed=99)
+        
+        expected = [generator.generate_expression(3, 1, 20) for _ in range(10)]
+        
+        assert generator.stream(99).take(10) == expected
+    
+    def test_spawned_substreams_are_independent_and_deterministic(self):
+        """Test that per-worker substreams differ from each other and are stable across runs."""
+        workers = ExpressionStream(seed=5, num_terms=4).spawn(4)
+        
+        outputs = [tuple(worker.take(20)) for worker in workers]
+        
+        assert len(set(outputs)) == 4
+        assert outputs == [tuple(w.take(20)) for w in ExpressionStream(seed=5, num_terms=4).spawn(4)]
+        assert workers[2].take(20) == ExpressionStream(seed=5, num_terms=4).child(2).take(20)
+    
+    def test_nested_substreams(self):
+        """Test that children can be split further without colliding with siblings."""
+        root = ExpressionStream(seed=5)
+        
+        grandchild = root.child(0).child(1)
+        
+        assert grandchild.spawn_key == (0, 1)
+        assert grandchild.take(10) != root.child(1).take(10)
+    
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'seed': None}, "seed is required"),
+        ({'seed': 1, 'num_terms': 0}, "num_terms must be greater than 0"),
+        ({'seed': 1, 'min_value': 5, 'max_value': 1}, "min_value must not be greater than max_value"),
+    ])
+    def test_invalid_parameters(self, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            ExpressionStream(**kwargs)
+    
+    def test_invalid_spawn(self):
+        """Test that spawn and child reject invalid counts."""
+        stream = ExpressionStream(seed=1)
+        
+        with pytest.raises(ValueError, match="num_workers must be greater than 0"):
+            stream.spawn(0)
+        with pytest.raises(ValueError, match="index must be non-negative"):
+            stream.child(-1)
+
+
+class TestExpressionSpace:
+    
+    def test_size_and_order(self):
+        """Test the count of the space and that iteration matches indexing."""
+        space = ExpressionSpace(num_terms=2, min_value=1, max_value=5)
+        
+        expressions = list(space)
+        
+        assert len(space) == (5 * 4) ** 2 * 2
+        assert len(set(expressions)) == len(space)
+        assert expressions[:3] == ["1 + 1", "1 + x", "1 + x^2"]
+        assert [space[k] for k in range(len(space))] == expressions
+        assert space[-1] == "5x^3 - 5x^3"
+        assert space[1:4] == expressions[1:4]
+    
+    def test_rank_is_inverse_of_unrank(self):
+        """Test that every expression maps back to its index."""
+        space = ExpressionSpace(num_terms=2, min_value=1, max_value=5)
+        
+        assert all(space.rank(expression) == k for k, expression in enumerate(space))
+        assert space.index("x - 3") == 68
+        assert "x - 3" in space and "x * 3" not in space and "x" not in space
+        with pytest.raises(ValueError, match="not in this expression space"):
+            space.rank("6x + 1")
+    
+    def test_generated_expressions_are_in_space(self):
+        """Test that the space covers generate_expression output."""
+        generator = ArithmeticExpressionGenerator(seed=3)
+        space = generator.space()
+        
+        assert all(generator.generate_expression() in space for _ in range(200))
+    
+    def test_large_space_access(self):
+        """Test direct access and sampling beyond sys.maxsize."""
+        space = ExpressionSpace(num_terms=12)
+        
+        expression = space[space.size // 2]
+        sample = space.sample(5, seed=1)
+        
+        assert space.size > 2 ** 64
+        assert space.rank(expression) == space.size // 2
+        assert len(set(sample)) == 5 and all(e in space for e in sample)
+    
+    def test_shards_partition_the_space(self):
+        """Test that shards are disjoint and cover every index."""
+        space = ExpressionSpace(num_terms=1, min_value=1, max_value=10)
+        
+        shards = [space.shard(i, 3) for i in range(3)]
+        
+        assert [len(shard) for shard in shards] == [13, 13, 14]
+        assert [rank for shard in shards for rank in shard] == list(range(len(space)))
+        assert list(space.expressions(shards[1])) == space[13:26]
+    
+    def test_sample_without_replacement(self):
+        """Test that samples are distinct, reproducible and stay within a shard."""
+        space = ExpressionSpace(num_terms=2, min_value=1, max_value=3)
+        shard = space.shard(0, 2)
+        
+        sample = space.sample(len(shard), seed=7, ranks=shard)
+        
+        assert sorted(map(space.rank, sample)) == list(shard)
+        assert space.sample(10, seed=7) == space.sample(10, seed=7)
+        with pytest.raises(ValueError, match="n must be between 0"):
+            space.sample(len(space) + 1)
+    
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'num_terms': 0}, "num_terms must be greater than 0"),
+        ({'min_value': 5, 'max_value': 1}, "min_value must not be greater than max_value"),
+    ])
+    def test_invalid_parameters(self, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            ExpressionSpace(**kwargs)
+    
+    def test_invalid_shard(self):
+        """Test that shard rejects invalid arguments."""
+        space = ExpressionSpace()
+        
+        with pytest.raises(ValueError, match="num_shards must be greater than 0"):
+            space.shard(0, 0)
+        with pytest.raises(ValueError, match="index must be in range"):
+            space.shard(3, 3)
\ No newline at end of file
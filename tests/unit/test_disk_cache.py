@@ -0,0 +1,195 @@
+"""
+Unit tests for DiskResultCache.
+"""
+
+import sqlite3
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+from support.helpers.disk_cache import DiskResultCache
+
+
+def response_for(expression):
+    return {'operation': 'simplify', 'expression': expression, 'result': expression}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "simplify_cache.sqlite3"
+
+
+class TestDiskResultCache:
+
+    def test_get_miss_then_hit(self, cache_path):
+        """Test storing and reading back a response."""
+        with DiskResultCache(cache_path) as cache:
+            assert cache.get("x + x") is None
+            cache.set("x + x", response_for("x + x"))
+
+            assert cache.get("x+x") == response_for("x + x")
+            assert cache.stats()['hits'] == 1
+            assert cache.stats()['misses'] == 1
+
+    def test_entries_persist_across_instances(self, cache_path):
+        """Test that a new run sees responses written by a previous one."""
+        with DiskResultCache(cache_path) as cache:
+            cache.set("2x + 4", response_for("2x + 4"))
+
+        with DiskResultCache(cache_path) as cache:
+            assert cache.get("2x + 4") == response_for("2x + 4")
+            assert len(cache) == 1
+
+    def test_concurrent_writers_share_database(self, cache_path):
+        """Test that several writers on the same file do not lose entries."""
+        caches = [DiskResultCache(cache_path) for _ in range(2)]
+
+        def write(cache, offset):
+            for i in range(offset, 200, 4):
+                cache.set(f"{i}x", response_for(f"{i}x"))
+
+        threads = [threading.Thread(target=write, args=(caches[i % 2], i)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(caches[0]) == 200
+        assert caches[1].get("199x") == response_for("199x")
+        for cache in caches:
+            cache.close()
+
+    def test_ttl_expiry(self, cache_path):
+        """Test that expired entries are treated as misses."""
+        with patch('support.helpers.disk_cache.time.time', return_value=1000.0):
+            cache = DiskResultCache(cache_path, ttl=60)
+            cache.set("x", response_for("x"))
+
+        with patch('support.helpers.disk_cache.time.time', return_value=1061.0):
+            assert cache.get("x", allow_expired=True) == response_for("x")
+            assert cache.get("x") is None
+            assert cache.expirations == 1
+            assert cache.compact() == 1
+        cache.close()
+
+    def test_preload_serves_from_memory(self, cache_path):
+        """Test that preloaded entries are answered without querying SQLite."""
+        with DiskResultCache(cache_path) as cache:
+            for i in range(10):
+                cache.set(f"{i}x", response_for(f"{i}x"))
+
+        with DiskResultCache(cache_path) as cache:
+            assert cache.preload([f"{i}x" for i in range(5)] + ["missing"]) == 5
+            with patch.object(cache, '_db', Mock(execute=Mock(side_effect=AssertionError("SQLite was queried")))):
+                assert cache.get("3x") == response_for("3x")
+            assert cache.preload() == 10
+
+    def test_compact_removes_oldest_entries(self, cache_path):
+        """Test size-based compaction keeps the newest entries."""
+        with DiskResultCache(cache_path) as cache:
+            for i in range(100):
+                with patch('support.helpers.disk_cache.time.time', return_value=float(i)):
+                    cache.set(f"{i}x", response_for(f"{i}x"))
+            target = cache.data_size() // 2
+
+            removed = cache.compact(max_bytes=target)
+
+            assert removed > 0
+            assert cache.data_size() <= target
+            assert cache.get("99x") == response_for("99x")
+            assert cache.get("0x") is None
+            assert cache.evictions == removed
+
+    def test_automatic_compaction(self, cache_path):
+        """Test that max_bytes triggers compaction off the writing thread."""
+        compacting_threads = []
+        compact = DiskResultCache.compact
+
+        def record_thread(cache, *args, **kwargs):
+            compacting_threads.append(threading.current_thread())
+            return compact(cache, *args, **kwargs)
+
+        with patch.object(DiskResultCache, 'compact', record_thread), \
+                DiskResultCache(cache_path, max_bytes=2000, compact_interval=10) as cache:
+            for i in range(200):
+                cache.set(f"{i}x", response_for(f"{i}x"))
+            assert cache.wait_for_compaction(timeout=10)
+
+            assert cache.evictions > 0
+            assert compacting_threads and threading.current_thread() not in compacting_threads
+            assert cache.get("199x") == response_for("199x")
+
+    def test_threads_share_one_connection(self, cache_path):
+        """Test that worker threads of many short-lived pools do not open connections of their own."""
+        with patch('support.helpers.disk_cache.sqlite3.connect', wraps=sqlite3.connect) as connect, \
+                DiskResultCache(cache_path) as cache:
+            for batch in range(5):
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    list(executor.map(lambda i: cache.set(f"{batch}-{i}x", response_for(f"{i}x")), range(20)))
+
+            assert len(cache) == 100
+            assert connect.call_count == 1
+
+    def test_write_errors_are_swallowed(self, cache_path):
+        """Test that database errors are logged and treated as a dropped write and a miss."""
+        with DiskResultCache(cache_path) as cache:
+            cache._db.execute("DROP TABLE results")
+
+            cache.set("x", response_for("x"))
+
+            assert cache.get("x") is None
+            assert cache.misses == 1
+
+    def test_writes_during_compaction_are_deferred(self, cache_path):
+        """Test that writes do not wait for a running compaction and are stored when it ends."""
+        with DiskResultCache(cache_path) as cache:
+            cache.set("old", response_for("old"))
+            cache._compacting += 1
+            with patch.object(cache, '_db', Mock(side_effect=AssertionError("SQLite was used"))) as db:
+                cache.set("new", response_for("new"))
+
+                assert cache.get("new") == response_for("new")
+                assert db.mock_calls == []
+
+            cache._finish_compaction()
+            assert cache.preload() == 2
+
+    def test_invalidate_and_clear(self, cache_path):
+        """Test removing entries explicitly."""
+        with DiskResultCache(cache_path) as cache:
+            cache.set("x", response_for("x"))
+            cache.set("y", response_for("y"))
+            cache.preload()
+
+            cache.invalidate("x")
+            assert cache.get("x") is None
+
+            cache.clear()
+            assert cache.get("y") is None
+            assert len(cache) == 0
+
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'ttl': 0}, "ttl must be greater than 0"),
+        ({'max_bytes': 0}, "max_bytes must be greater than 0"),
+    ])
+    def test_invalid_parameters(self, cache_path, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            DiskResultCache(cache_path, **kwargs)
+
+    def test_simplification_api_uses_disk_cache(self, cache_path):
+        """Test that a rerun is answered from disk without network calls."""
+        from support.page_objects.api.simplification_api import SimplificationAPI
+
+        with DiskResultCache(cache_path) as cache:
+            cache.set("x + x", response_for("x + x"))
+
+        with DiskResultCache(cache_path) as cache, \
+                patch('requests.Session.get') as mock_get:
+            cache.preload(["x + x"])
+            api = SimplificationAPI(cache=cache)
+
+            result = api.simplify_custom_expression("x + x")
+
+            assert result['response']['result'] == "x + x"
+            mock_get.assert_not_called()
@@ -0,0 +1,41 @@
+"""
+Unit tests for import side effects: importing the client must not load heavy dependencies.
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LOADED_CHECK = ("import sys, {module}; "
+                "print(' '.join(name for name in ('requests', 'numpy') "
+                "if name in sys.modules))")
+
+
+class TestImportSideEffects:
+
+    @pytest.mark.parametrize("module", [
+        'support.helpers.api_helper',
+        'support.helpers.data_generator',
+        'support.page_objects.api.simplification_api',
+        'main',
+    ])
+    def test_import_does_not_load_heavy_dependencies(self, module):
+        """Test that requests and numpy are only loaded on first use."""
+        output = subprocess.run([sys.executable, '-c', LOADED_CHECK.format(module=module)], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == ''
+
+    def test_requests_loads_on_first_use(self):
+        """Test that requests is imported when the first client is created."""
+        code = ("import sys; from support.page_objects.api.simplification_api import SimplificationAPI; "
+                "print('requests' in sys.modules); api = SimplificationAPI(); "
+                "print('requests' in sys.modules, type(api.session).__name__)")
+
+        output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, check=True).stdout
+
+        assert output.split() == ['False', 'True', 'Session']
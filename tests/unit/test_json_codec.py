@@ -0,0 +1,122 @@
+"""
+Unit tests for pluggable JSON decoding and raw passthrough.
+"""
+
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from support.helpers.json_codec import RawJSON, available_decoders, get_decoder, get_encoder
+from support.helpers.result_cache import ResultCache
+from support.mocks.newton_stub_server import NewtonStubServer
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+BODY = b'{"operation": "simplify", "expression": "x + x", "result": "2 x"}'
+
+
+class TestGetDecoder:
+
+    @pytest.mark.parametrize("name", [name for name in available_decoders() if name != 'raw'])
+    def test_installed_decoders_agree(self, name):
+        """Test that every installed library decodes a response like the stdlib."""
+        assert get_decoder(name)(BODY) == json.loads(BODY)
+
+    def test_auto_prefers_fastest_installed(self):
+        """Test that auto picks the first installed library in AUTO_DECODERS order."""
+        expected = available_decoders()[0]
+
+        assert get_decoder('auto').__module__.split('.')[0] == expected
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Test the fallback when no third-party library is installed."""
+        with patch('support.helpers.json_codec.importlib.util.find_spec', return_value=None):
+            assert available_decoders() == ['json', 'raw']
+            assert get_decoder('auto') is json.loads
+
+    def test_unknown_and_missing_decoders(self):
+        """Test errors for unknown names and libraries that are not installed."""
+        with pytest.raises(ValueError, match="Unknown JSON library 'yaml'"):
+            get_decoder('yaml')
+        with patch('support.helpers.json_codec.importlib.import_module', side_effect=ImportError):
+            with pytest.raises(ImportError, match="JSON library 'ujson' is not installed"):
+                get_decoder('ujson')
+
+
+class TestGetEncoder:
+
+    @pytest.mark.parametrize("name", [name for name in available_decoders() if name != 'raw'])
+    def test_compact_utf8_output(self, name):
+        """Test that every installed library writes compact UTF-8 JSON."""
+        encoded = get_encoder(name)({'line': 1, 'expression': "x²", 'result': None})
+
+        assert encoded == '{"line":1,"expression":"x²","result":null}'.encode('utf-8')
+
+
+class TestRawJSON:
+
+    def test_keeps_body_and_decodes_on_demand(self):
+        """Test that the raw decoder keeps the bytes as received."""
+        raw = get_decoder('raw')(BODY)
+
+        assert bytes(raw) == BODY
+        assert raw.loads()['result'] == "2 x"
+
+    @pytest.mark.parametrize("body", [b'', b'  \n', b'<html>Bad Gateway</html>', b'{"result": "2 x"',
+                                      b'{"result": "2 x"} trailing}'])
+    def test_rejects_bodies_that_are_not_json(self, body):
+        """Test that empty, HTML and truncated bodies are rejected instead of forwarded."""
+        if body.endswith(b'trailing}') and 'orjson' not in available_decoders():
+            pytest.skip("full validation of raw bodies needs orjson")
+        with pytest.raises(ValueError):
+            get_decoder('raw')(body)
+
+    def test_compact_removes_line_breaks(self):
+        """Test that pretty-printed bodies can be embedded in JSONL."""
+        raw = RawJSON(b'{\r\n  "result": "2 x"\n}\n')
+
+        assert b'\n' not in raw.compact() and b'\r' not in raw.compact()
+        assert json.loads(raw.compact()) == {'result': "2 x"}
+
+
+class TestSimplificationAPIDecoder:
+
+    def test_raw_responses(self):
+        """Test that decoder='raw' returns the body received from the API."""
+        with NewtonStubServer() as server:
+            with SimplificationAPI(base_url=server.base_url, decoder='raw') as api:
+                result = api.simplify_custom_expression("x + x")
+
+        assert isinstance(result['response'], RawJSON)
+        assert result['response'].loads()['result'] == "2 x"
+
+    def test_custom_decoder(self):
+        """Test that a decoder function receives the body bytes."""
+        bodies = []
+
+        def decoder(body):
+            bodies.append(body)
+            return json.loads(body)
+
+        with NewtonStubServer() as server:
+            with SimplificationAPI(base_url=server.base_url, decoder=decoder) as api:
+                result = api.simplify_custom_expression("x + x")
+
+        assert result['response']['result'] == "2 x"
+        assert isinstance(bodies[0], bytes)
+
+    @patch('requests.Session.get')
+    def test_raw_invalid_body_is_a_request_error(self, mock_get):
+        """Test that a raw body that is not JSON fails the call like a decoding error."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'<html>Bad Gateway</html>'
+        mock_get.return_value = response
+
+        with SimplificationAPI(decoder='raw') as api:
+            with pytest.raises(requests.exceptions.InvalidJSONError):
+                api.simplify_custom_expression("x + x")
+
+    def test_raw_rejects_cache(self):
+        """Test that raw responses cannot be cached."""
+        with pytest.raises(ValueError, match="decoder='raw' cannot be combined"):
+            SimplificationAPI(decoder='raw', cache=ResultCache())
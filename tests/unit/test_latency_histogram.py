@@ -0,0 +1,85 @@
+"""
+Unit tests for LatencyHistogram.
+"""
+
+import pytest
+from support.helpers.latency_histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles are within the histogram's relative precision."""
+        histogram = LatencyHistogram()
+        # 1 ms .. 1000 ms in 1 ms steps
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        for percent, expected in [(50, 0.5), (90, 0.9), (99, 0.99), (99.9, 0.999)]:
+            assert histogram.percentile(percent) == pytest.approx(expected, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+        assert histogram.min == pytest.approx(0.001)
+        assert histogram.mean == pytest.approx(0.5005, rel=0.001)
+
+    def test_small_values_are_exact(self):
+        """Test that sub-128 microsecond values are stored exactly."""
+        histogram = LatencyHistogram()
+        histogram.record(0.000100)
+
+        assert histogram.percentile(50) == pytest.approx(0.000100)
+
+    def test_memory_does_not_grow_with_samples(self):
+        """Test that recording more samples does not allocate more buckets."""
+        histogram = LatencyHistogram(max_seconds=60)
+        buckets = len(histogram._counts)
+
+        for i in range(10000):
+            histogram.record(i / 1000)
+
+        assert len(histogram._counts) == buckets
+        assert histogram.count == 10000
+
+    def test_values_above_max_are_clamped(self):
+        """Test that samples beyond max_seconds land in the last bucket."""
+        histogram = LatencyHistogram(max_seconds=1)
+        histogram.record(5)
+
+        assert histogram.max == pytest.approx(1.0)
+
+    def test_merge(self):
+        """Test combining histograms recorded by different workers."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.010)
+        second.record(0.020)
+        second.record(0.030)
+
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.max == pytest.approx(0.030)
+        with pytest.raises(ValueError, match="different max_seconds"):
+            first.merge(LatencyHistogram(max_seconds=1))
+
+    def test_summary_keys(self):
+        """Test the summary exposes the reported percentiles in milliseconds."""
+        histogram = LatencyHistogram()
+        histogram.record(0.250)
+
+        summary = histogram.summary()
+
+        assert set(summary) == {'count', 'min_ms', 'mean_ms', 'max_ms', 'p50_ms', 'p90_ms', 'p99_ms', 'p999_ms'}
+        assert summary['p99_ms'] == pytest.approx(250, rel=0.02)
+
+    @pytest.mark.parametrize("percent", [-1, 101])
+    def test_invalid_percentile(self, percent):
+        """Test percentile range validation."""
+        with pytest.raises(ValueError, match="percent must be between 0 and 100"):
+            LatencyHistogram().percentile(percent)
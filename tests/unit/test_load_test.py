@@ -0,0 +1,166 @@
+"""
+Unit tests for the load-testing harness.
+A fake client stands in for SimplificationAPI.
+"""
+
+import json
+import threading
+import time
+import pytest
+import requests
+from support.commands.load_test import LoadTest, format_report, read_expressions, main
+
+
+class FakeAPI:
+    """Client double that sleeps and fails for configured expressions."""
+
+    def __init__(self, delay=0.0, failures=None):
+        self.delay = delay
+        self.failures = failures or {}
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def simplify_custom_expression(self, expression):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if expression in self.failures:
+                raise self.failures[expression]
+            return {'original_expression': expression, 'response': {'result': expression}}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def endless(expressions):
+    while True:
+        yield from expressions
+
+
+class TestLoadTest:
+
+    def test_closed_loop_respects_request_budget(self):
+        """Test that closed-loop mode sends exactly max_requests with N users."""
+        api = FakeAPI(delay=0.005)
+        test = LoadTest(api, endless(["x + x"]), max_requests=40)
+
+        report = test.run_closed_loop(users=4)
+
+        assert api.calls == 40
+        assert api.peak == 4
+        assert report['requests'] == 40
+        assert report['successes'] == 40
+        assert report['latency']['count'] == 40
+        assert report['latency']['p50_ms'] >= 5
+
+    def test_closed_loop_stops_at_duration(self):
+        """Test that closed-loop mode stops when the duration elapses."""
+        api = FakeAPI(delay=0.01)
+        test = LoadTest(api, endless(["x"]), duration=0.2)
+
+        report = test.run_closed_loop(users=2)
+
+        assert 0.2 <= report['elapsed_seconds'] < 1.0
+        assert report['throughput_rps'] > 0
+
+    def test_open_loop_arrival_rate(self):
+        """Test that open-loop mode starts requests at the configured rate."""
+        api = FakeAPI(delay=0.001)
+        test = LoadTest(api, endless(["x"]), duration=0.5)
+
+        report = test.run_open_loop(rate=100)
+
+        assert 45 <= report['requests'] <= 51
+        assert report['dropped'] == 0
+
+    def test_open_loop_drops_when_saturated(self):
+        """Test that arrivals beyond max_in_flight are dropped, not queued."""
+        api = FakeAPI(delay=0.5)
+        test = LoadTest(api, endless(["x"]), duration=0.2)
+
+        report = test.run_open_loop(rate=100, max_in_flight=2)
+
+        assert report['dropped'] > 0
+        assert api.peak <= 2
+
+    def test_errors_are_counted_by_category(self):
+        """Test error rate and a breakdown using the client metrics categories."""
+        unavailable = requests.Response()
+        unavailable.status_code = 503
+        api = FakeAPI(failures={
+            'bad': requests.exceptions.HTTPError("503 Server Error", response=unavailable),
+            'slow': requests.exceptions.ReadTimeout("read timeout"),
+        })
+        test = LoadTest(api, iter(['x', 'bad', 'slow', 'bad']), max_requests=10)
+
+        report = test.run_closed_loop(users=1)
+
+        assert report['requests'] == 4
+        assert report['error_rate'] == pytest.approx(0.75)
+        assert report['error_breakdown'] == {'http_503': 2, 'timeout': 1}
+        assert "http_503: 2" in format_report(report)
+
+    def test_report_is_json_serializable(self):
+        """Test that the report can be written as JSON."""
+        test = LoadTest(FakeAPI(), endless(["x"]), max_requests=5)
+
+        report = test.run_closed_loop(users=1)
+
+        assert json.loads(json.dumps(report))['requests'] == 5
+
+    @pytest.mark.parametrize("kwargs,message", [
+        ({}, "duration or max_requests must be set"),
+        ({'duration': 0}, "duration must be greater than 0"),
+        ({'max_requests': 0}, "max_requests must be greater than 0"),
+    ])
+    def test_invalid_parameters(self, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            LoadTest(FakeAPI(), ["x"], **kwargs)
+
+
+class TestLoadTestHelpers:
+
+    def test_read_expressions_cycles_file(self, tmp_path):
+        """Test that file input skips blank lines and restarts at the end."""
+        path = tmp_path / "expressions.txt"
+        path.write_text("x + x\n\n2x + 4\n")
+
+        source = read_expressions(str(path))
+
+        assert [next(source) for _ in range(5)] == ["x + x", "2x + 4", "x + x", "2x + 4", "x + x"]
+
+    def test_read_expressions_empty_file(self, tmp_path):
+        """Test that an empty input file is reported."""
+        path = tmp_path / "empty.txt"
+        path.write_text("\n")
+
+        with pytest.raises(ValueError, match="No expressions found"):
+            next(read_expressions(str(path)))
+
+    def test_main_writes_json_report(self, tmp_path, capsys):
+        """Test the CLI against an unreachable server: errors are reported, not raised."""
+        report_path = tmp_path / "report.json"
+
+        exit_code = main(['--requests', '3', '--users', '1', '--base-url', 'http://127.0.0.1:1/api/',
+                          '--json', str(report_path)])
+
+        report = json.loads(report_path.read_text())
+        assert exit_code == 0
+        assert report['requests'] == 3
+        assert report['error_breakdown'] == {'connection': 3}
+        assert "Throughput" in capsys.readouterr().out
+
+    def test_main_writes_prometheus_metrics(self, tmp_path):
+        """Test that --metrics exports the per-request client metrics."""
+        metrics_path = tmp_path / "newton.prom"
+
+        main(['--requests', '2', '--users', '1', '--base-url', 'http://127.0.0.1:1/api/',
+              '--metrics', str(metrics_path)])
+
+        assert 'newton_client_requests_total{source="remote",outcome="connection"} 2' in metrics_path.read_text()
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+Unit tests for LocalSimplifier and its polynomial helpers.
+"""
+
+import time
+import pytest
+from unittest.mock import Mock, patch
+from support.helpers.local_simplifier import LocalSimplifier, parse_polynomial, has_rational_root
+from support.helpers.data_generator import ArithmeticExpressionGenerator
+from support.page_objects.api.simplification_api import SimplificationAPI
+from tests.data import ExpectedResponses
+
+
+class TestParsePolynomial:
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("x + x", {1: 2}),
+        ("2x^3 + 4x^2 - 6x", {3: 2, 2: 4, 1: -6}),
+        ("5 - 5", {}),
+        ("-x + 3", {1: -1, 0: 3}),
+        ("x^2 - x^2 + 1", {0: 1}),
+    ])
+    def test_combines_like_terms(self, expression, expected):
+        """Test parsing and combining of like terms."""
+        assert parse_polynomial(expression) == expected
+
+    @pytest.mark.parametrize("expression", [
+        "", "2x + + 3", "x^", "2x + 3y", "x + ", "x ^ ^ 2", "((x))", "x^0", "x^4", "2 3",
+    ])
+    def test_rejects_unsupported_input(self, expression):
+        """Test that anything outside the supported grammar is rejected."""
+        assert parse_polynomial(expression) is None
+
+
+class TestHasRationalRoot:
+
+    @pytest.mark.parametrize("coefficients,expected", [
+        ({2: 1, 1: 2, 0: 1}, True),     # (x + 1)^2
+        ({2: 1, 0: -1}, True),          # (x - 1)(x + 1)
+        ({2: 2, 1: 1, 0: -1}, True),    # root at 1/2
+        ({2: 1, 1: 1, 0: 1}, False),
+        ({3: 1, 1: 2, 0: 1}, False),
+    ])
+    def test_rational_roots(self, coefficients, expected):
+        assert has_rational_root(coefficients) is expected
+
+    @pytest.mark.parametrize("coefficients,kwargs", [
+        ({2: 1, 0: 100000000000007}, {}),
+        ({2: 10 ** 18, 0: 1}, {}),
+        ({2: 720720, 0: 720720 - 1}, {'max_candidates': 100}),
+    ])
+    def test_declines_beyond_limits(self, coefficients, kwargs):
+        """Test that the test is not run for coefficients or candidate counts beyond the limits."""
+        assert has_rational_root(coefficients, **kwargs) is None
+
+
+class TestLocalSimplifier:
+
+    @pytest.mark.parametrize("expression", ["x + x", "3x + 6", "2x + 4"])
+    def test_matches_known_api_responses(self, expression):
+        """Test that local results match recorded API responses."""
+        engine = LocalSimplifier()
+
+        assert engine.simplify(expression) == ExpectedResponses.SAMPLE_RESPONSES[expression]
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("2x^2 + 4x^2", "6 x^2"),
+        ("2x + 3x", "5 x"),
+        ("x - x", "0"),
+        ("42", "42"),
+        ("2x^2 + 4x", "2 x (x + 2)"),
+        ("x^2 + x + 1", "x^2 + x + 1"),
+        ("3x^3 + 6x + 3", "3 (x^3 + 2 x + 1)"),
+    ])
+    def test_simplify_to_string(self, expression, expected):
+        """Test combining like terms and factoring common factors."""
+        assert LocalSimplifier().simplify_to_string(expression) == expected
+
+    @pytest.mark.parametrize("expression", [
+        "x^2 + 2x + 1",       # API factors to (x + 1)^2
+        "x^2 - 1",            # API may factor the difference of squares
+        "2x^3 + 4x^2 - 6x",   # Remaining factor has rational roots
+        "2 - 5x",             # Negative leading coefficient
+        "2x + 3y",            # Unparseable
+    ])
+    def test_defers_ambiguous_expressions(self, expression):
+        """Test that expressions with ambiguous output are left to the API."""
+        assert LocalSimplifier().simplify(expression) is None
+
+    @pytest.mark.parametrize("expression", [
+        "x^2 + 100000000000007",
+        "x^2 + 1000000000000000000000",
+        "1000000000000000000000x^3 + x + 7",
+    ])
+    def test_huge_coefficients_are_declined_quickly(self, expression):
+        """Test that huge coefficients go to the API instead of stalling the caller."""
+        started_at = time.perf_counter()
+
+        assert LocalSimplifier().simplify(expression) is None
+        assert time.perf_counter() - started_at < 0.1
+
+    def test_counts_local_and_remote_resolutions(self):
+        """Test local vs remote counters."""
+        engine = LocalSimplifier()
+
+        engine.simplify("x + x")
+        engine.simplify("x^2 - 1")
+        engine.simplify("2x")
+
+        assert engine.stats() == {'local': 2, 'remote': 1}
+
+    def test_handles_generated_expressions(self):
+        """Test that generated expressions are parsed and mostly resolved locally."""
+        generator = ArithmeticExpressionGenerator()
+        engine = LocalSimplifier()
+
+        for _ in range(200):
+            assert parse_polynomial(generator.generate_expression(num_terms=3)) is not None
+            engine.simplify(generator.generate_expression(num_terms=3))
+
+        assert engine.stats()['local'] > 0
+
+
+class TestSimplificationAPILocalEngine:
+
+    @patch('requests.Session.get')
+    def test_local_engine_skips_network(self, mock_get):
+        """Test that locally resolved expressions never reach the network."""
+        api = SimplificationAPI(local_engine=LocalSimplifier())
+
+        result = api.simplify_custom_expression("x + x")
+
+        assert result == {'original_expression': "x + x", 'response': ExpectedResponses.SAMPLE_RESPONSES["x + x"]}
+        mock_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_unhandled_expressions_fall_back_to_api(self, mock_get):
+        """Test that expressions the engine cannot handle are sent to the API."""
+        mock_response = Mock()
+        mock_response.json.return_value = ExpectedResponses.SAMPLE_RESPONSES["x^2 + 2x + 1"]
+        mock_get.return_value = mock_response
+        engine = LocalSimplifier()
+        api = SimplificationAPI(local_engine=engine)
+
+        result = api.simplify_custom_expression("x^2 + 2x + 1")
+
+        assert result['response']['result'] == "(x + 1)^2"
+        mock_get.assert_called_once()
+        assert engine.stats() == {'local': 0, 'remote': 1}
@@ -0,0 +1,117 @@
+"""
+Unit tests for hot-path logging: sampling, deferred queue handler and import-time behaviour.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import pytest
+from support.helpers.logging_config import HotPathLogging, SamplingFilter, DeferredQueueHandler
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ListHandler(logging.Handler):
+    """Collect formatted messages and the emitting thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(msg, level=logging.INFO, args=()):
+    return logging.LogRecord('support.test', level, __file__, 1, msg, args, None)
+
+
+class TestSamplingFilter:
+
+    def test_samples_per_template(self):
+        """Test that each message template is sampled independently."""
+        sampler = SamplingFilter(every=10)
+
+        first = [sampler.filter(make_record("Cache hit for expression: %s", args=(i,))) for i in range(25)]
+        second = [sampler.filter(make_record("Built API URL: %s", args=(i,))) for i in range(5)]
+
+        assert sum(first) == 3
+        assert second == [True, False, False, False, False]
+        assert sampler.dropped == 26
+
+    def test_warnings_always_pass(self):
+        """Test that warnings and errors are never sampled away."""
+        sampler = SamplingFilter(every=1000)
+
+        assert all(sampler.filter(make_record("Attempt %s failed", level=logging.WARNING)) for _ in range(5))
+
+    def test_invalid_rate(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="every must be at least 1"):
+            SamplingFilter(every=0)
+
+
+class TestDeferredQueueHandler:
+
+    def test_record_is_not_formatted_on_enqueue(self):
+        """Test that the message template and args are queued as-is."""
+        queued = []
+        handler = DeferredQueueHandler(type('Q', (), {'put_nowait': staticmethod(queued.append)})())
+
+        handler.handle(make_record("Expression: %s", args=("x + x",)))
+
+        assert queued[0].msg == "Expression: %s"
+        assert queued[0].args == ("x + x",)
+
+
+class TestHotPathLogging:
+
+    def test_writes_sampled_records_from_background_thread(self):
+        """Test that sampled records reach the handler on the listener thread."""
+        # Setup
+        handler = ListHandler()
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        logger = logging.getLogger('support.hot_path_test')
+
+        # Execute
+        with HotPathLogging(sample_every=10, handlers=[handler]):
+            for i in range(30):
+                logger.info("Simplifying custom expression: %s", i)
+            logger.error("Connection error for expression '%s'", "x")
+
+        # Verify
+        assert handler.messages == [
+            "INFO Simplifying custom expression: 0",
+            "INFO Simplifying custom expression: 10",
+            "INFO Simplifying custom expression: 20",
+            "ERROR Connection error for expression 'x'",
+        ]
+        assert threading.current_thread().name not in handler.threads
+
+    def test_stop_restores_logger(self):
+        """Test that level, propagation and handlers are restored."""
+        logger = logging.getLogger('support')
+        level, propagate, handlers = logger.level, logger.propagate, list(logger.handlers)
+
+        with HotPathLogging(handlers=[ListHandler()]):
+            assert logger.propagate is False
+            assert logger.level == logging.INFO
+
+        assert (logger.level, logger.propagate, logger.handlers) == (level, propagate, handlers)
+
+
+class TestImportSideEffects:
+
+    def test_import_does_not_configure_root_logger(self):
+        """Test that importing the client leaves the root logger untouched."""
+        code = ("import logging, support.page_objects.api.simplification_api; "
+                "print(len(logging.getLogger().handlers), logging.getLogger().level)")
+
+        output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, check=True).stdout
+
+        assert output.split() == ['0', str(logging.WARNING)]
@@ -0,0 +1,165 @@
+"""
+Unit tests for ClientMetrics and the instrumented transport.
+"""
+
+import requests
+from unittest.mock import patch
+from support.helpers.metrics import ClientMetrics
+from support.helpers.result_cache import ResultCache
+from support.mocks.newton_stub_server import NewtonStubServer, FaultConfig
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+def make_record(**fields):
+    record = {'expression': "x", 'source': 'remote', 'outcome': 'ok', 'status': 200, 'attempts': 1,
+              'reused_connection': True, 'queue_wait': 0.0, 'connect': 0.0, 'ttfb': 0.01,
+              'decode': 0.0001, 'total': 0.012}
+    record.update(fields)
+    return record
+
+
+class TestClientMetrics:
+
+    def test_observe_updates_counters_and_histograms(self):
+        """Test that records feed the request counters, connection reuse and phase histograms."""
+        metrics = ClientMetrics()
+
+        metrics.observe(make_record())
+        metrics.observe(make_record(reused_connection=False, connect=0.002))
+        metrics.observe(make_record(source='cache', attempts=0, reused_connection=None, ttfb=None))
+
+        snapshot = metrics.snapshot()
+        assert snapshot['requests'] == {'cache/ok': 1, 'remote/ok': 2}
+        assert snapshot['attempts'] == 2
+        assert snapshot['connections'] == {'new': 1, 'reused': 1}
+        assert snapshot['phases']['ttfb']['count'] == 2
+        assert snapshot['phases']['total']['count'] == 3
+
+    def test_hooks_receive_records(self):
+        """Test the hook API, including isolation from a failing hook."""
+        metrics = ClientMetrics()
+        seen = []
+        metrics.add_hook(lambda record: 1 / 0)
+        metrics.add_hook(seen.append)
+
+        metrics.observe(make_record())
+
+        assert seen[0]['expression'] == "x"
+
+    def test_prometheus_text(self):
+        """Test the exposition format, including collector gauges."""
+        metrics = ClientMetrics()
+        metrics.add_collector('cache', lambda: {'hits': 3, 'size': 10, 'state': 'closed'})
+        metrics.observe(make_record())
+
+        text = metrics.prometheus_text()
+
+        assert '# TYPE newton_client_requests_total counter' in text
+        assert 'newton_client_requests_total{source="remote",outcome="ok"} 1' in text
+        assert 'newton_client_connections_total{reused="true"} 1' in text
+        assert 'newton_client_request_seconds{phase="ttfb",quantile="0.5"}' in text
+        assert 'newton_client_request_seconds_count{phase="total"} 1' in text
+        assert 'newton_client_cache_hits 3' in text
+        assert 'state' not in text
+
+    def test_prometheus_label_values_are_escaped(self):
+        """Test that quotes, backslashes and newlines in label values keep the text format valid."""
+        metrics = ClientMetrics()
+        metrics.observe(make_record(outcome='say "hi"\\\nbye'))
+
+        text = metrics.prometheus_text()
+
+        assert 'outcome="say \\"hi\\"\\\\\\nbye"} 1' in text
+        assert text.endswith('\n')
+
+    def test_write_prometheus_file(self, tmp_path):
+        """Test writing the textfile-collector file."""
+        metrics = ClientMetrics()
+        path = tmp_path / "newton.prom"
+
+        metrics.write_prometheus(path)
+
+        assert path.read_text(encoding='utf-8') == metrics.prometheus_text()
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_serve_prometheus_endpoint(self):
+        """Test the /metrics HTTP endpoint."""
+        metrics = ClientMetrics()
+        server = metrics.serve_prometheus()
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            response = requests.get(f"{base}/metrics")
+            missing = requests.get(f"{base}/other")
+        finally:
+            server.shutdown()
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+        assert 'newton_client_requests_total' in response.text
+        assert missing.status_code == 404
+
+
+class TestSimplificationAPIMetrics:
+
+    def test_records_connection_phases(self, stub_server):
+        """Test connect, TTFB and reuse timings over a real keep-alive connection."""
+        # Setup
+        metrics = ClientMetrics()
+        records = []
+        metrics.add_hook(records.append)
+
+        # Execute
+        with SimplificationAPI(base_url=stub_server.base_url, metrics=metrics) as api:
+            api.simplify_custom_expression("x + 1")
+            api.simplify_custom_expression("x + 2")
+
+        # Verify
+        first, second = records
+        assert first['reused_connection'] is False and first['connect'] > 0
+        assert second['reused_connection'] is True and second['connect'] == 0.0
+        for record in records:
+            assert record['status'] == 200
+            assert record['attempts'] == 1
+            assert 0 < record['ttfb'] <= record['total']
+            assert record['decode'] is not None
+
+    def test_records_sources_and_cache_stats(self, stub_server):
+        """Test cache hits as a source and the cache collector in the export."""
+        metrics = ClientMetrics()
+        with SimplificationAPI(base_url=stub_server.base_url, metrics=metrics, cache=ResultCache()) as api:
+            api.simplify_custom_expression("x + 3")
+            api.simplify_custom_expression("x + 3")
+
+        assert metrics.snapshot()['requests'] == {'cache/ok': 1, 'remote/ok': 1}
+        assert 'newton_client_cache_hits 1' in metrics.prometheus_text()
+
+    def test_records_errors_and_batch_queue_wait(self):
+        """Test error outcomes and time spent queued behind busy batch workers."""
+        # Setup
+        metrics = ClientMetrics()
+        records = []
+        metrics.add_hook(records.append)
+
+        # Execute
+        with NewtonStubServer(faults=FaultConfig(error_rate=1.0)) as server:
+            with SimplificationAPI(base_url=server.base_url, metrics=metrics) as api:
+                results = api.simplify_batch([f"x + {i}" for i in range(6)], max_workers=1)
+
+        # Verify
+        assert all('error' in result for result in results)
+        assert {record['outcome'] for record in records} == {'http_503'}
+        assert {record['status'] for record in records} == {503}
+        assert records[-1]['queue_wait'] > 0
+
+    @patch('requests.Session.get')
+    def test_uninstrumented_transport_has_no_connection_timings(self, mock_get, mock_successful_response):
+        """Test that phases the transport cannot measure are left as None."""
+        mock_get.return_value = mock_successful_response
+        records = []
+        metrics = ClientMetrics()
+        metrics.add_hook(records.append)
+
+        SimplificationAPI(metrics=metrics).simplify_custom_expression("x + x")
+
+        assert records[0]['attempts'] == 1
+        assert records[0]['connect'] is None and records[0]['ttfb'] is None
@@ -0,0 +1,126 @@
+"""
+Unit tests for the local Newton stub server.
+"""
+
+import time
+import pytest
+import requests
+from support.mocks.newton_stub_server import NewtonStubServer, FaultConfig, LatencyDistribution, load_fixtures
+from support.page_objects.api.simplification_api import SimplificationAPI
+from tests.data import ExpectedResponses
+
+
+class TestNewtonStubServer:
+
+    def test_answers_from_fixtures(self, stub_server):
+        """Test that fixture responses are served verbatim."""
+        with SimplificationAPI(base_url=stub_server.base_url) as api:
+            result = api.simplify_custom_expression("x^2 + 2x + 1")
+
+        assert result['response'] == ExpectedResponses.SAMPLE_RESPONSES["x^2 + 2x + 1"]
+
+    def test_answers_from_local_engine_then_echo(self, stub_server):
+        """Test fallback to the local engine, then echoing the expression."""
+        with SimplificationAPI(base_url=stub_server.base_url) as api:
+            local = api.simplify_custom_expression("2x^2 + 4x^2")
+            echoed = api.simplify_custom_expression("x^2 - 1")
+
+        assert local['response'] == {'operation': 'simplify', 'expression': "2x^2 + 4x^2", 'result': "6 x^2"}
+        assert echoed['response']['result'] == "x^2 - 1"
+
+    def test_connections_are_kept_alive(self, stub_server):
+        """Test that a pooled client reuses one connection for many requests."""
+        with SimplificationAPI(base_url=stub_server.base_url) as api:
+            for _ in range(20):
+                api.simplify_custom_expression("x + x")
+
+        assert stub_server.stats['requests'] == 20
+        assert stub_server.stats['connections'] == 1
+
+    def test_unknown_route_returns_404(self, stub_server):
+        """Test that only the simplify route is implemented."""
+        response = requests.get(f"{stub_server.base_url}v2/derive/x")
+
+        assert response.status_code == 404
+
+    def test_throttling_returns_429_with_retry_after(self):
+        """Test injected 429 responses."""
+        with NewtonStubServer(faults=FaultConfig(throttle_rate=1.0, retry_after=7)) as server:
+            response = requests.get(f"{server.base_url}v2/simplify/x")
+
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '7'
+
+    def test_error_rate_maps_to_client_errors(self):
+        """Test injected server errors reach the client as RequestException."""
+        with NewtonStubServer(faults=FaultConfig(error_rate=1.0, error_status=500)) as server:
+            with SimplificationAPI(base_url=server.base_url) as api:
+                with pytest.raises(requests.RequestException, match="HTTP error 500"):
+                    api.simplify_custom_expression("x")
+
+    def test_error_rate_is_sampled(self):
+        """Test that a partial error rate fails roughly that share of requests."""
+        with NewtonStubServer(faults=FaultConfig(error_rate=0.25), seed=3) as server:
+            with SimplificationAPI(base_url=server.base_url) as api:
+                results = api.simplify_batch([f"{i}x" for i in range(400)], max_workers=4)
+
+        failures = sum('error' in result for result in results)
+        assert 60 <= failures <= 140
+
+    def test_fixed_latency(self):
+        """Test injected latency."""
+        with NewtonStubServer(faults=FaultConfig(latency="fixed:0.1")) as server:
+            start = time.perf_counter()
+            requests.get(f"{server.base_url}v2/simplify/x")
+
+        assert time.perf_counter() - start >= 0.1
+
+    def test_slow_loris_response(self):
+        """Test that slow responses trickle out and trip client read timeouts."""
+        with NewtonStubServer(faults=FaultConfig(slow_rate=1.0, slow_chunk_delay=0.3)) as server:
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                requests.get(f"{server.base_url}v2/simplify/x", timeout=(1, 0.2))
+            assert server.stats['slow_responses'] == 1
+
+
+class TestFaultConfiguration:
+
+    @pytest.mark.parametrize("spec,kind", [
+        ("none", "none"),
+        ("fixed:0.05", "fixed"),
+        ("uniform:0.01:0.1", "uniform"),
+        ("exponential:0.02", "exponential"),
+        ("lognormal:0.05:0.5", "lognormal"),
+    ])
+    def test_parse_latency(self, spec, kind):
+        """Test latency distribution specs."""
+        import random
+        distribution = LatencyDistribution.parse(spec)
+
+        assert distribution.kind == kind
+        assert distribution.sample(random.Random(1)) >= 0
+
+    @pytest.mark.parametrize("spec,message", [
+        ("gamma:1", "Unknown latency distribution"),
+        ("fixed", "takes 1 parameter"),
+        ("uniform:-1:1", "must be non-negative"),
+    ])
+    def test_invalid_latency(self, spec, message):
+        with pytest.raises(ValueError, match=message):
+            LatencyDistribution.parse(spec)
+
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'error_rate': 1.5}, "error_rate must be between 0 and 1"),
+        ({'slow_rate': -0.1}, "slow_rate must be between 0 and 1"),
+        ({'error_rate': 0.6, 'throttle_rate': 0.6}, "must not exceed 1"),
+    ])
+    def test_invalid_fault_rates(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            FaultConfig(**kwargs)
+
+    def test_load_fixtures(self, tmp_path):
+        """Test loading a fixture table from JSON."""
+        path = tmp_path / "fixtures.json"
+        path.write_text('{"x + x": "2 x"}')
+
+        assert load_fixtures(str(path)) == {"x + x": "2 x"}
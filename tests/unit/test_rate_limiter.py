@@ -0,0 +1,138 @@
+"""
+Unit tests for TokenBucket and AdaptiveConcurrencyLimiter.
+"""
+
+import threading
+import pytest
+from support.helpers.rate_limiter import TokenBucket, AdaptiveConcurrencyLimiter
+
+
+class TestTokenBucket:
+
+    def test_burst_then_paced(self, clock):
+        """Test that a full bucket allows a burst and then paces at the rate."""
+        bucket = TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(10)]
+
+        assert waits[:5] == [0.0] * 5
+        assert all(wait == pytest.approx(0.1) for wait in waits[5:])
+        assert clock.now == pytest.approx(0.5)
+
+    def test_refills_over_time(self, clock):
+        """Test that tokens refill up to the burst size."""
+        bucket = TokenBucket(rate=2, burst=2, clock=clock, sleep=clock.sleep)
+        assert bucket.try_acquire() and bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+        clock.now = 100
+
+        assert bucket.try_acquire() and bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_concurrent_waiters_are_spaced(self):
+        """Test that concurrent callers reserve distinct future tokens."""
+        # A frozen clock keeps thread start-up time from refilling the bucket
+        bucket = TokenBucket(rate=1000, burst=1, clock=lambda: 0.0, sleep=lambda seconds: None)
+        waits = []
+
+        def worker():
+            waits.append(bucket.acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert bucket.stats()['acquired'] == 20
+        assert max(waits) >= 0.015
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="rate must be greater than 0"):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError, match="burst must be at least 1"):
+            TokenBucket(rate=5, burst=0.5)
+
+
+class TestAdaptiveConcurrencyLimiter:
+
+    def run_calls(self, limiter, clock, count, latency=0.1, dropped=False):
+        for _ in range(count):
+            started_at = limiter.acquire()
+            clock.now += latency
+            limiter.release(started_at, dropped)
+
+    def test_additive_increase(self, clock):
+        """Test that healthy calls grow the limit by about one per limit's worth of calls."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, clock=clock)
+
+        self.run_calls(limiter, clock, 3)
+        assert limiter.limit == 4
+        self.run_calls(limiter, clock, 2)
+        assert limiter.limit == 5
+
+        self.run_calls(limiter, clock, 500)
+        assert limiter.limit == 8
+
+    def test_multiplicative_decrease_on_drop(self, clock):
+        """Test that a 429/timeout halves the limit but not below min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, clock=clock)
+
+        self.run_calls(limiter, clock, 1, dropped=True)
+        assert limiter.limit == 4
+
+        self.run_calls(limiter, clock, 3, dropped=True)
+        assert limiter.limit == 2
+
+    def test_one_decrease_per_round_trip(self, clock):
+        """Test that calls in flight when the limit was cut cannot cut it again."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, clock=clock)
+        started = [limiter.acquire() for _ in range(4)]
+        clock.now = 1.0
+
+        for started_at in started:
+            limiter.release(started_at, dropped=True)
+
+        assert limiter.limit == 4
+        assert limiter.stats()['decreases'] == 1
+
+    def test_latency_spike_decreases(self, clock):
+        """Test that a call far slower than the smoothed latency counts as overload."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, clock=clock)
+        self.run_calls(limiter, clock, 20, latency=0.1)
+
+        self.run_calls(limiter, clock, 1, latency=0.5)
+
+        assert limiter.limit == 4
+        assert limiter.stats()['baseline_latency_ms'] > 100
+
+    def test_acquire_blocks_at_limit(self):
+        """Test that callers wait once the limit of in-flight requests is reached."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        first = limiter.acquire()
+        acquired = threading.Event()
+
+        def second():
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        limiter.release(first)
+
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.stats()['peak_in_flight'] == 1
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="limits must satisfy"):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ValueError, match="backoff_ratio"):
+            AdaptiveConcurrencyLimiter(backoff_ratio=1)
+        with pytest.raises(ValueError, match="latency_tolerance"):
+            AdaptiveConcurrencyLimiter(latency_tolerance=0.5)
@@ -0,0 +1,228 @@
+"""
+Unit tests for the generic RestClient and the api_commands shortcuts.
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from support.commands import api_commands
+from support.constants.http_methods import HttpMethod
+from support.helpers.circuit_breaker import CircuitBreaker, CircuitOpenError
+from support.helpers.metrics import ClientMetrics
+from support.helpers.retry_policy import RetryPolicy
+from support.page_objects.api.rest_client import RestClient, error_category
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+def json_response(data=None, status_code=200):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.content = b'{}' if data is not None else b''
+    mock_response.json.return_value = data
+    if status_code >= 400:
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    return mock_response
+
+
+def no_sleep_policy():
+    return RetryPolicy(max_attempts=3, sleep=lambda delay: None)
+
+
+class TestRestClient:
+
+    @pytest.mark.parametrize("method", list(HttpMethod))
+    def test_dispatches_on_http_method(self, method):
+        """Test that each HttpMethod goes to the matching session method with the shared timeout."""
+        client = RestClient(base_url="http://service.local/", timeout=2.5)
+
+        with patch.object(client.session, method.value.lower(), return_value=json_response({'ok': True})) as send:
+            result = client.request(method, 'items/1')
+
+        url = send.call_args.args[0]
+        assert url == "http://service.local/v2/items/1"
+        assert send.call_args.kwargs['timeout'] == 2.5
+        assert result == (None if method is HttpMethod.HEAD else {'ok': True})
+
+    def test_body_params_and_headers(self):
+        """Test JSON bodies, query parameters and extra headers."""
+        client = RestClient(base_url="http://service.local/")
+
+        with patch.object(client.session, 'post', return_value=json_response({'id': 7})) as post:
+            result = client.post('jobs', body={'expression': "x + x"}, params={'dry_run': 1},
+                                 headers={'X-Trace': 'abc'}, token='secret')
+
+        assert result == {'id': 7}
+        assert post.call_args.args[0] == "http://service.local/v2/jobs?dry_run=1"
+        assert post.call_args.kwargs['json'] == {'expression': "x + x"}
+        assert post.call_args.kwargs['headers'] == {'Content-Type': 'application/json',
+                                                    'Authorization': 'Bearer secret', 'X-Trace': 'abc'}
+
+    def test_method_names_and_invalid_methods(self):
+        """Test that method names are accepted and unknown methods rejected."""
+        client = RestClient()
+
+        with patch.object(client.session, 'delete', return_value=json_response(status_code=204)):
+            assert client.request('DELETE', 'items/1') is None
+        with pytest.raises(ValueError):
+            client.request('FETCH', 'items/1')
+
+    @pytest.mark.parametrize("content", [b'', b'<html>Bad Gateway</html>'])
+    @pytest.mark.parametrize("decoder", [None, 'json'])
+    def test_empty_or_invalid_body_is_a_decode_error(self, content, decoder):
+        """Test that a 200 response without a JSON body raises a request error, not a TypeError."""
+        client = RestClient(decoder=decoder)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = content
+
+        with patch.object(client.session, 'get', return_value=response):
+            with pytest.raises(requests.exceptions.InvalidJSONError) as error:
+                client.get('items/1')
+
+        assert error.value.response is response
+        assert error_category(error.value) == 'decode'
+
+    @patch('requests.Session.get')
+    def test_simplification_api_reports_empty_body(self, mock_get):
+        """Test that SimplificationAPI raises the request error for an empty body instead of 'Unexpected error'."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b''
+        mock_get.return_value = response
+
+        with pytest.raises(requests.exceptions.InvalidJSONError, match="Empty response body"):
+            SimplificationAPI().simplify_custom_expression("x + x")
+
+    def test_http_errors_are_mapped(self):
+        """Test that errors use the same messages as SimplificationAPI."""
+        client = RestClient()
+
+        with patch.object(client.session, 'get', return_value=json_response(status_code=404)):
+            with pytest.raises(requests.RequestException, match="HTTP error 404"):
+                client.get('missing')
+
+    @pytest.mark.parametrize("error,category", [
+        (requests.exceptions.ConnectTimeout("timed out"), 'timeout'),
+        (requests.exceptions.ConnectionError("refused"), 'connection'),
+        (requests.exceptions.HTTPError("503 Error", response=Mock(status_code=503)), 'http_503'),
+        (requests.exceptions.InvalidJSONError("bad body"), 'decode'),
+        (CircuitOpenError("circuit open"), 'circuit_open'),
+        (requests.RequestException("Unexpected error"), 'error'),
+    ])
+    def test_error_category(self, error, category):
+        """Test the metrics outcome for each kind of failure, including mapped errors."""
+        mapped = requests.RequestException("mapped")
+        mapped.__cause__ = error
+
+        assert error_category(error) == category
+        assert error_category(mapped) == category
+
+    def test_only_idempotent_requests_are_retried(self):
+        """Test that POST is not retried unless marked idempotent, while GET is."""
+        client = RestClient(retry_policy=no_sleep_policy())
+        unavailable = json_response(status_code=503)
+
+        with patch.object(client.session, 'post', side_effect=[unavailable, json_response({})]) as post:
+            with pytest.raises(requests.RequestException, match="HTTP error 503"):
+                client.post('jobs', body={})
+        assert post.call_count == 1
+
+        with patch.object(client.session, 'post', side_effect=[unavailable, json_response({})]) as post:
+            client.post('jobs', body={}, idempotent=True)
+        assert post.call_count == 2
+
+        with patch.object(client.session, 'get', side_effect=[unavailable, json_response({})]) as get:
+            client.get('jobs')
+        assert get.call_count == 2
+
+    def test_circuit_breaker_fails_fast(self):
+        """Test that an open circuit rejects requests without sending them."""
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        client = RestClient(circuit_breaker=breaker)
+
+        with patch.object(client.session, 'get', return_value=json_response(status_code=503)) as get:
+            for _ in range(2):
+                with pytest.raises(requests.RequestException):
+                    client.get('jobs')
+            with pytest.raises(CircuitOpenError):
+                client.get('jobs')
+
+        assert get.call_count == 2
+
+    def test_guarded_serves_fallback_while_open(self):
+        """Test that guarded() records call outcomes and returns on_open() while the circuit is open."""
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        client = RestClient(circuit_breaker=breaker)
+        call = Mock(side_effect=requests.exceptions.ConnectionError("refused"))
+
+        for _ in range(2):
+            with pytest.raises(requests.RequestException):
+                client.guarded(call, 'jobs', on_open=lambda: 'fallback')
+
+        assert client.guarded(call, 'jobs', on_open=lambda: 'fallback') == 'fallback'
+        assert call.call_count == 2
+        assert breaker.state == 'open'
+
+    def test_metrics_record_per_request(self, stub_server):
+        """Test timing records and collectors for generic requests over a real connection."""
+        # Setup
+        metrics = ClientMetrics()
+        records = []
+        metrics.add_hook(records.append)
+
+        # Execute
+        with RestClient(base_url=stub_server.base_url, metrics=metrics, retry_policy=RetryPolicy()) as client:
+            result = client.get('simplify/x + x')
+
+        # Verify
+        assert result['result'] == "2 x"
+        assert records[0]['method'] == 'GET' and records[0]['endpoint'] == 'simplify/x + x'
+        assert records[0]['status'] == 200 and records[0]['reused_connection'] is False
+        assert 'newton_client_retry_requests 1' in metrics.prometheus_text()
+
+
+class TestSharedWithSimplificationAPI:
+
+    def test_shares_pool_and_policies(self, stub_server):
+        """Test that SimplificationAPI sends through its RestClient and shares its setup."""
+        metrics = ClientMetrics()
+        policy = RetryPolicy()
+
+        with SimplificationAPI(base_url=stub_server.base_url, retry_policy=policy, metrics=metrics) as api:
+            api.simplify_custom_expression("x + 1")
+            raw = api.rest_client.get('simplify/3x + x')
+
+        assert api.rest_client.session is api.session
+        assert api.rest_client.retry_policy is policy
+        assert raw['result'] == "4 x"
+        assert policy.stats()['requests'] == 2
+        assert metrics.snapshot()['requests'] == {'remote/ok': 2}
+
+
+class TestApiCommands:
+
+    def test_base_url_is_a_prefix(self, stub_server):
+        """Test that base_url is prepended to the endpoint as-is and calls share one client."""
+        try:
+            result = api_commands.api_get('v2/simplify/2x + 3x', base_url=stub_server.base_url)
+
+            assert result['result'] == "5 x"
+            assert api_commands.get_client() is api_commands.get_client()
+        finally:
+            api_commands.close_client()
+
+    def test_uses_installed_client(self, stub_server):
+        """Test that shortcuts go through an installed SimplificationAPI client and its metrics."""
+        metrics = ClientMetrics()
+        with SimplificationAPI(base_url=stub_server.base_url, metrics=metrics) as api:
+            api_commands.set_client(api.rest_client)
+            try:
+                result = api_commands.api_get('simplify/x + x')
+
+                assert api_commands.get_client() is api.rest_client
+            finally:
+                api_commands.close_client()
+
+            assert result['result'] == "2 x"
+            assert metrics.snapshot()['requests'] == {'remote/ok': 1}
@@ -0,0 +1,111 @@
+"""
+Unit tests for ResultCache and expression normalization.
+"""
+
+import pytest
+from support.helpers.result_cache import ResultCache, normalize_expression
+
+
+class TestNormalizeExpression:
+
+    @pytest.mark.parametrize("expression,expected", [
+        ("2x + 4", "2x+4"),
+        ("  2x+4 ", "2x+4"),
+        ("x^2\t-\n1", "x^2-1"),
+        ("2  3x + 1", "2 3x+1"),
+    ])
+    def test_whitespace_is_ignored(self, expression, expected):
+        """Test that whitespace differences map to the same key."""
+        assert normalize_expression(expression) == expected
+
+    def test_separated_operands_do_not_collide(self):
+        """Test that "2 3x" and "23x" get different keys and cached results."""
+        cache = ResultCache(max_size=10)
+        cache.set("23x", {'result': "23 x"})
+
+        assert normalize_expression("2 3x") != normalize_expression("23x")
+        assert cache.get("2 3x") is None
+        assert cache.get(" 23x ") == {'result': "23 x"}
+
+
+class TestResultCache:
+
+    def test_get_miss_then_hit(self):
+        """Test hit and miss counting."""
+        cache = ResultCache(max_size=10)
+        response = {'operation': 'simplify', 'expression': 'x + x', 'result': '2 x'}
+
+        assert cache.get("x + x") is None
+        cache.set("x + x", response)
+
+        assert cache.get("x+x") == response
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0, 'size': 1}
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_size=2)
+        cache.set("a", {'result': 'a'})
+        cache.set("b", {'result': 'b'})
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", {'result': 'c'})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {'result': 'a'}
+        assert cache.get("c") == {'result': 'c'}
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self, clock):
+        """Test that entries expire after the TTL."""
+        cache = ResultCache(max_size=10, ttl=60, clock=clock)
+        cache.set("x", {'result': 'x'})
+
+        clock.now = 59
+        assert cache.get("x") == {'result': 'x'}
+
+        clock.now = 60
+        assert cache.get("x") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_allow_expired_returns_stale_entry(self, clock):
+        """Test that expired entries can still be served on request."""
+        cache = ResultCache(max_size=10, ttl=60, clock=clock)
+        cache.set("x", {'result': 'x'})
+
+        clock.now = 120
+
+        assert cache.get("x", allow_expired=True) == {'result': 'x'}
+        assert len(cache) == 1
+
+    def test_ttl_none_never_expires(self, clock):
+        """Test that a TTL of None disables expiry."""
+        cache = ResultCache(ttl=None, clock=clock)
+        cache.set("x", {'result': 'x'})
+
+        clock.now = 10 ** 9
+
+        assert cache.get("x") == {'result': 'x'}
+
+    def test_invalidate_and_clear(self):
+        """Test removing entries explicitly."""
+        cache = ResultCache()
+        cache.set("x", {'result': 'x'})
+        cache.set("y", {'result': 'y'})
+
+        cache.invalidate(" x ")
+        assert cache.get("x") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("kwargs,message", [
+        ({'max_size': 0}, "max_size must be greater than 0"),
+        ({'ttl': 0}, "ttl must be greater than 0"),
+    ])
+    def test_invalid_parameters(self, kwargs, message):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match=message):
+            ResultCache(**kwargs)
@@ -0,0 +1,127 @@
+"""
+Unit tests for the columnar, memory-mapped result store.
+"""
+
+import math
+import pytest
+from functools import partial
+from unittest.mock import patch
+from support.helpers.metrics import ClientMetrics
+from support.helpers.result_store import ResultStore, ResultStoreWriter, StoredResult
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+class TestResultStore:
+
+    def test_round_trip_across_chunks(self, tmp_path):
+        """Test that rows written over several chunks read back in order."""
+        # Setup
+        path = tmp_path / "results.nrs"
+        rows = [(f"{i}x + x", f"{i + 1} x", 200, i / 1000, None) for i in range(10)]
+
+        # Execute
+        with ResultStoreWriter(path, chunk_rows=4) as writer:
+            for row in rows:
+                writer.append(*row)
+
+        # Verify
+        with ResultStore(path) as store:
+            assert len(store) == 10
+            assert [len(chunk) for chunk in store.chunks] == [4, 4, 2]
+            assert list(store) == [StoredResult(*row) for row in rows]
+            assert store[5] == StoredResult(*rows[5])
+            assert store[-1].expression == "9x + x"
+            assert list(store.column('status')) == [200] * 10
+
+    def test_missing_values_and_unicode(self, tmp_path):
+        """Test failed rows, unknown latency and non-ASCII text."""
+        path = tmp_path / "results.nrs"
+        with ResultStoreWriter(path) as writer:
+            writer.append("x²", error="HTTP error 400: bad expression", status=400)
+            writer.append("y")
+
+        with ResultStore(path) as store:
+            failed, unknown = list(store)
+            assert failed == StoredResult("x²", None, 400, failed.latency, "HTTP error 400: bad expression")
+            assert math.isnan(failed.latency)
+            assert (unknown.result, unknown.status, unknown.error) == (None, 0, None)
+
+    def test_columns_are_views_of_the_file(self, tmp_path):
+        """Test that numeric columns are zero-copy memoryviews usable by numpy."""
+        np = pytest.importorskip('numpy')
+        path = tmp_path / "results.nrs"
+        with ResultStoreWriter(path) as writer:
+            for i in range(5):
+                writer.append("x", "x", 200, float(i))
+
+        with ResultStore(path) as store:
+            latency = store.chunks[0].latency
+            assert isinstance(latency, memoryview) and latency.format == 'd'
+            assert np.frombuffer(latency, dtype=np.float64).sum() == 10.0
+
+    def test_readable_while_appending(self, tmp_path):
+        """Test that flushed chunks are visible to readers during a run and appends resume the file."""
+        path = tmp_path / "results.nrs"
+        writer = ResultStoreWriter(path, chunk_rows=100)
+        writer.append("a", "a")
+        writer.flush()
+        writer.append("b", "b")
+
+        with ResultStore(path) as store:
+            assert [row.expression for row in store] == ["a"]
+
+        writer.close()
+        with ResultStoreWriter(path) as writer:
+            writer.append("c", "c")
+        with ResultStore(path) as store:
+            assert list(store.column('expression')) == ["a", "b", "c"]
+
+    def test_truncated_chunk_is_ignored(self, tmp_path):
+        """Test that a chunk cut short by a crash is skipped by readers and dropped by the next writer."""
+        path = tmp_path / "results.nrs"
+        with ResultStoreWriter(path, chunk_rows=1) as writer:
+            writer.append("a", "a")
+            writer.append("b", "b")
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with ResultStore(path) as store:
+            assert len(store) == 1
+        with ResultStoreWriter(path) as writer:
+            writer.append("c", "c")
+        with ResultStore(path) as store:
+            assert list(store.column('expression')) == ["a", "c"]
+
+    def test_invalid_file_and_arguments(self, tmp_path):
+        """Test validation of the file and constructor arguments."""
+        path = tmp_path / "results.jsonl"
+        path.write_text('{"line": 1}\n', encoding='utf-8')
+
+        with pytest.raises(ValueError, match="not a result store"):
+            ResultStore(path)
+        with pytest.raises(ValueError, match="not a result store"):
+            ResultStoreWriter(path)
+        with pytest.raises(ValueError, match="chunk_rows"):
+            ResultStoreWriter(tmp_path / "new.nrs", chunk_rows=0)
+
+
+class TestMetricsHook:
+
+    @patch('requests.Session.get')
+    def test_batch_results_stream_into_store(self, mock_get, tmp_path, echo_response):
+        """Test that a batch run writes one row per call through the metrics hook."""
+        # Setup
+        mock_get.side_effect = partial(echo_response, transform=str.upper)
+        path = tmp_path / "results.nrs"
+
+        # Execute
+        with ResultStoreWriter(path) as writer:
+            metrics = ClientMetrics()
+            metrics.add_hook(writer.observe)
+            SimplificationAPI(metrics=metrics).simplify_batch([f"{i}x" for i in range(20)], max_workers=4)
+
+        # Verify
+        with ResultStore(path) as store:
+            rows = sorted(store, key=lambda row: int(row.expression[:-1]))
+            assert [(row.expression, row.result, row.status) for row in rows] == \
+                [(f"{i}x", f"{i}X", 200) for i in range(20)]
+            assert all(row.latency >= 0 for row in rows)
@@ -0,0 +1,127 @@
+"""
+Unit tests for RetryPolicy, RetryBudget and Retry-After parsing.
+"""
+
+import random
+from datetime import datetime, timezone
+import pytest
+import requests
+from support.helpers.retry_policy import RetryPolicy, RetryBudget, parse_retry_after
+
+
+class TestParseRetryAfter:
+
+    def test_delay_seconds(self):
+        """Test the delay-seconds form."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        """Test the HTTP-date form relative to now."""
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now=now) == 30.0
+        assert parse_retry_after("Mon, 01 Jan 2024 11:00:00 GMT", now=now) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5"])
+    def test_invalid_values(self, value):
+        """Test that missing or malformed values are ignored."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryBudget:
+
+    def test_withdraw_until_empty(self):
+        """Test that the starting balance is the burst allowance."""
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+
+        assert budget.withdraw() and budget.withdraw()
+        assert not budget.withdraw()
+
+    def test_deposits_refill_up_to_max(self):
+        """Test that requests refill the budget by ratio, capped at max_tokens."""
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        budget.withdraw()
+        budget.withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        for _ in range(10):
+            budget.deposit()
+
+        assert budget.tokens == 2
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="ratio must be non-negative"):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ValueError, match="max_tokens must be at least 1"):
+            RetryBudget(max_tokens=0)
+
+
+class TestRetryPolicy:
+
+    def test_retryable_errors(self):
+        """Test the default retryable statuses and exception classes."""
+        policy = RetryPolicy()
+        http_error = requests.exceptions.HTTPError("error")
+
+        assert policy.is_retryable(http_error, 503)
+        assert policy.is_retryable(http_error, 429)
+        assert not policy.is_retryable(http_error, 404)
+        assert policy.is_retryable(requests.exceptions.Timeout("slow"))
+        assert policy.is_retryable(requests.exceptions.ConnectionError("refused"))
+        assert not policy.is_retryable(requests.exceptions.InvalidURL("bad"))
+
+    def test_backoff_is_capped_full_jitter(self):
+        """Test that backoff stays within the exponential ceiling and backoff_max."""
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=1.0, rng=random.Random(1))
+
+        for attempt, ceiling in [(1, 0.1), (2, 0.2), (3, 0.4), (10, 1.0)]:
+            delays = [policy.backoff(attempt) for _ in range(200)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert max(delays) > ceiling / 2
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that no delay is returned for the last attempt."""
+        policy = RetryPolicy(max_attempts=2)
+        error = requests.exceptions.Timeout("slow")
+
+        assert policy.retry_delay(1, error) is not None
+        assert policy.retry_delay(2, error) is None
+
+    def test_long_retry_after_gives_up(self):
+        """Test that a Retry-After beyond max_retry_after is not waited out."""
+        policy = RetryPolicy(max_retry_after=5)
+        error = requests.exceptions.HTTPError("429")
+
+        assert policy.retry_delay(1, error, 429, retry_after="3") == 3.0
+        assert policy.retry_delay(1, error, 429, retry_after="30") is None
+
+    def test_budget_exhaustion_is_counted(self):
+        """Test that retries stop when the shared budget is empty."""
+        policy = RetryPolicy(max_attempts=10, budget=RetryBudget(ratio=0.0, max_tokens=1))
+        error = requests.exceptions.ConnectionError("refused")
+
+        assert policy.retry_delay(1, error) is not None
+        assert policy.retry_delay(2, error) is None
+        assert policy.stats()['budget_exhausted'] == 1
+
+    def test_stats(self):
+        """Test the attempts-per-request metrics."""
+        policy = RetryPolicy()
+        for attempts in (1, 1, 1, 3):
+            policy.record_attempts(attempts)
+
+        stats = policy.stats()
+
+        assert stats['requests'] == 4
+        assert stats['attempts'] == 6
+        assert stats['mean_attempts'] == 1.5
+        assert stats['attempts_per_request'] == {1: 3, 3: 1}
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError, match="must be non-negative"):
+            RetryPolicy(backoff_base=-1)
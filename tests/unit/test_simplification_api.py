@@ -1,160 +1,553 @@
-"""
-Unit tests for SimplificationAPI class.
-Tests all methods with mocked HTTP responses.
-"""
-
-import pytest
-import requests
-from unittest.mock import Mock, patch, MagicMock
-from support.page_objects.api.simplification_api import SimplificationAPI
-
-
-class TestSimplificationAPI:
-    
-    def test_initialization(self):
-        """Test that SimplificationAPI initializes correctly."""
-        api = SimplificationAPI()
-        assert api.api_helper is not None
-        assert api.expression_generator is not None
-    
-    @patch('support.page_objects.api.simplification_api.requests.get')
-    def test_simplify_generated_expression_success(self, mock_get, mock_successful_response):
-        """Test successful simplification of generated expression."""
-        # Setup
-        mock_get.return_value = mock_successful_response
-        api = SimplificationAPI()
-        
-        # Execute
-        result = api.simplify_generated_expression(num_terms=2, min_value=1, max_value=5)
-        
-        # Verify
-        assert 'original_expression' in result
-        assert 'response' in result
-        assert result['response']['operation'] == 'simplify'
-        mock_get.assert_called_once()
-    
-    @patch('support.page_objects.api.simplification_api.requests.get')
-    def test_simplify_custom_expression_success(self, mock_get, mock_successful_response):
-        """Test successful simplification of custom expression."""
-        # Setup
-        mock_get.return_value = mock_successful_response
-        api = SimplificationAPI()
-        expression = "x^2 + 2x + 1"
-        
-        # Execute
-        result = api.simplify_custom_expression(expression)
-        
-        # Verify
-        assert result['original_expression'] == expression
-        assert 'response' in result
-        assert result['response']['operation'] == 'simplify'
-        mock_get.assert_called_once()
-    
-    def test_simplify_generated_expression_invalid_params(self):
-        """Test parameter validation for generated expression."""
-        api = SimplificationAPI()
-        
-        # Test num_terms <= 0
-        with pytest.raises(ValueError, match="num_terms must be greater than 0"):
-            api.simplify_generated_expression(num_terms=0)
-        
-        # Test min_value >= max_value
-        with pytest.raises(ValueError, match="min_value must be less than max_value"):
-            api.simplify_generated_expression(min_value=10, max_value=5)
-        
-        # Test negative values
-        with pytest.raises(ValueError, match="min_value and max_value must be non-negative"):
-            api.simplify_generated_expression(min_value=-1, max_value=5)
-    
-    def test_simplify_custom_expression_invalid_input(self):
-        """Test validation for custom expression input."""
-        api = SimplificationAPI()
-        
-        # Test None expression
-        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
-            api.simplify_custom_expression(None)
-        
-        # Test empty expression
-        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
-            api.simplify_custom_expression("")
-        
-        # Test whitespace-only expression
-        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
-            api.simplify_custom_expression("   ")
-    
-    @patch('support.page_objects.api.simplification_api.requests.get')
-    def test_http_error_handling(self, mock_get):
-        """Test handling of HTTP errors."""
-        # Setup
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
-        
-        api = SimplificationAPI()
-        
-        # Execute & Verify
-        with pytest.raises(requests.RequestException, match="HTTP error 404"):
-            api.simplify_custom_expression("x + 1")
-    
-    @patch('support.page_objects.api.simplification_api.requests.get')
-    def test_timeout_error_handling(self, mock_get):
-        """Test handling of timeout errors."""
-        # Setup
-        mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
-        api = SimplificationAPI()
-        
-        # Execute & Verify
-        with pytest.raises(requests.RequestException, match="Request timed out"):
-            api.simplify_custom_expression("x + 1")
-    
-    @patch('support.page_objects.api.simplification_api.requests.get')
-    def test_connection_error_handling(self, mock_get):
-        """Test handling of connection errors."""
-        # Setup
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
-        api = SimplificationAPI()
-        
-        # Execute & Verify
-        with pytest.raises(requests.RequestException, match="Connection failed"):
-            api.simplify_custom_expression("x + 1")
-    
-    @pytest.mark.parametrize("expression,expected_cleaned", [
-        ("  x^2 + 1  ", "x^2 + 1"),
-        ("\tx + 1\n", "x + 1"),
-        ("2x^2 + 3x + 1", "2x^2 + 3x + 1"),
-    ])
-    def test_expression_cleaning(self, expression, expected_cleaned):
-        """Test that expressions are properly cleaned of whitespace."""
-        api = SimplificationAPI()
-        
-        with patch('support.page_objects.api.simplification_api.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {'operation': 'simplify', 'expression': expected_cleaned, 'result': expected_cleaned}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            result = api.simplify_custom_expression(expression)
-            assert result['original_expression'] == expected_cleaned
-    
-    @pytest.mark.parametrize("num_terms,min_val,max_val", [
-        (1, 1, 5),
-        (3, 1, 10),
-        (5, 0, 20),
-        (2, 5, 15),
-    ])
-    def test_generated_expression_parameters(self, num_terms, min_val, max_val):
-        """Test different parameter combinations for generated expressions."""
-        api = SimplificationAPI()
-        
-        with patch('support.page_objects.api.simplification_api.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {'operation': 'simplify', 'expression': 'test', 'result': 'test'}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            result = api.simplify_generated_expression(num_terms=num_terms, min_value=min_val, max_value=max_val)
-            assert 'original_expression' in result
-            assert 'response' in result
+"""
+Unit tests for SimplificationAPI class.
+Tests all methods with mocked HTTP responses.
+"""
+
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch, MagicMock
+from support.page_objects.api.simplification_api import SimplificationAPI
+from support.helpers.result_cache import ResultCache
+from support.helpers.retry_policy import RetryPolicy, RetryBudget
+from support.helpers.circuit_breaker import CircuitBreaker
+from support.helpers.rate_limiter import TokenBucket, AdaptiveConcurrencyLimiter
+
+
+class TestSimplificationAPI:
+    
+    def test_initialization(self):
+        """Test that SimplificationAPI initializes correctly."""
+        api = SimplificationAPI()
+        assert api.api_helper is not None
+        assert api.expression_generator is not None
+    
+    @patch('requests.Session.get')
+    def test_simplify_generated_expression_success(self, mock_get, mock_successful_response):
+        """Test successful simplification of generated expression."""
+        # Setup
+        mock_get.return_value = mock_successful_response
+        api = SimplificationAPI()
+        
+        # Execute
+        result = api.simplify_generated_expression(num_terms=2, min_value=1, max_value=5)
+        
+        # Verify
+        assert 'original_expression' in result
+        assert 'response' in result
+        assert result['response']['operation'] == 'simplify'
+        mock_get.assert_called_once()
+    
+    @patch('requests.Session.get')
+    def test_simplify_custom_expression_success(self, mock_get, mock_successful_response):
+        """Test successful simplification of custom expression."""
+        # Setup
+        mock_get.return_value = mock_successful_response
+        api = SimplificationAPI()
+        expression = "x^2 + 2x + 1"
+        
+        # Execute
+        result = api.simplify_custom_expression(expression)
+        
+        # Verify
+        assert result['original_expression'] == expression
+        assert 'response' in result
+        assert result['response']['operation'] == 'simplify'
+        mock_get.assert_called_once()
+    
+    def test_simplify_generated_expression_invalid_params(self):
+        """Test parameter validation for generated expression."""
+        api = SimplificationAPI()
+        
+        # Test num_terms <= 0
+        with pytest.raises(ValueError, match="num_terms must be greater than 0"):
+            api.simplify_generated_expression(num_terms=0)
+        
+        # Test min_value >= max_value
+        with pytest.raises(ValueError, match="min_value must be less than max_value"):
+            api.simplify_generated_expression(min_value=10, max_value=5)
+        
+        # Test negative values
+        with pytest.raises(ValueError, match="min_value and max_value must be non-negative"):
+            api.simplify_generated_expression(min_value=-1, max_value=5)
+    
+    def test_simplify_custom_expression_invalid_input(self):
+        """Test validation for custom expression input."""
+        api = SimplificationAPI()
+        
+        # Test None expression
+        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
+            api.simplify_custom_expression(None)
+        
+        # Test empty expression
+        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
+            api.simplify_custom_expression("")
+        
+        # Test whitespace-only expression
+        with pytest.raises(ValueError, match="Expression cannot be None or empty"):
+            api.simplify_custom_expression("   ")
+    
+    @patch('requests.Session.get')
+    def test_http_error_handling(self, mock_get):
+        """Test handling of HTTP errors."""
+        # Setup
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+        
+        api = SimplificationAPI()
+        
+        # Execute & Verify
+        with pytest.raises(requests.RequestException, match="HTTP error 404"):
+            api.simplify_custom_expression("x + 1")
+    
+    @patch('requests.Session.get')
+    def test_timeout_error_handling(self, mock_get):
+        """Test handling of timeout errors."""
+        # Setup
+        mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
+        api = SimplificationAPI()
+        
+        # Execute & Verify
+        with pytest.raises(requests.RequestException, match="Request timed out"):
+            api.simplify_custom_expression("x + 1")
+    
+    @patch('requests.Session.get')
+    def test_connection_error_handling(self, mock_get):
+        """Test handling of connection errors."""
+        # Setup
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        api = SimplificationAPI()
+        
+        # Execute & Verify
+        with pytest.raises(requests.RequestException, match="Connection failed"):
+            api.simplify_custom_expression("x + 1")
+    
+    @pytest.mark.parametrize("expression,expected_cleaned", [
+        ("  x^2 + 1  ", "x^2 + 1"),
+        ("\tx + 1\n", "x + 1"),
+        ("2x^2 + 3x + 1", "2x^2 + 3x + 1"),
+    ])
+    def test_expression_cleaning(self, expression, expected_cleaned):
+        """Test that expressions are properly cleaned of whitespace."""
+        api = SimplificationAPI()
+        
+        with patch('requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'operation': 'simplify', 'expression': expected_cleaned, 'result': expected_cleaned}
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+            
+            result = api.simplify_custom_expression(expression)
+            assert result['original_expression'] == expected_cleaned
+    
+    @pytest.mark.parametrize("num_terms,min_val,max_val", [
+        (1, 1, 5),
+        (3, 1, 10),
+        (5, 0, 20),
+        (2, 5, 15),
+    ])
+    def test_generated_expression_parameters(self, num_terms, min_val, max_val):
+        """Test different parameter combinations for generated expressions."""
+        api = SimplificationAPI()
+        
+        with patch('requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'operation': 'simplify', 'expression': 'test', 'result': 'test'}
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+            
+            result = api.simplify_generated_expression(num_terms=num_terms, min_value=min_val, max_value=max_val)
+            assert 'original_expression' in result
+            assert 'response' in result
+    
+    def test_session_uses_configured_pool(self):
+        """Test that the session mounts a pooled adapter with the requested size."""
+        api = SimplificationAPI(pool_size=25, pool_block=True)
+        
+        adapter = api.session.get_adapter("https://newton.vercel.app/api/v2/simplify/x")
+        
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
+        assert api.session.headers['Connection'] == 'keep-alive'
+    
+    def test_keep_alive_disabled_sends_connection_close(self):
+        """Test that disabling keep-alive asks the server to close connections."""
+        api = SimplificationAPI(keep_alive=False)
+        
+        assert api.session.headers['Connection'] == 'close'
+    
+    def test_invalid_pool_size(self):
+        """Test that a non-positive pool size is rejected."""
+        with pytest.raises(ValueError, match="pool_size must be greater than 0"):
+            SimplificationAPI(pool_size=0)
+    
+    def test_base_url_override(self):
+        """Test that requests are sent to an overridden base URL."""
+        api = SimplificationAPI(base_url="http://127.0.0.1:8080/api/")
+        
+        with patch.object(api.session, 'get') as mock_get:
+            mock_response = Mock()
+            mock_response.json.return_value = {'operation': 'simplify', 'expression': 'x', 'result': 'x'}
+            mock_get.return_value = mock_response
+            
+            api.simplify_custom_expression("x")
+            
+            assert mock_get.call_args[0][0] == "http://127.0.0.1:8080/api/v2/simplify/x"
+    
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the owned session."""
+        api = SimplificationAPI()
+        with patch.object(api.session, 'close') as mock_close:
+            with api:
+                pass
+            mock_close.assert_called_once()
+    
+    def test_close_leaves_external_session_open(self):
+        """Test that a caller-provided session is not closed by the client."""
+        session = MagicMock(spec=requests.Session)
+        api = SimplificationAPI(session=session)
+        
+        with patch('support.page_objects.api.simplification_api.logger') as mock_logger:
+            api.close()
+        
+        assert api.session is session
+        session.close.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+
+class TestSimplificationAPIBatch:
+    
+    @patch('requests.Session.get')
+    def test_simplify_batch_keeps_input_order(self, mock_get, echo_response):
+        """Test that batch results come back in input order."""
+        def delayed_response(url, **kwargs):
+            # Earlier items finish last
+            time.sleep(0.001 * (20 - int(url.rsplit('/', 1)[-1])))
+            return echo_response(url, **kwargs)
+        mock_get.side_effect = delayed_response
+        api = SimplificationAPI()
+        expressions = [str(i) for i in range(20)]
+        
+        results = api.simplify_batch(expressions, max_workers=5)
+        
+        assert [r['original_expression'] for r in results] == expressions
+        assert mock_get.call_count == 20
+    
+    @patch('requests.Session.get')
+    def test_simplify_batch_collects_errors(self, mock_get, echo_response):
+        """Test that per-item failures are reported without aborting the batch."""
+        def flaky_response(url, **kwargs):
+            if url.endswith('/bad'):
+                raise requests.exceptions.ConnectionError("Connection refused")
+            return echo_response(url, **kwargs)
+        mock_get.side_effect = flaky_response
+        api = SimplificationAPI()
+        
+        results = api.simplify_batch(['x', 'bad', '', 'y'], max_workers=2)
+        
+        assert results[0]['response']['result'] == 'x'
+        assert isinstance(results[1]['error'], requests.RequestException)
+        assert "Connection failed" in str(results[1]['error'])
+        assert isinstance(results[2]['error'], ValueError)
+        assert results[3]['response']['result'] == 'y'
+    
+    @patch('requests.Session.get')
+    def test_simplify_batch_runs_concurrently(self, mock_get, echo_response):
+        """Test that requests are fanned out over several threads."""
+        barrier = threading.Barrier(4, timeout=5)
+        def blocking_response(url, **kwargs):
+            # Only passes once four requests are in flight at the same time
+            barrier.wait()
+            return echo_response(url, **kwargs)
+        mock_get.side_effect = blocking_response
+        api = SimplificationAPI()
+        
+        results = api.simplify_batch(['a', 'b', 'c', 'd'], max_workers=4)
+        
+        assert all('response' in r for r in results)
+    
+    @patch('requests.Session.get')
+    def test_simplify_batch_unordered_streams_all_results(self, mock_get, echo_response):
+        """Test that the unordered variant yields every result lazily."""
+        mock_get.side_effect = echo_response
+        api = SimplificationAPI()
+        expressions = (f"{i}x" for i in range(50))
+        
+        results = api.simplify_batch_unordered(expressions, max_workers=3)
+        
+        assert not isinstance(results, list)
+        assert sorted(r['original_expression'] for r in results) == sorted(f"{i}x" for i in range(50))
+    
+    @patch('requests.Session.get')
+    def test_simplify_stream_yields_in_input_order(self, mock_get, echo_response):
+        """Test that the streaming variant keeps input order."""
+        mock_get.side_effect = echo_response
+        api = SimplificationAPI()
+        expressions = (f"{i}x" for i in range(50))
+        
+        results = api.simplify_stream(expressions, max_workers=3)
+        
+        assert not isinstance(results, list)
+        assert [r['original_expression'] for r in results] == [f"{i}x" for i in range(50)]
+    
+    def test_simplify_batch_invalid_max_workers(self):
+        """Test that a non-positive max_workers is rejected."""
+        api = SimplificationAPI()
+        
+        with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+            api.simplify_batch(['x'], max_workers=0)
+        with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+            api.simplify_batch_unordered(['x'], max_workers=-1)
+
+
+class TestSimplificationAPICache:
+    
+    @patch('requests.Session.get')
+    def test_repeated_expression_served_from_cache(self, mock_get, echo_response):
+        """Test that a repeated expression only reaches the network once."""
+        mock_get.side_effect = echo_response
+        cache = ResultCache()
+        api = SimplificationAPI(cache=cache)
+        
+        first = api.simplify_custom_expression("2x + 4")
+        second = api.simplify_custom_expression("2x+4")
+        
+        assert mock_get.call_count == 1
+        assert second['original_expression'] == "2x+4"
+        assert second['response']['expression'] == "2x+4"
+        assert second['response']['result'] == first['response']['result']
+        assert cache.stats()['hits'] == 1
+    
+    @patch('requests.Session.get')
+    def test_cached_response_is_not_shared(self, mock_get, echo_response):
+        """Test that mutating a returned response does not corrupt the cache."""
+        mock_get.side_effect = echo_response
+        api = SimplificationAPI(cache=ResultCache())
+        
+        api.simplify_custom_expression("x")['response']['result'] = 'changed'
+        
+        assert api.simplify_custom_expression("x")['response']['result'] == 'x'
+    
+    @patch('requests.Session.get')
+    def test_use_cache_false_bypasses_cache(self, mock_get, echo_response):
+        """Test that callers can bypass the cache per call."""
+        mock_get.side_effect = echo_response
+        cache = ResultCache()
+        api = SimplificationAPI(cache=cache)
+        api.simplify_custom_expression("x")
+        
+        api.simplify_custom_expression("x", use_cache=False)
+        
+        assert mock_get.call_count == 2
+        assert cache.stats()['hits'] == 0
+    
+    @patch('requests.Session.get')
+    def test_failures_are_not_cached(self, mock_get):
+        """Test that errors are not stored in the cache."""
+        mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
+        cache = ResultCache()
+        api = SimplificationAPI(cache=cache)
+        
+        with pytest.raises(requests.RequestException):
+            api.simplify_custom_expression("x")
+        
+        assert len(cache) == 0
+
+
+
+def error_response(status_code, retry_after=None):
+    """Build a mock response that fails with the given HTTP status."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {'Retry-After': retry_after} if retry_after is not None else {}
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    return mock_response
+
+
+class TestSimplificationAPIRetry:
+    
+    @patch('requests.Session.get')
+    def test_retries_transient_errors(self, mock_get, echo_response):
+        """Test that 503 responses and timeouts are retried until success."""
+        # Setup
+        sleeps = []
+        mock_get.side_effect = [error_response(503), requests.exceptions.Timeout("slow"),
+                                echo_response("https://host/x")]
+        policy = RetryPolicy(max_attempts=3, sleep=sleeps.append)
+        api = SimplificationAPI(retry_policy=policy)
+        
+        # Execute
+        result = api.simplify_custom_expression("x")
+        
+        # Verify
+        assert result['response']['result'] == "x"
+        assert mock_get.call_count == 3
+        assert len(sleeps) == 2
+        assert policy.stats()['attempts_per_request'] == {3: 1}
+    
+    @patch('requests.Session.get')
+    def test_honors_retry_after(self, mock_get, echo_response):
+        """Test that the Retry-After delay replaces the backoff."""
+        sleeps = []
+        mock_get.side_effect = [error_response(429, retry_after="2"), echo_response("https://host/x")]
+        api = SimplificationAPI(retry_policy=RetryPolicy(sleep=sleeps.append))
+        
+        api.simplify_custom_expression("x")
+        
+        assert sleeps == [2.0]
+    
+    @patch('requests.Session.get')
+    def test_client_errors_are_not_retried(self, mock_get):
+        """Test that a 404 fails on the first attempt with the usual message."""
+        mock_get.return_value = error_response(404)
+        policy = RetryPolicy(sleep=lambda delay: None)
+        api = SimplificationAPI(retry_policy=policy)
+        
+        with pytest.raises(requests.RequestException, match="HTTP error 404"):
+            api.simplify_custom_expression("x")
+        
+        mock_get.assert_called_once()
+        assert policy.stats()['retries'] == 0
+    
+    @patch('requests.Session.get')
+    def test_gives_up_after_max_attempts(self, mock_get):
+        """Test that the last error is raised once attempts are used up."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("refused")
+        api = SimplificationAPI(retry_policy=RetryPolicy(max_attempts=4, sleep=lambda delay: None))
+        
+        with pytest.raises(requests.RequestException, match="Connection failed"):
+            api.simplify_custom_expression("x")
+        
+        assert mock_get.call_count == 4
+    
+    @patch('requests.Session.get')
+    def test_budget_limits_retries_in_batch(self, mock_get):
+        """Test that an outage consumes the retry budget instead of multiplying load."""
+        # Setup
+        mock_get.side_effect = lambda url, **kwargs: error_response(503)
+        policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0.0, max_tokens=3),
+                             sleep=lambda delay: None)
+        api = SimplificationAPI(retry_policy=policy)
+        
+        # Execute
+        results = api.simplify_batch([f"x + {i}" for i in range(20)], max_workers=4)
+        
+        # Verify
+        assert all('error' in result for result in results)
+        assert mock_get.call_count == 23
+        assert policy.stats()['budget_exhausted'] > 0
+
+
+class TestSimplificationAPICircuitBreaker:
+    
+    @patch('requests.Session.get')
+    def test_fails_fast_while_open(self, mock_get):
+        """Test that requests stop reaching the API once the circuit opens."""
+        # Setup
+        mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
+        breaker = CircuitBreaker(window_size=4, minimum_calls=4)
+        api = SimplificationAPI(circuit_breaker=breaker)
+        
+        # Execute
+        results = api.simplify_batch([f"x + {i}" for i in range(10)], max_workers=1)
+        
+        # Verify
+        assert mock_get.call_count == 4
+        assert breaker.state == 'open'
+        assert all(str(result['error']).startswith("Circuit open") for result in results[4:])
+    
+    @patch('requests.Session.get')
+    def test_serves_stale_cache_while_open(self, mock_get, echo_response):
+        """Test that cached responses are served while the circuit is open, even with use_cache=False."""
+        # Setup
+        mock_get.side_effect = echo_response
+        cache = ResultCache()
+        breaker = CircuitBreaker(window_size=1, minimum_calls=1)
+        api = SimplificationAPI(cache=cache, circuit_breaker=breaker)
+        api.simplify_custom_expression("x")
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+        with pytest.raises(requests.RequestException, match="Connection failed"):
+            api.simplify_custom_expression("y")
+        
+        # Execute
+        result = api.simplify_custom_expression("x", use_cache=False)
+        
+        # Verify
+        assert result['response']['result'] == "x"
+        with pytest.raises(requests.RequestException, match="Circuit open"):
+            api.simplify_custom_expression("y")
+    
+    @patch('requests.Session.get')
+    def test_client_errors_do_not_open_circuit(self, mock_get):
+        """Test that 4xx responses for bad expressions are not counted as outages."""
+        mock_response = Mock()
+        mock_response.status_code = 400
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "400 Bad Request", response=mock_response)
+        mock_get.return_value = mock_response
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        api = SimplificationAPI(circuit_breaker=breaker)
+        
+        for _ in range(3):
+            with pytest.raises(requests.RequestException, match="HTTP error 400"):
+                api.simplify_custom_expression("x")
+        
+        assert breaker.state == 'closed'
+
+
+class TestSimplificationAPILimiters:
+    
+    @patch('requests.Session.get')
+    def test_rate_limiter_paces_every_attempt(self, mock_get, echo_response):
+        """Test that retries also take a token from the rate limiter."""
+        mock_get.side_effect = [error_response(503), echo_response("https://host/x")]
+        bucket = TokenBucket(rate=100, sleep=lambda seconds: None)
+        api = SimplificationAPI(rate_limiter=bucket, retry_policy=RetryPolicy(sleep=lambda delay: None))
+        
+        api.simplify_custom_expression("x")
+        
+        assert bucket.stats()['acquired'] == 2
+    
+    @patch('requests.Session.get')
+    def test_throttling_shrinks_concurrency_limit(self, mock_get, echo_response):
+        """Test that 429 responses cut the limit and healthy responses grow it back."""
+        # Setup
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=None)
+        api = SimplificationAPI(concurrency_limiter=limiter)
+        mock_get.side_effect = lambda url, **kwargs: error_response(429)
+        
+        # Execute
+        with pytest.raises(requests.RequestException, match="HTTP error 429"):
+            api.simplify_custom_expression("x")
+        throttled_limit = limiter.limit
+        mock_get.side_effect = echo_response
+        api.simplify_batch([f"x + {i}" for i in range(50)], max_workers=8)
+        
+        # Verify
+        assert throttled_limit == 4
+        assert limiter.limit > throttled_limit
+        assert limiter.stats()['in_flight'] == 0
+    
+    @patch('requests.Session.get')
+    def test_concurrency_limit_bounds_batch(self, mock_get, echo_response):
+        """Test that the batch never exceeds the adaptive limit of in-flight requests."""
+        # Setup
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        api = SimplificationAPI(concurrency_limiter=limiter)
+        
+        def slow_echo(url, **kwargs):
+            time.sleep(0.01)
+            return echo_response(url)
+        mock_get.side_effect = slow_echo
+        
+        # Execute
+        results = api.simplify_batch([f"x + {i}" for i in range(20)], max_workers=8)
+        
+        # Verify
+        assert len(results) == 20
+        assert limiter.stats()['peak_in_flight'] == 2
\ No newline at end of file
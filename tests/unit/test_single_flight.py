@@ -0,0 +1,140 @@
+"""
+Unit tests for SingleFlight and AsyncSingleFlight.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from support.helpers.single_flight import SingleFlight, AsyncSingleFlight
+from support.page_objects.api.simplification_api import SimplificationAPI
+
+
+class TestSingleFlight:
+
+    def test_concurrent_callers_share_one_execution(self):
+        """Test that callers arriving while a call is in flight reuse its result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {'result': 'x'}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('x', slow_call))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        # Wait until every follower is queued behind the leader
+        while flight.stats()['coalesced'] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert all(result == {'result': 'x'} for result, _ in results)
+        assert flight.stats() == {'executed': 1, 'coalesced': 4, 'in_flight': 0}
+
+    def test_error_is_shared_with_waiters(self):
+        """Test that every waiting caller receives the leader's exception."""
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def failing_call():
+            release.wait(timeout=5)
+            raise RuntimeError("upstream failed")
+
+        def caller():
+            try:
+                flight.do('x', failing_call)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()['coalesced'] < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call does not satisfy later callers."""
+        flight = SingleFlight()
+        fn = Mock(return_value='x')
+
+        flight.do('x', fn)
+        flight.do('x', fn)
+
+        assert fn.call_count == 2
+        assert flight.coalesced == 0
+
+
+class TestAsyncSingleFlight:
+
+    def test_concurrent_callers_share_one_execution(self):
+        """Test coalescing of concurrent coroutines."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow_call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'x'
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do('x', slow_call) for _ in range(10)))
+
+        results = asyncio.run(scenario())
+
+        assert len(calls) == 1
+        assert [result for result, _ in results] == ['x'] * 10
+        assert flight.stats() == {'executed': 1, 'coalesced': 9, 'in_flight': 0}
+
+    def test_error_is_shared_with_waiters(self):
+        """Test that every waiting coroutine receives the leader's exception."""
+        flight = AsyncSingleFlight()
+
+        async def failing_call():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do('x', failing_call) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestSimplificationAPICoalescing:
+
+    @patch('requests.Session.get')
+    def test_batch_duplicates_share_requests(self, mock_get):
+        """Test that duplicate expressions in a concurrent batch reach the network once."""
+        def slow_response(url, **kwargs):
+            time.sleep(0.05)
+            expression = url.rsplit('/', 1)[-1]
+            mock_response = Mock()
+            mock_response.json.return_value = {'operation': 'simplify', 'expression': expression, 'result': '2 x'}
+            return mock_response
+        mock_get.side_effect = slow_response
+        flight = SingleFlight()
+        api = SimplificationAPI(single_flight=flight)
+
+        results = api.simplify_batch(["x + x", "x+x", " x + x", "x + x"], max_workers=4)
+
+        assert mock_get.call_count == 1
+        assert flight.coalesced == 3
+        assert [r['original_expression'] for r in results] == ["x + x", "x+x", "x + x", "x + x"]
+        assert results[1]['response']['expression'] == "x+x"
+        assert all(r['response']['result'] == '2 x' for r in results)